@@ -1,9 +1,11 @@
 import time
 import timeit
 import logging
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from bs_code.utilities import logger_config
 import bs_code.parameters as param
-from bs_code.utilities import pre_processing, load, write, helpers
+from bs_code.utilities import pre_processing, processing, write, helpers
+from bs_code.utilities import cross_checks
 from bs_code.utilities import tables, charts, csvs, validations, dashboards
 import bs_code.utilities.publication_files as publication
 import xlwings as xw
@@ -25,6 +27,8 @@ def main():
     # Load run parameters
     run_validations_kc63 = param.VALIDATIONS_KC63
     run_validations_kc62 = param.VALIDATIONS_KC62
+    run_anomalies_kc63 = param.ANOMALIES_KC63
+    run_anomalies_kc62 = param.ANOMALIES_KC62
     run_tables_kc63 = param.TABLES_KC63
     run_tables_kc62 = param.TABLES_KC62
     run_charts_kc63 = param.CHARTS_KC63
@@ -32,116 +36,190 @@ def main():
     run_csvs_kc63 = param.CSVS_KC63
     run_csvs_kc62 = param.CSVS_KC62
     run_report_tables_kc62 = param.REPORT_TABLES_KC62
+    run_cross_checks = param.CROSS_CHECKS
     run_dashboards = param.DASHBOARDS
     run_pub_outputs = param.RUN_PUBLICATION_OUTPUTS
 
-    # Check which datasets need to be imported depending on the run flags
-    if run_validations_kc63 | run_tables_kc63 | run_csvs_kc63 | run_charts_kc63 | run_dashboards:
+    # Check which datasets need to be imported depending on the run flags.
+    # The KC63 and KC62 data are imported and pre-processed at the same time,
+    # and the outputs for each collection start as soon as its data is ready.
+    loading = ThreadPoolExecutor(max_workers=2)
+    kc63_data = None
+    kc62_data = None
+
+    # Where set in parameters, the data is held on disk in one partition per
+    # collection and year rather than in memory
+    if param.OUT_OF_CORE:
+        import_data = pre_processing.import_and_partition_data
+    else:
+        import_data = pre_processing.import_and_update_data
+
+    if run_validations_kc63 | run_anomalies_kc63 | run_tables_kc63 | run_csvs_kc63 | run_charts_kc63 | run_dashboards:
         # Import the KC63 data (latest year and total no. of years as per parameters)
+        # and apply pre-processing updates
         year_range = helpers.get_year_range(year, param.TS_YEARS_KC63)
-        df_kc63 = load.import_asset_data("KC63", year_range)
-        # Apply pre-processing updates
-        df_kc63 = pre_processing.update_kc63_data(df_kc63)
+        kc63_data = loading.submit(import_data, "KC63", year_range)
 
-    if run_validations_kc62 | run_tables_kc62 | run_csvs_kc62 | run_charts_kc62 | run_report_tables_kc62 | run_dashboards:
+    if run_validations_kc62 | run_anomalies_kc62 | run_tables_kc62 | run_csvs_kc62 | run_charts_kc62 | run_report_tables_kc62 | run_dashboards:
         # Import the KC62 data (latest year and total no. of years as per parameters)
+        # and apply pre-processing updates
         year_range = helpers.get_year_range(year, param.TS_YEARS_KC62)
-        df_kc62 = load.import_asset_data("KC62", year_range)
-        # Apply pre-processing updates
-        df_kc62 = pre_processing.update_kc62_data(df_kc62)
-
-    # Run each part of the pipeline as per the run flags
-
-    if run_validations_kc63:
-        # Run the KC63 validation tables as defined by the items in get_validations_kc63
-        all_validations = validations.get_validations_kc63()
-        write.write_outputs(df_kc63, all_validations, validations_kc63)
-        # Save the Excel validation file with the updated data and close Excel
-        wb = xw.Book(validations_kc63)
-        wb.save()
-        xw.apps.active.api.Quit()
-
-    if run_validations_kc62:
-        # Run the KC63 validation tables as defined by the items in get_validations_kc63
-        all_validations = validations.get_validations_kc62()
-        write.write_outputs(df_kc62, all_validations, validations_kc62)
-        # Save the Excel validation file with the updated data and close Excel
-        wb = xw.Book(validations_kc62)
-        wb.save()
-        xw.apps.active.api.Quit()
-
-    if run_tables_kc63:
-        # Run the KC63 tables as defined by the items in get_tables_kc63
-        all_tables = tables.get_tables_kc63()
-        write.write_outputs(df_kc63, all_tables, tables_template)
-
-        # Add the Table 11 LA footnote references.
-        write.add_footnote_refs("Table 11",  "B21", "B")
-
-    if run_tables_kc62:
-        # Run the KC62 tables as defined by the items in get_tables_kc62
-        all_tables = tables.get_tables_kc62()
-        write.write_outputs(df_kc62, all_tables, tables_template)
-
-        # Add the Table 12 BSU footnote references.
-        write.add_footnote_refs("Table 12", "A23", "A", "B")
-
-    # If any tables were updated
-    if run_tables_kc63 | run_tables_kc62:
-        # Save the Excel master tables with the updated data and close Excel
-        wb = xw.Book(tables_template)
-        wb.save()
-        xw.apps.active.api.Quit()
-
-    if run_csvs_kc63:
-        # Run the KC63 tidy csv's as defined by the items in get_csvs_kc63
-        all_csvs = csvs.get_csvs_kc63()
-        write.write_outputs(df_kc63, all_csvs, csv_output_path,
-                            param.CSV_NOT_INC)
-
-    if run_csvs_kc62:
-        # Run the KC62 tidy csv's as defined by the items in get_csvs_kc62
-        all_csvs = csvs.get_csvs_kc62()
-        write.write_outputs(df_kc62, all_csvs, csv_output_path,
-                            param.CSV_NOT_INC)
-
-    if run_charts_kc63:
-        # Run the KC63 charts as defined by the items in get_charts_kc63
-        all_charts = charts.get_charts_kc63()
-        write.write_outputs(df_kc63, all_charts, charts_template)
-
-    if run_charts_kc62:
-        # Run the KC62 charts as defined by the items in get_charts_kc62
-        all_charts = charts.get_charts_kc62()
-        write.write_outputs(df_kc62, all_charts, charts_template)
-
-    # If any charts were updated
-    if run_charts_kc63 | run_charts_kc62:
-        # Save the Excel master chart file with the updated data and close Excel
-        wb = xw.Book(charts_template)
-        wb.save()
-        xw.apps.active.api.Quit()
-
-    if run_report_tables_kc62:
-        # Run the KC62 report tables as defined by the items in get_report_tables_kc62
-        all_report_tables = tables.get_report_tables_kc62()
-        write.write_outputs(df_kc62, all_report_tables, report_tables_template)
-
-        # Save the Excel report tables with the updated data and close Excel
-        wb = xw.Book(report_tables_template)
-        wb.save()
-        xw.apps.active.api.Quit()
-
-    if run_dashboards:
-        # Run the dashboard outputs
-
-        # Run the KC63 dashboard outputs as defined by the items in get_dashboards_kc63
-        all_dbs = dashboards.get_dashboards_kc63()
-        write.write_outputs(df_kc63, all_dbs, dashboard_output_path)
-
-        # Run the KC62 dashboard outputs as defined by the items in get_dashboards_kc62
-        all_dbs = dashboards.get_dashboards_kc62()
-        write.write_outputs(df_kc62, all_dbs, dashboard_output_path)
+        kc62_data = loading.submit(import_data, "KC62", year_range)
+
+    loading.shutdown(wait=False)
+
+    # Define the outputs and cross checks to be run as per the run flags
+    all_validations_kc63 = validations.get_validations_kc63() if run_validations_kc63 else []
+    all_validations_kc62 = validations.get_validations_kc62() if run_validations_kc62 else []
+    all_anomalies_kc63 = validations.get_anomalies_kc63() if run_anomalies_kc63 else []
+    all_anomalies_kc62 = validations.get_anomalies_kc62() if run_anomalies_kc62 else []
+    all_tables_kc63 = tables.get_tables_kc63() if run_tables_kc63 else []
+    all_tables_kc62 = tables.get_tables_kc62() if run_tables_kc62 else []
+    all_checks_kc63 = tables.get_cross_checks_kc63() if run_tables_kc63 & run_cross_checks else []
+    all_checks_kc62 = tables.get_cross_checks_kc62() if run_tables_kc62 & run_cross_checks else []
+    all_csvs_kc63 = csvs.get_csvs_kc63() if run_csvs_kc63 else []
+    all_csvs_kc62 = csvs.get_csvs_kc62() if run_csvs_kc62 else []
+    all_charts_kc63 = charts.get_charts_kc63() if run_charts_kc63 else []
+    all_charts_kc62 = charts.get_charts_kc62() if run_charts_kc62 else []
+    all_report_tables_kc62 = tables.get_report_tables_kc62() if run_report_tables_kc62 else []
+    all_dbs_kc63 = dashboards.get_dashboards_kc63() if run_dashboards else []
+    all_dbs_kc62 = dashboards.get_dashboards_kc62() if run_dashboards else []
+
+    # Plan every content to be run, so that any data shared between them can
+    # be released after its last use
+    all_outputs = (all_validations_kc63 + all_validations_kc62
+                   + all_anomalies_kc63 + all_anomalies_kc62
+                   + all_tables_kc63 + all_tables_kc62
+                   + all_csvs_kc63 + all_csvs_kc62
+                   + all_charts_kc63 + all_charts_kc62
+                   + all_report_tables_kc62 + all_dbs_kc63 + all_dbs_kc62)
+    planned = [content for output in all_outputs
+               for content in output["contents"]]
+    planned += [content for check in all_checks_kc63 + all_checks_kc62
+                for content in [check.detail, check.total]]
+
+    # Run each part of the pipeline as per the run flags. Any filtered data
+    # that is needed by more than one output is only created once and shared.
+    # Where set in parameters, the outputs are created in parallel by one
+    # pool of processes for the whole run.
+    # The outputs for each collection are run as soon as its data is ready,
+    # whichever collection is ready first. Workbooks written by both
+    # collections are saved once both have been written.
+    loaded = [data for data in [kc63_data, kc62_data] if data is not None]
+    with processing.shared_filters(planned), processing.output_pool():
+
+        for data in as_completed(loaded):
+
+            if data is kc63_data:
+
+                if run_validations_kc63:
+                    # Run the KC63 validation tables as defined by the items in get_validations_kc63
+                    write.write_outputs(kc63_data.result(), all_validations_kc63, validations_kc63)
+                    # Save and close the Excel validation file with the updated data
+                    wb = xw.Book(validations_kc63)
+                    wb.save()
+                    wb.close()
+
+                if run_anomalies_kc63:
+                    # Create the folder for the anomaly scores if it doesn't exist
+                    param.ANOMALY_DIR.mkdir(parents=True, exist_ok=True)
+                    # Run the KC63 anomaly scores as defined by the items in get_anomalies_kc63
+                    write.write_outputs(kc63_data.result(), all_anomalies_kc63, param.ANOMALY_DIR)
+
+                if run_tables_kc63:
+                    # Run the KC63 tables as defined by the items in get_tables_kc63
+                    write.write_outputs(kc63_data.result(), all_tables_kc63, tables_template)
+
+                    # Add the Table 11 LA footnote references.
+                    write.add_footnote_refs("Table 11",  "B21", "B")
+
+                    # Check the totals in the KC63 tables as defined by the items in
+                    # get_cross_checks_kc63
+                    if run_cross_checks:
+                        cross_checks.run_cross_checks(kc63_data.result(),
+                                                      all_checks_kc63)
+
+                if run_csvs_kc63:
+                    # Run the KC63 tidy csv's as defined by the items in get_csvs_kc63
+                    write.write_outputs(kc63_data.result(), all_csvs_kc63, csv_output_path,
+                                        param.CSV_NOT_INC)
+
+                if run_charts_kc63:
+                    # Run the KC63 charts as defined by the items in get_charts_kc63
+                    write.write_outputs(kc63_data.result(), all_charts_kc63, charts_template)
+
+                if run_dashboards:
+                    # Run the KC63 dashboard outputs as defined by the items in get_dashboards_kc63
+                    write.write_outputs(kc63_data.result(), all_dbs_kc63, dashboard_output_path)
+
+            if data is kc62_data:
+
+                if run_validations_kc62:
+                    # Run the KC62 validation tables as defined by the items in get_validations_kc62
+                    write.write_outputs(kc62_data.result(), all_validations_kc62, validations_kc62)
+                    # Save and close the Excel validation file with the updated data
+                    wb = xw.Book(validations_kc62)
+                    wb.save()
+                    wb.close()
+
+                if run_anomalies_kc62:
+                    # Create the folder for the anomaly scores if it doesn't exist
+                    param.ANOMALY_DIR.mkdir(parents=True, exist_ok=True)
+                    # Run the KC62 anomaly scores as defined by the items in get_anomalies_kc62
+                    write.write_outputs(kc62_data.result(), all_anomalies_kc62, param.ANOMALY_DIR)
+
+                if run_tables_kc62:
+                    # Run the KC62 tables as defined by the items in get_tables_kc62
+                    write.write_outputs(kc62_data.result(), all_tables_kc62, tables_template)
+
+                    # Add the Table 12 BSU footnote references.
+                    write.add_footnote_refs("Table 12", "A23", "A", "B")
+
+                    # Check the totals in the KC62 tables as defined by the items in
+                    # get_cross_checks_kc62
+                    if run_cross_checks:
+                        cross_checks.run_cross_checks(kc62_data.result(),
+                                                      all_checks_kc62)
+
+                if run_csvs_kc62:
+                    # Run the KC62 tidy csv's as defined by the items in get_csvs_kc62
+                    write.write_outputs(kc62_data.result(), all_csvs_kc62, csv_output_path,
+                                        param.CSV_NOT_INC)
+
+                if run_charts_kc62:
+                    # Run the KC62 charts as defined by the items in get_charts_kc62
+                    write.write_outputs(kc62_data.result(), all_charts_kc62, charts_template)
+
+                if run_report_tables_kc62:
+                    # Run the KC62 report tables as defined by the items in get_report_tables_kc62
+                    write.write_outputs(kc62_data.result(), all_report_tables_kc62, report_tables_template)
+
+                    # Save and close the Excel report tables with the updated data
+                    wb = xw.Book(report_tables_template)
+                    wb.save()
+                    wb.close()
+
+                if run_dashboards:
+                    # Run the KC62 dashboard outputs as defined by the items in get_dashboards_kc62
+                    write.write_outputs(kc62_data.result(), all_dbs_kc62, dashboard_output_path)
+
+        # If any tables were updated
+        if run_tables_kc63 | run_tables_kc62:
+            # Save and close the Excel master tables with the updated data
+            wb = xw.Book(tables_template)
+            wb.save()
+            wb.close()
+
+        # If any charts were updated
+        if run_charts_kc63 | run_charts_kc62:
+            # Save and close the Excel master chart file with the updated data
+            wb = xw.Book(charts_template)
+            wb.save()
+            wb.close()
+
+        # Close Excel once all the workbooks have been saved
+        if xw.apps.count > 0:
+            xw.apps.active.api.Quit()
 
     # Save the cms ready tables and chart files to the publication area
     if run_pub_outputs:
@@ -13,7 +13,9 @@ CSV_DIR = PUB_DIR / "CSVs"
 REPORT_TAB_DIR = PUB_DIR / "ReportTables"
 DASHBOARD_DIR = OUTPUT_DIR / "Dashboard"
 VALIDATION_DIR = OUTPUT_DIR / "Validations"
+ANOMALY_DIR = VALIDATION_DIR / "Anomalies"
 LOG_DIR = OUTPUT_DIR / "Logs"
+PARTITION_DIR = OUTPUT_DIR / "Partitions"
 
 # Set the locations/filenames of the validation files
 VALIDATIONS_OUTPUT_KC63 = VALIDATION_DIR / "breast_screening_kc63_validations.xlsx"
@@ -43,6 +45,8 @@ YEAR = "2021-22"
 # (True or False)
 VALIDATIONS_KC63 = False  # Validations derived from KC63 data
 VALIDATIONS_KC62 = False  # Validations derived from KC62 data
+ANOMALIES_KC63 = False  # Anomaly scores for all KC63 series (csv)
+ANOMALIES_KC62 = False  # Anomaly scores for all KC62 series (csv)
 TABLES_KC63 = False  # Tables derived from KC63 data
 CHARTS_KC63 = False  # Charts derived from KC63 data
 CSVS_KC63 = False  # Csvs derived from KC623data
@@ -55,6 +59,29 @@ DASHBOARDS = False  # Dashboard output derived from KC62 and KC63 data
 RUN_PUBLICATION_OUTPUTS = False
 # Worksheets to be removed from final publication file
 TABLES_REMOVE = ["Cross Checks", "Org Total Checks"]
+# Sets whether the cross checks of the table totals are run with the tables
+# (see cross_checks.py), with any failures reported in the run log
+CROSS_CHECKS = True
+# Largest difference allowed between the totals compared by the cross checks
+# (small, so that floating point differences in the sums are not failures)
+CROSS_CHECK_TOLERANCE = 0.001
+# Sets the engine used to filter and sum the data for the measure tables and
+# validations ("pandas" or "polars"). The polars engine runs each sum as a
+# lazy, multithreaded query, and requires the polars package to be installed.
+# It is not used where the data is partitioned on disk (see OUT_OF_CORE).
+ENGINE = "pandas"
+# Sets the number of processes used to create the outputs before they are
+# written (1 creates each output in turn). One pool of processes is used for
+# the whole run, and each process holds its own copy of the source data.
+PROCESSES = 1
+# Sets the maximum number of created outputs held in memory while waiting to
+# be written
+OUTPUT_QUEUE_SIZE = 4
+# Sets whether the pre-processed data is written to disk in one partition per
+# collection and year (in PARTITION_DIR), with the outputs created from one
+# year's partition at a time. Used where the full time series would not fit
+# in memory.
+OUT_OF_CORE = False
 
 
 # Sets the number of years of KC63 data to be imported (number >=1)
@@ -80,6 +107,42 @@ YOY_COV_BREACH_KC63 =    # Integer value representing % point change to flag
 AVG_COV_BREACH_KC63 =    # Integer value representing % point change to flag
 YOY_RATE_BREACH_KC62 =    # Integer value indicating % change to flag
 AVG_RATE_BREACH_KC62 =    # Integer value indicating % change to flag
+# Set the anomaly validation conditions (see anomalies.py)
+# The breach thresholds are the larger of these and the scores calibrated to
+# the length of the series (see anomalies.breach_thresholds)
+ANOMALY_Z_BREACH = 3.5  # Robust z-score above which a year is an outlier
+ROLLING_MAD_YEARS = 8  # Number of previous years used for the rolling score
+ROLLING_MAD_BREACH = 3.5  # Rolling score above which the latest year is flagged
+BREAK_MIN_YEARS = 3  # Minimum number of years either side of a level shift
+BREAK_BREACH = 3.5  # Score above which a level shift is flagged
+ANOMALY_FALSE_ALARM_RATE = 0.005  # Share of noise series flagged by each check
+# Breach thresholds used by the time series validations for each measure.
+# Each row gives the measure, the breach check, the threshold, the validation
+# column it is checked against and the type of change (shown in the warning).
+VALIDATION_BREACHES = [
+    ("Coverage", "YoY_breach", YOY_COV_BREACH_KC63, "YoY_change", "absolute"),
+    ("Coverage", "Avg_breach", AVG_COV_BREACH_KC63, "Avg_change", "percentage point"),
+    ("Rate_with_cancer", "YoY_breach", YOY_RATE_BREACH_KC62, "YoY_change", "absolute"),
+    ("Rate_with_cancer", "Avg_breach", AVG_RATE_BREACH_KC62, "Avg_change", "rate"),
+    ("Women_resident", "YoY_breach", YOY_BREACH_KC63, "YoY_percent_change", "percentage"),
+    ("Women_resident", "Avg_breach", AVG_BREACH_KC63, "Avg_percent_change", "percentage"),
+    ("Women_eligible", "YoY_breach", YOY_BREACH_KC63, "YoY_percent_change", "percentage"),
+    ("Women_eligible", "Avg_breach", AVG_BREACH_KC63, "Avg_percent_change", "percentage"),
+    ("Women_screened_less3yrs", "YoY_breach", YOY_BREACH_KC63, "YoY_percent_change", "percentage"),
+    ("Women_screened_less3yrs", "Avg_breach", AVG_BREACH_KC63, "Avg_percent_change", "percentage"),
+    ("Invited", "YoY_breach", YOY_BREACH_KC62, "YoY_percent_change", "percentage"),
+    ("Invited", "Avg_breach", AVG_BREACH_KC62, "Avg_percent_change", "percentage"),
+    ("Screened", "YoY_breach", YOY_BREACH_KC62, "YoY_percent_change", "percentage"),
+    ("Screened", "Avg_breach", AVG_BREACH_KC62, "Avg_percent_change", "percentage"),
+    ("Total_with_cancer", "YoY_breach", YOY_BREACH_KC62, "YoY_percent_change", "percentage"),
+    ("Total_with_cancer", "Avg_breach", AVG_BREACH_KC62, "Avg_percent_change", "percentage"),
+    ]
+
+# Columns that identify each series at the finest organisation level in the
+# validation panel, from which all the validation outputs are rolled up (see
+# processing.create_validation_panel). Columns not in a collection are ignored.
+VALIDATION_PANEL_COLUMNS = ["Parent_Org_Name", "Org_Code", "Org_ONSCode",
+                            "Org_Name", "Part", "Table_Code", "Row_Def"]
 
 
 # Small LAs to combine with larger LAs for KC63
@@ -0,0 +1,226 @@
+"""
+Purpose of the script: contains the anomaly scores used by the time series
+validations (see field_definitions.validate_time_series). Each function takes
+a 2d array with one row per series and one column per year (oldest first),
+and scores every series at once. Missing values (nan) are ignored.
+"""
+import warnings
+from functools import lru_cache
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+# Scales the median absolute deviation (MAD), or the mean absolute deviation
+# where the MAD is 0, so that scores are comparable to standard z-scores
+MAD_SCALE = 0.6745
+MEAN_AD_SCALE = 1.253314
+# The MAD underestimates the spread of short series: it is corrected by
+# n / (n - MAD_SMALL_SAMPLE) for a series of n values
+MAD_SMALL_SAMPLE = 0.8
+# Number of series of simulated noise (and the seed) used to calibrate the
+# breach thresholds to the length of the series
+CALIBRATION_SERIES = 20000
+CALIBRATION_SEED = 0
+
+
+def nan_median(values, axis):
+    """
+    Median ignoring missing values, without warning where all the values
+    are missing (the median is then missing).
+    """
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", category=RuntimeWarning)
+        return np.nanmedian(values, axis=axis)
+
+
+def robust_scale(deviations, axis):
+    """
+    Robust estimate of the spread of deviations from the median: the scaled
+    MAD, or the scaled mean absolute deviation where the MAD is 0, corrected
+    for the number of values in each series.
+
+    Parameters
+    ----------
+    deviations : numpy.ndarray
+        Deviations of the values from the median of their series.
+    axis : int
+        Axis holding the values of each series.
+
+    Returns
+    -------
+    numpy.ndarray
+        The scale of each series (the axis is removed).
+    """
+    absolute = np.abs(deviations)
+    mad = nan_median(absolute, axis)
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", category=RuntimeWarning)
+        mean_ad = np.nanmean(absolute, axis=axis)
+
+    # Correct for short series (no correction where there is only one value)
+    n_values = (~np.isnan(absolute)).sum(axis=axis)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        correction = np.where(n_values > 1,
+                              n_values / (n_values - MAD_SMALL_SAMPLE), 1.0)
+
+    return np.where(mad > 0, mad / MAD_SCALE,
+                    mean_ad * MEAN_AD_SCALE) * correction
+
+
+def robust_scores(deviations, scale):
+    """
+    Divides deviations by their robust scale. Where the scale is 0 (all the
+    values used for the scale are equal), any deviation is scored as
+    infinite.
+    """
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.where(scale > 0, deviations / scale,
+                        np.where(deviations == 0, 0.0,
+                                 np.sign(deviations) * np.inf))
+
+
+def robust_z_scores(values):
+    """
+    Scores each value against the median and MAD of all the values in its
+    series (modified z-scores, which are not affected by a few outliers).
+
+    Parameters
+    ----------
+    values : numpy.ndarray
+        One row per series and one column per year.
+
+    Returns
+    -------
+    numpy.ndarray
+        Score of each value, the same shape as values.
+    """
+    deviations = values - nan_median(values, axis=1)[:, np.newaxis]
+    scale = robust_scale(deviations, axis=1)[:, np.newaxis]
+
+    return robust_scores(deviations, scale)
+
+
+def rolling_mad_scores(values, window):
+    """
+    Scores each value against the median and MAD of the values for the
+    previous years of its series (a rolling window), so that each value is
+    compared with the recent level of the series.
+
+    Parameters
+    ----------
+    values : numpy.ndarray
+        One row per series and one column per year.
+    window : int
+        Number of previous years used to score each value.
+
+    Returns
+    -------
+    numpy.ndarray
+        Score of each value, the same shape as values. Years without a full
+        window of previous years are not scored (nan).
+    """
+    scores = np.full(values.shape, np.nan)
+    if values.shape[1] <= window:
+        return scores
+
+    # The window of previous years for each year after the first window
+    windows = sliding_window_view(values, window, axis=1)[:, :-1, :]
+    median = nan_median(windows, axis=2)
+    scale = robust_scale(windows - median[..., np.newaxis], axis=2)
+
+    scores[:, window:] = robust_scores(values[:, window:] - median, scale)
+
+    return scores
+
+
+def structural_breaks(values, min_years):
+    """
+    Finds the largest shift in the level of each series. For each possible
+    break (with at least min_years either side), the difference between the
+    medians after and before the break is scored against the spread of the
+    values around the median of their own side.
+
+    Parameters
+    ----------
+    values : numpy.ndarray
+        One row per series and one column per year.
+    min_years : int
+        Minimum number of years either side of a break.
+
+    Returns
+    -------
+    position : numpy.ndarray
+        For each series, the position (column) of the first year after the
+        largest break, or -1 if there is no shift in the level of the series.
+    score : numpy.ndarray
+        Score of the largest break for each series (nan if no break could be
+        scored).
+    """
+    n_series, n_years = values.shape
+    position = np.full(n_series, -1)
+    score = np.full(n_series, np.nan)
+
+    # Score each possible break for all the series at once
+    for split in range(min_years, n_years - min_years + 1):
+        median_before = nan_median(values[:, :split], axis=1)
+        median_after = nan_median(values[:, split:], axis=1)
+        residuals = np.concatenate(
+            [values[:, :split] - median_before[:, np.newaxis],
+             values[:, split:] - median_after[:, np.newaxis]], axis=1)
+        split_score = np.abs(robust_scores(median_after - median_before,
+                                           robust_scale(residuals, axis=1)))
+
+        # Keep the break where it is the largest so far
+        is_larger = split_score > np.nan_to_num(score, nan=-np.inf)
+        position = np.where(is_larger, split, position)
+        score = np.where(is_larger, split_score, score)
+
+    # A break is only found where the level of the series has shifted
+    position = np.where(score > 0, position, -1)
+
+    return position, score
+
+
+@lru_cache(maxsize=None)
+def breach_thresholds(n_years, window, min_years, false_alarm_rate):
+    """
+    Calibrates the breach thresholds to the length of the series. Series of
+    normal noise are simulated and scored, and each threshold is the score
+    that only false_alarm_rate of the noise series are above. Without this,
+    a fixed threshold flags a large share of series of pure noise, as a
+    series of n years gives n chances of a large z-score and the scale of a
+    short series is uncertain. The thresholds are cached for each length.
+
+    Parameters
+    ----------
+    n_years : int
+        Number of years in each series.
+    window : int
+        Number of previous years used for the rolling score.
+    min_years : int
+        Minimum number of years either side of a level shift.
+    false_alarm_rate : float
+        Share of series of noise flagged by each check.
+
+    Returns
+    -------
+    z : float
+        Threshold for the largest robust z-score of a series.
+    rolling : float
+        Threshold for the rolling score of the latest year (nan if the
+        series are not longer than the window).
+    level_shift : float
+        Threshold for the largest level shift (nan if the series are too
+        short for a break).
+    """
+    rng = np.random.default_rng(CALIBRATION_SEED)
+    noise = rng.standard_normal((CALIBRATION_SERIES, n_years))
+
+    # Score the noise with each check, and find the quantile of the scores
+    max_z = np.abs(robust_z_scores(noise)).max(axis=1)
+    rolling = np.abs(rolling_mad_scores(noise, window)[:, -1])
+    _, level_shift = structural_breaks(noise, min_years)
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", category=RuntimeWarning)
+        return tuple(float(np.nanquantile(scores, 1 - false_alarm_rate))
+                     for scores in (max_z, rolling, level_shift))
@@ -0,0 +1,158 @@
+"""
+Purpose of the script: checks the consistency of the table outputs, in place
+of the cross check worksheets in the master tables file. The organisation
+totals are checked against the regional and national totals, and totals
+shared across tables are checked against each other. The checks are defined
+in tables.py and any failures are reported in the run log.
+"""
+import logging
+import numpy as np
+import pandas as pd
+import bs_code.parameters as param
+from bs_code.utilities import processing
+from bs_code.utilities.specs import thaw
+
+
+def find_measure_columns(df, measure):
+    """
+    Finds the columns that hold a measure: the column named as the measure,
+    or one column for each year where the year is added to the name
+    (e.g. "Women_eligible 2021-22").
+
+    Parameters
+    ----------
+    df : pandas.DataFrame
+    measure : str
+
+    Returns
+    -------
+    list[str]
+        Names of the columns, in the order they appear in the dataframe.
+    """
+    columns = [column for column in df.columns
+               if (column == measure) | str(column).startswith(measure + " ")]
+
+    if len(columns) == 0:
+        raise ValueError(f"The measure {measure} is not in the output")
+
+    return columns
+
+
+def find_subgroup_rows(content):
+    """
+    Returns the labels of any row subgroups added by a content spec (these
+    rows are already included in the other rows, so are not summed).
+
+    Parameters
+    ----------
+    content : ContentSpec
+
+    Returns
+    -------
+    list[str]
+    """
+    subgroups = (getattr(content, "row_subgroup", None)
+                 or getattr(content, "subgroup", None))
+    if subgroups is None:
+        return []
+
+    return [label for groups in thaw(subgroups).values() for label in groups]
+
+
+def select_check_values(df_detail, df_total, check):
+    """
+    Selects the values compared by a cross check, one row for each pair of
+    detail and total columns.
+
+    Parameters
+    ----------
+    df_detail : pandas.DataFrame
+        Data created by the detail content of the check.
+    df_total : pandas.DataFrame
+        Data created by the total content of the check.
+    check : CrossCheckSpec
+
+    Returns
+    -------
+    pandas.DataFrame
+    """
+    total_measures = check.total_measures or check.measures
+
+    # Pair the columns of each measure with the total columns for the same
+    # year
+    detail_columns = []
+    total_columns = []
+    for measure, total_measure in zip(check.measures, total_measures):
+        columns = find_measure_columns(df_detail, measure)
+        detail_columns += columns
+        total_columns += [total_measure + str(column)[len(measure):]
+                          for column in columns]
+
+    missing = set(total_columns) - set(df_total.columns)
+    if missing:
+        raise ValueError(f"The columns {sorted(missing)} are not in the total "
+                         f"output for the cross check {check.name}")
+
+    # Sum the detail rows, excluding the total and any subgroup rows, or
+    # select the detail row where a total is shared across tables
+    if check.detail_row is not None:
+        detail = df_detail.loc[check.detail_row, detail_columns]
+    else:
+        exclude = [check.total_row, *find_subgroup_rows(check.detail)]
+        detail = (df_detail.loc[~df_detail.index.isin(exclude),
+                                detail_columns].sum())
+
+    total = df_total.loc[check.total_row, total_columns]
+
+    return pd.DataFrame({"Check": check.name,
+                         "Detail_column": detail_columns,
+                         "Total_column": total_columns,
+                         "Detail_value": detail.to_numpy(dtype=float),
+                         "Total_value": total.to_numpy(dtype=float)})
+
+
+def run_cross_checks(df, checks, tolerance=param.CROSS_CHECK_TOLERANCE):
+    """
+    Runs the cross checks of the table outputs. The data for each output is
+    created as per its content spec (where the shared_filters context is
+    active, the data already created for the tables is used), and all the
+    totals are then compared in a single pass. Any failures are reported in
+    the run log.
+
+    Parameters
+    ----------
+    df : pandas.DataFrame or PartitionedData
+        Source dataframe.
+    checks : list[CrossCheckSpec]
+    tolerance : float
+        Largest difference allowed between the values compared.
+
+    Returns
+    -------
+    df_checks : pandas.DataFrame
+        One row for each value compared, with the difference and whether the
+        check passed.
+    """
+    # Select the values compared by each check
+    df_checks = pd.concat(
+        [select_check_values(processing.create_content(check.detail, df),
+                             processing.create_content(check.total, df),
+                             check)
+         for check in checks], ignore_index=True)
+
+    # Compare all the values at once, treating missing values as 0
+    detail = np.nan_to_num(df_checks["Detail_value"].to_numpy())
+    total = np.nan_to_num(df_checks["Total_value"].to_numpy())
+    df_checks["Difference"] = detail - total
+    df_checks["Pass"] = np.abs(detail - total) <= tolerance
+
+    # Report any failures in the run log
+    for row in df_checks[~df_checks["Pass"]].itertuples():
+        logging.warning(f"Cross check failed: {row.Check} - "
+                        f"{row.Detail_column} ({row.Detail_value}) does not "
+                        f"match {row.Total_column} ({row.Total_value})")
+
+    logging.info(f"{df_checks['Pass'].sum()} of {len(df_checks)} cross "
+                 "check values passed")
+
+    return df_checks
@@ -1,4 +1,4 @@
-from bs_code.utilities.processing import create_output_csv_tidy
+from bs_code.utilities.specs import OutputSpec, CsvTidySpec
 
 
 """
@@ -10,9 +10,9 @@ name : str
 write_type: str
     Determines the method of writing the output.
     All should be set to 'csv' for these outputs.
-contents: list[str]
-    The name of the function that creates the output. If more than one are
-    included they will be appended together.
+contents: list[ContentSpec]
+    The content spec(s) that create the output, defined below (see the specs
+    module). If more than one are included they will be appended together.
 
 """
 
@@ -30,12 +30,12 @@ def get_csvs_kc63():
 
     """
     all_csvs = [
-        {"name": "kc63_coverage",
-         "write_type": "csv",
-         "contents": [create_csv_coverage_national,
-                      create_csv_coverage_region,
-                      create_csv_coverage_la
-                      ]}
+        OutputSpec(name="kc63_coverage",
+                   write_type="csv",
+                   contents=[create_csv_coverage_national,
+                             create_csv_coverage_region,
+                             create_csv_coverage_la
+                             ])
         ]
 
     return all_csvs
@@ -54,37 +54,37 @@ def get_csvs_kc62():
 
     """
     all_csvs = [
-        {"name": "kc62_invite_screened_uptake",
-         "write_type": "csv",
-         "contents": [create_csv_uptake_national,
-                      create_csv_uptake_self_gp_national,
-                      create_csv_uptake_region,
-                      create_csv_uptake_bsu,
-                      ]},
-        {"name": "kc62_referral_outcome",
-         "write_type": "csv",
-         "contents": [create_csv_referral_national,
-                      create_csv_referral_region,
-                      create_csv_referral_bsu,
-                      ]},
-        {"name": "kc62_cancers_detected",
-         "write_type": "csv",
-         "contents": [create_csv_cancers_national,
-                      create_csv_cancers_region,
-                      create_csv_cancers_bsu
-                      ]},
-        {"name": "kc62_diagnostic_outcomes",
-         "write_type": "csv",
-         "contents": [create_csv_diagnostic_all_national,
-                      create_csv_diagnostic_prevalent_national,
-                      create_csv_diagnostic_incident_national,
-                      create_csv_diagnostic_all_region,
-                      create_csv_diagnostic_prevalent_region,
-                      create_csv_diagnostic_incident_region,
-                      create_csv_diagnostic_all_bsu,
-                      create_csv_diagnostic_prevalent_bsu,
-                      create_csv_diagnostic_incident_bsu
-                      ]}
+        OutputSpec(name="kc62_invite_screened_uptake",
+                   write_type="csv",
+                   contents=[create_csv_uptake_national,
+                             create_csv_uptake_self_gp_national,
+                             create_csv_uptake_region,
+                             create_csv_uptake_bsu,
+                             ]),
+        OutputSpec(name="kc62_referral_outcome",
+                   write_type="csv",
+                   contents=[create_csv_referral_national,
+                             create_csv_referral_region,
+                             create_csv_referral_bsu,
+                             ]),
+        OutputSpec(name="kc62_cancers_detected",
+                   write_type="csv",
+                   contents=[create_csv_cancers_national,
+                             create_csv_cancers_region,
+                             create_csv_cancers_bsu
+                             ]),
+        OutputSpec(name="kc62_diagnostic_outcomes",
+                   write_type="csv",
+                   contents=[create_csv_diagnostic_all_national,
+                             create_csv_diagnostic_prevalent_national,
+                             create_csv_diagnostic_incident_national,
+                             create_csv_diagnostic_all_region,
+                             create_csv_diagnostic_prevalent_region,
+                             create_csv_diagnostic_incident_region,
+                             create_csv_diagnostic_all_bsu,
+                             create_csv_diagnostic_prevalent_bsu,
+                             create_csv_diagnostic_incident_bsu
+                             ])
         ]
 
     return all_csvs
@@ -151,637 +151,527 @@ Returns:
 """
 
 
-def create_csv_coverage_national(df):
-    collection = "KC63"
-    org_level = "national"
-    breakdown = ["Row_Def"]
-    measure_column = "Col_Def"
-    part = ["1"]
-    table_code = None
-    sort_on = ["CollectionYearRange", "Row_Def"]
-    measure_order = ["Women_resident", "Women_ineligible", "Women_eligible",
-                     "Women_never_screened", "Percent_never_screened",
-                     "Women_screened_less3yrs", "Coverage"]
-    column_rename = {"Row_Def": "Age_Band"}
-    filter_condition = "(Row_Def not in['<45','>=75'])"
-    visible_condition = None
-    breakdown_subgroup = {"Row_Def": {"53<71": ["53-54", "55-59", "60-64",
-                                                "65-69", "70"]}}
-    ts_years = 11
-
-    return create_output_csv_tidy(df, collection, org_level, breakdown,
-                                  measure_column, part, table_code, sort_on,
-                                  measure_order, column_rename,
-                                  filter_condition, visible_condition,
-                                  breakdown_subgroup, ts_years)
-
-
-def create_csv_coverage_region(df):
-    collection = "KC63"
-    org_level = "regional"
-    breakdown = ["Row_Def"]
-    measure_column = "Col_Def"
-    part = ["1"]
-    table_code = None
-    sort_on = ["CollectionYearRange", "Row_Def"]
-    measure_order = ["Women_resident", "Women_ineligible", "Women_eligible",
-                     "Women_never_screened", "Percent_never_screened",
-                     "Women_screened_less3yrs", "Coverage"]
-    column_rename = {"Row_Def": "Age_Band"}
-    filter_condition = "(Row_Def in['53-54', '55-59', '60-64', '65-69', '70'])"
-    visible_condition = "(Row_Def not in['53-54', '55-59', '60-64', '65-69', '70'])"
-    breakdown_subgroup = {"Row_Def": {"53<71": ["53-54", "55-59", "60-64",
-                                                "65-69", "70"]}}
-    ts_years = 11
-
-    return create_output_csv_tidy(df, collection, org_level, breakdown,
-                                  measure_column, part, table_code, sort_on,
-                                  measure_order, column_rename,
-                                  filter_condition, visible_condition,
-                                  breakdown_subgroup, ts_years)
-
-
-def create_csv_coverage_la(df):
-    collection = "KC63"
-    org_level = "local"
-    breakdown = ["Row_Def"]
-    measure_column = "Col_Def"
-    part = ["1"]
-    table_code = None
-    sort_on = ["CollectionYearRange", "Row_Def"]
-    measure_order = ["Women_eligible", "Women_screened_less3yrs", "Coverage"]
-    column_rename = {"Row_Def": "Age_Band"}
-    filter_condition = "(Row_Def in['53-54', '55-59', '60-64', '65-69', '70'])"
-    visible_condition = "(Row_Def not in['53-54', '55-59', '60-64', '65-69', '70'])"
-    breakdown_subgroup = {"Row_Def": {"53<71": ["53-54", "55-59", "60-64",
-                                                "65-69", "70"]}}
-    ts_years = 11
-
-    return create_output_csv_tidy(df, collection, org_level, breakdown,
-                                  measure_column, part, table_code, sort_on,
-                                  measure_order, column_rename,
-                                  filter_condition, visible_condition,
-                                  breakdown_subgroup, ts_years)
-
-
-def create_csv_uptake_national(df):
-    collection = "KC62"
-    org_level = "national"
-    breakdown = ["Row_Def", "Table_Code"]
-    measure_column = "Col_Def"
-    part = ["1"]
-    table_code = ["A", "B", "C1", "C2", "D"]
-    sort_on = ["CollectionYearRange", "Row_Def", "Table_Code"]
-    measure_order = ["Screened", "Invited", "Uptake"]
-    column_rename = {"Row_Def": "Age_Band"}
-    filter_condition = "(Row_Def not in['<=44'])"
-    visible_condition = "(Row_Def not in['65-69', '70', '71-74', '>=75'])"
-    breakdown_subgroup = {"Row_Def": {"50<71": ["50-52", "53-54", "55-59",
-                                                "60-64", "65-69", "70"],
-                                      "45-74": ["45-49", "50-52", "53-54",
-                                                "55-59", "60-64", "65-69",
-                                                "70", "71-74"],
-                                      "65-70": ["65-69", "70"],
-                                      "Over 70": ["71-74", ">=75"]},
-                          "Table_Code": {"A and C1": ["A", "C1"],
-                                         "A to C2": ["A", "B", "C1", "C2"],
-                                         "A to D": ["A", "B", "C1", "C2", "D"]}}
-    ts_years = 11
-
-    return create_output_csv_tidy(df, collection, org_level, breakdown,
-                                  measure_column, part, table_code, sort_on,
-                                  measure_order, column_rename,
-                                  filter_condition, visible_condition,
-                                  breakdown_subgroup, ts_years)
-
-
-def create_csv_uptake_self_gp_national(df):
-    collection = "KC62"
-    org_level = "national"
-    breakdown = ["Row_Def", "Table_Code"]
-    measure_column = "Col_Def"
-    part = ["1"]
-    table_code = ["E", "F1", "F2"]
-    sort_on = ["CollectionYearRange", "Row_Def", "Table_Code"]
-    measure_order = ["Screened"]
-    column_rename = {"Row_Def": "Age_Band"}
-    filter_condition = "(Row_Def not in['<=44'])"
-    visible_condition = "(Row_Def not in['65-69', '70', '71-74', '>=75'])"
-    breakdown_subgroup = {"Row_Def": {"50<71": ["50-52", "53-54", "55-59",
-                                                "60-64", "65-69", "70"],
-                                      "45-74": ["45-49", "50-52", "53-54",
-                                                "55-59", "60-64", "65-69",
-                                                "70", "71-74"],
-                                      "65-70": ["65-69", "70"],
-                                      "Over 70": ["71-74", ">=75"]}}
-    ts_years = 11
-
-    return create_output_csv_tidy(df, collection, org_level, breakdown,
-                                  measure_column, part, table_code, sort_on,
-                                  measure_order, column_rename,
-                                  filter_condition, visible_condition,
-                                  breakdown_subgroup, ts_years)
-
-
-def create_csv_uptake_region(df):
-    collection = "KC62"
-    org_level = "regional"
-    breakdown = ["Row_Def", "Table_Code"]
-    measure_column = "Col_Def"
-    part = ["1"]
-    table_code = ["A", "B", "C1", "C2", "D"]
-    sort_on = ["CollectionYearRange", "Row_Def", "Table_Code"]
-    measure_order = ["Screened", "Invited", "Uptake"]
-    column_rename = {"Row_Def": "Age_Band"}
-    filter_condition = "(Row_Def in['50-52', '53-54', '55-59', '60-64', '65-69', '70'])"
-    visible_condition = "(Row_Def in['50<71'])"
-    breakdown_subgroup = {"Row_Def": {"50<71": ["50-52", "53-54", "55-59",
-                                                "60-64", "65-69", "70"]},
-                          "Table_Code": {"A and C1": ["A", "C1"],
-                                         "A to C2": ["A", "B", "C1", "C2"],
-                                         "A to D": ["A", "B", "C1", "C2", "D"]}}
-    ts_years = 11
-
-    return create_output_csv_tidy(df, collection, org_level, breakdown,
-                                  measure_column, part, table_code, sort_on,
-                                  measure_order, column_rename,
-                                  filter_condition, visible_condition,
-                                  breakdown_subgroup, ts_years)
-
-
-def create_csv_uptake_bsu(df):
-    collection = "KC62"
-    org_level = "local"
-    breakdown = ["Row_Def", "Table_Code"]
-    measure_column = "Col_Def"
-    part = ["1"]
-    table_code = ["A", "B", "C1", "C2", "D"]
-    sort_on = ["CollectionYearRange", "Row_Def", "Table_Code"]
-    measure_order = ["Uptake"]
-    column_rename = {"Row_Def": "Age_Band"}
-    filter_condition = "(Row_Def in['50-52', '53-54', '55-59', '60-64', '65-69', '70'])"
-    visible_condition = "(Row_Def in['50<71'])"
-    breakdown_subgroup = {"Row_Def": {"50<71": ["50-52", "53-54", "55-59",
-                                                "60-64", "65-69", "70"]},
-                          "Table_Code": {"A and C1": ["A", "C1"],
-                                         "A to C2": ["A", "B", "C1", "C2"],
-                                         "A to D": ["A", "B", "C1", "C2", "D"]}}
-    ts_years = 11
-
-    return create_output_csv_tidy(df, collection, org_level, breakdown,
-                                  measure_column, part, table_code, sort_on,
-                                  measure_order, column_rename,
-                                  filter_condition, visible_condition,
-                                  breakdown_subgroup, ts_years)
-
-
-def create_csv_referral_national(df):
-    collection = "KC62"
-    org_level = "national"
-    breakdown = ["Row_Def", "Table_Code"]
-    measure_column = "Col_Def"
-    part = ["1", "2"]
-    table_code = ["A", "B", "C1", "C2", "D", "E", "F1", "F2"]
-    sort_on = ["CollectionYearRange", "Row_Def", "Table_Code"]
-    measure_order = ["Initial_referred", "Percent_assessment",
-                     "Referral_cyt_bio", "Open_biop_total", "Final_STR",
-                     "Percent_STR"]
-    column_rename = {"Row_Def": "Age_Band"}
-    filter_condition = "(Row_Def not in['<=44'])"
-    visible_condition = "(Row_Def not in['65-69', '70', '71-74', '>=75'])"
-    breakdown_subgroup = {"Row_Def": {"50<71": ["50-52", "53-54", "55-59",
-                                                "60-64", "65-69", "70"],
-                                      "45-74": ["45-49", "50-52", "53-54",
-                                                "55-59", "60-64", "65-69",
-                                                "70", "71-74"],
-                                      "45 and over": ["45-74", ">=75"],
-                                      "65-70": ["65-69", "70"],
-                                      "Over 70": ["71-74", ">=75"]},
-                          "Table_Code": {"A to F2": ["A", "B", "C1", "C2",
-                                                     "D", "E", "F1", "F2"]}}
-    ts_years = 11
-
-    return create_output_csv_tidy(df, collection, org_level, breakdown,
-                                  measure_column, part, table_code, sort_on,
-                                  measure_order, column_rename,
-                                  filter_condition, visible_condition,
-                                  breakdown_subgroup, ts_years)
-
-
-def create_csv_referral_region(df):
-    collection = "KC62"
-    org_level = "regional"
-    breakdown = ["Row_Def", "Table_Code"]
-    measure_column = "Col_Def"
-    part = ["1", "2"]
-    table_code = ["A", "B", "C1", "C2", "D", "E", "F1", "F2"]
-    sort_on = ["CollectionYearRange", "Row_Def", "Table_Code"]
-    measure_order = ["Initial_referred", "Percent_assessment",
-                     "Referral_cyt_bio", "Open_biop_total", "Final_STR",
-                     "Percent_STR"]
-    column_rename = {"Row_Def": "Age_Band"}
-    filter_condition = "(Row_Def not in['<=44'])"
-    visible_condition = "(Row_Def in['50<71', '45 and over']) & (Table_Code in['A to F2'])"
-    breakdown_subgroup = {"Row_Def": {"50<71": ["50-52", "53-54", "55-59",
-                                                "60-64", "65-69", "70"],
-                                      "45-74": ["45-49", "50-52", "53-54",
-                                                "55-59", "60-64", "65-69",
-                                                "70", "71-74"],
-                                      "45 and over": ["45-74", ">=75"]},
-                          "Table_Code": {"A to F2": ["A", "B", "C1", "C2",
-                                                     "D", "E", "F1", "F2"]}}
-    ts_years = 11
-
-    return create_output_csv_tidy(df, collection, org_level, breakdown,
-                                  measure_column, part, table_code, sort_on,
-                                  measure_order, column_rename,
-                                  filter_condition, visible_condition,
-                                  breakdown_subgroup, ts_years)
-
-
-def create_csv_referral_bsu(df):
-    collection = "KC62"
-    org_level = "local"
-    breakdown = ["Row_Def", "Table_Code"]
-    measure_column = "Col_Def"
-    part = ["1", "2"]
-    table_code = ["A", "B", "C1", "C2", "D", "E", "F1", "F2"]
-    sort_on = ["CollectionYearRange", "Row_Def", "Table_Code"]
-    measure_order = ["Percent_assessment"]
-    column_rename = {"Row_Def": "Age_Band"}
-    filter_condition = "(Row_Def not in['<=44'])"
-    visible_condition = "(Row_Def in['50<71', '45 and over']) & (Table_Code in['A to F2'])"
-    breakdown_subgroup = {"Row_Def": {"50<71": ["50-52", "53-54", "55-59",
-                                                "60-64", "65-69", "70"],
-                                      "45-74": ["45-49", "50-52", "53-54",
-                                                "55-59", "60-64", "65-69",
-                                                "70", "71-74"],
-                                      "45 and over": ["45-74", ">=75"]},
-                          "Table_Code": {"A to F2": ["A", "B", "C1", "C2",
-                                                     "D", "E", "F1", "F2"]}}
-    ts_years = 11
-
-    return create_output_csv_tidy(df, collection, org_level, breakdown,
-                                  measure_column, part, table_code, sort_on,
-                                  measure_order, column_rename,
-                                  filter_condition, visible_condition,
-                                  breakdown_subgroup, ts_years)
-
-
-def create_csv_cancers_national(df):
-    collection = "KC62"
-    org_level = "national"
-    breakdown = ["Row_Def", "Table_Code"]
-    measure_column = "Col_Def"
-    part = ["1", "3"]
-    table_code = ["A", "B", "C1", "C2", "D", "E", "F1", "F2"]
-    sort_on = ["CollectionYearRange", "Row_Def", "Table_Code"]
-    measure_order = ["Total_with_cancer", "Invasive_total",
-                     "Non_or_micro_invasive", "Cancer_non_microinvasive",
-                     "Cancer_microinvasive", "Small_invasive",
-                     "Invasive_not_known", "Invasive_lessthan10mm",
-                     "Invasive_10mmto15mm", "Invasive_15mmto20mm",
-                     "Invasive_20mmto50mm", "Invasive_50mmplus",
-                     "Invasive_unknown", "Rate_with_cancer",
-                     "Rate_non_or_micro_invasive", "Rate_small_invasive",
-                     "Percent_small_invasive"]
-    column_rename = {"Row_Def": "Age_Band"}
-    filter_condition = "(Row_Def not in['<=44'])"
-    visible_condition = "(Row_Def not in['65-69', '70', '71-74', '>=75'])"
-    breakdown_subgroup = {"Row_Def": {"50<71": ["50-52", "53-54", "55-59",
-                                                "60-64", "65-69", "70"],
-                                      "45-74": ["45-49", "50-52", "53-54",
-                                                "55-59", "60-64", "65-69",
-                                                "70", "71-74"],
-                                      "45 and over": ["45-74", ">=75"],
-                                      "65-70": ["65-69", "70"],
-                                      "Over 70": ["71-74", ">=75"]},
-                          "Table_Code": {"A to F2": ["A", "B", "C1", "C2",
-                                                     "D", "E", "F1", "F2"]}}
-    ts_years = 11
-
-    return create_output_csv_tidy(df, collection, org_level, breakdown,
-                                  measure_column, part, table_code, sort_on,
-                                  measure_order, column_rename,
-                                  filter_condition, visible_condition,
-                                  breakdown_subgroup, ts_years)
-
-
-def create_csv_cancers_region(df):
-    collection = "KC62"
-    org_level = "regional"
-    breakdown = ["Row_Def", "Table_Code"]
-    measure_column = "Col_Def"
-    part = ["1", "3"]
-    table_code = ["A", "B", "C1", "C2", "D", "E", "F1", "F2"]
-    sort_on = ["CollectionYearRange", "Row_Def", "Table_Code"]
-    measure_order = ["Total_with_cancer", "Invasive_total",
-                     "Non_or_micro_invasive", "Cancer_non_microinvasive",
-                     "Cancer_microinvasive", "Small_invasive",
-                     "Invasive_not_known", "Invasive_lessthan10mm",
-                     "Invasive_10mmto15mm", "Invasive_15mmto20mm",
-                     "Invasive_20mmto50mm", "Invasive_50mmplus",
-                     "Invasive_unknown", "Rate_with_cancer",
-                     "Rate_non_or_micro_invasive", "Rate_small_invasive",
-                     "Percent_small_invasive"]
-    filter_condition = "(Row_Def not in['<=44'])"
-    column_rename = {"Row_Def": "Age_Band"}
-    visible_condition = "(Row_Def in['50<71', '45 and over']) & (Table_Code in['A to F2'])"
-    breakdown_subgroup = {"Row_Def": {"50<71": ["50-52", "53-54", "55-59",
-                                                "60-64", "65-69", "70"],
-                                      "45-74": ["45-49", "50-52", "53-54",
-                                                "55-59", "60-64", "65-69",
-                                                "70", "71-74"],
-                                      "45 and over": ["45-74", ">=75"]},
-                          "Table_Code": {"A to F2": ["A", "B", "C1", "C2",
-                                                     "D", "E", "F1", "F2"]}}
-    ts_years = 11
-
-    return create_output_csv_tidy(df, collection, org_level, breakdown,
-                                  measure_column, part, table_code, sort_on,
-                                  measure_order, column_rename,
-                                  filter_condition, visible_condition,
-                                  breakdown_subgroup, ts_years)
-
-
-def create_csv_cancers_bsu(df):
-    collection = "KC62"
-    org_level = "local"
-    breakdown = ["Row_Def", "Table_Code"]
-    measure_column = "Col_Def"
-    part = ["1", "3"]
-    table_code = ["A", "B", "C1", "C2", "D", "E", "F1", "F2"]
-    sort_on = ["CollectionYearRange", "Row_Def", "Table_Code"]
-    measure_order = ["Total_with_cancer", "Rate_with_cancer",
-                     "Rate_non_or_micro_invasive", "Rate_small_invasive",
-                     "Percent_small_invasive"]
-    column_rename = {"Row_Def": "Age_Band"}
-    filter_condition = "(Row_Def not in['<=44'])"
-    visible_condition = "(Row_Def in['50<71', '45 and over']) & (Table_Code in['A to F2'])"
-    breakdown_subgroup = {"Row_Def": {"50<71": ["50-52", "53-54", "55-59",
-                                                "60-64", "65-69", "70"],
-                                      "45-74": ["45-49", "50-52", "53-54",
-                                                "55-59", "60-64", "65-69",
-                                                "70", "71-74"],
-                                      "45 and over": ["45-74", ">=75"]},
-                          "Table_Code": {"A to F2": ["A", "B", "C1", "C2",
-                                                     "D", "E", "F1", "F2"]}}
-    ts_years = 11
-
-    return create_output_csv_tidy(df, collection, org_level, breakdown,
-                                  measure_column, part, table_code, sort_on,
-                                  measure_order, column_rename,
-                                  filter_condition, visible_condition,
-                                  breakdown_subgroup, ts_years)
-
-
-def create_csv_diagnostic_all_national(df):
-    collection = "KC62"
-    org_level = "national"
-    breakdown = ["Row_Def", "Table_Code"]
-    measure_column = "Col_Def"
-    part = None
-    table_code = None
-    sort_on = ["CollectionYearRange", "Row_Def", "Table_Code"]
-    measure_order = ["Rate_benign_biopsy", "Rate_benign_biopsy_warning",
-                     "Non-op_diag_rate_invasive",
-                     "Non-op_diag_rate_non-invasive",
-                     "Rate_non_op_diagnosis", "Rate_non_op_diagnosis_warning"]
-    column_rename = {"Row_Def": "Age_Band"}
-    filter_condition = "((Table_Code == 'T' & Part =='4' & Row_Def == '50-70')) | ((Part in ['1','2'] & Row_Def not in['<=44', '45-49', '71-74', '>=75']))"
-    visible_condition = "(Row_Def in['50<71']) & (Table_Code in['A to F2'])"
-    breakdown_subgroup = {"Row_Def": {"50<71": ["50-52", "53-54", "55-59",
-                                                "60-64", "65-69", "70",
-                                                "50-70"]},
-                          "Table_Code": {"A to F2": ["A", "B", "C1", "C2",
-                                                     "D", "E", "F1", "F2",
-                                                     "T"]}}
-    ts_years = 11
-
-    return create_output_csv_tidy(df, collection, org_level, breakdown,
-                                  measure_column, part, table_code, sort_on,
-                                  measure_order, column_rename,
-                                  filter_condition, visible_condition,
-                                  breakdown_subgroup, ts_years)
-
-
-def create_csv_diagnostic_prevalent_national(df):
-    collection = "KC62"
-    org_level = "national"
-    breakdown = ["Row_Def", "Table_Code"]
-    measure_column = "Col_Def"
-    part = part = ["1", "2", "3"]
-    table_code = ["A", "B"]
-    sort_on = ["CollectionYearRange", "Row_Def", "Table_Code"]
-    measure_order = ["Rate_benign_biopsy", "Rate_benign_biopsy_warning",
-                     "Rate_non_op_diagnosis", "Rate_non_op_diagnosis_warning",
-                     "Rate_small_invasive", "Rate_small_invasive_warning",
-                     "SDR", "SDR_warning"]
-    column_rename = {"Row_Def": "Age_Band"}
-    filter_condition = "(Row_Def not in['<=44', '45-49', '71-74', '>=75'])"
-    visible_condition = "(Row_Def in['50<71']) & (Table_Code in['A and B'])"
-    breakdown_subgroup = {"Row_Def": {"50<71": ["50-52", "53-54", "55-59",
-                                                "60-64", "65-69", "70"]},
-                          "Table_Code": {"A and B": ["A", "B"]}}
-    ts_years = 11
-
-    return create_output_csv_tidy(df, collection, org_level, breakdown,
-                                  measure_column, part, table_code, sort_on,
-                                  measure_order, column_rename,
-                                  filter_condition, visible_condition,
-                                  breakdown_subgroup, ts_years)
-
-
-def create_csv_diagnostic_incident_national(df):
-    collection = "KC62"
-    org_level = "national"
-    breakdown = ["Row_Def", "Table_Code"]
-    measure_column = "Col_Def"
-    part = part = ["1", "2", "3"]
-    table_code = ["C1", "C2"]
-    sort_on = ["CollectionYearRange", "Row_Def", "Table_Code"]
-    measure_order = ["Rate_benign_biopsy", "Rate_benign_biopsy_warning",
-                     "Rate_non_op_diagnosis", "Rate_non_op_diagnosis_warning",
-                     "Rate_small_invasive", "Rate_small_invasive_warning",
-                     "SDR", "SDR_warning"]
-    filter_condition = "(Row_Def not in['<=44', '45-49', '71-74', '>=75'])"
-    column_rename = {"Row_Def": "Age_Band"}
-    visible_condition = "(Row_Def in['50<71']) & (Table_Code in['C1 and C2'])"
-    breakdown_subgroup = {"Row_Def": {"50<71": ["50-52", "53-54", "55-59",
-                                                "60-64", "65-69", "70"]},
-                          "Table_Code": {"C1 and C2": ["C1", "C2"]}}
-    ts_years = 11
-
-    return create_output_csv_tidy(df, collection, org_level, breakdown,
-                                  measure_column, part, table_code, sort_on,
-                                  measure_order, column_rename,
-                                  filter_condition, visible_condition,
-                                  breakdown_subgroup, ts_years)
-
-
-def create_csv_diagnostic_all_region(df):
-    collection = "KC62"
-    org_level = "regional"
-    breakdown = ["Row_Def", "Table_Code"]
-    measure_column = "Col_Def"
-    part = None
-    table_code = None
-    sort_on = ["CollectionYearRange", "Row_Def", "Table_Code"]
-    measure_order = ["Rate_benign_biopsy", "Rate_benign_biopsy_warning",
-                     "Non-op_diag_rate_invasive",
-                     "Non-op_diag_rate_non-invasive",
-                     "Rate_non_op_diagnosis", "Rate_non_op_diagnosis_warning"]
-    column_rename = {"Row_Def": "Age_Band"}
-    filter_condition = "((Table_Code == 'T' & Part =='4' & Row_Def == '50-70')) | ((Part in ['1','2'] & Row_Def not in['<=44', '45-49', '71-74', '>=75']))"
-    visible_condition = "(Row_Def in['50<71']) & (Table_Code in['A to F2'])"
-    breakdown_subgroup = {"Row_Def": {"50<71": ["50-52", "53-54", "55-59",
-                                                "60-64", "65-69", "70",
-                                                "50-70"]},
-                          "Table_Code": {"A to F2": ["A", "B", "C1", "C2",
-                                                     "D", "E", "F1", "F2",
-                                                     "T"]}}
-    ts_years = 11
-
-    return create_output_csv_tidy(df, collection, org_level, breakdown,
-                                  measure_column, part, table_code, sort_on,
-                                  measure_order, column_rename,
-                                  filter_condition, visible_condition,
-                                  breakdown_subgroup, ts_years)
-
-
-def create_csv_diagnostic_prevalent_region(df):
-    collection = "KC62"
-    org_level = "regional"
-    breakdown = ["Row_Def", "Table_Code"]
-    measure_column = "Col_Def"
-    part = part = ["1", "2", "3"]
-    table_code = ["A", "B"]
-    sort_on = ["CollectionYearRange", "Row_Def", "Table_Code"]
-    measure_order = ["Rate_benign_biopsy", "Rate_benign_biopsy_warning",
-                     "Rate_non_op_diagnosis", "Rate_non_op_diagnosis_warning",
-                     "Rate_small_invasive", "Rate_small_invasive_warning",
-                     "SDR", "SDR_warning"]
-    column_rename = {"Row_Def": "Age_Band"}
-    filter_condition = "(Row_Def not in['<=44', '45-49', '71-74', '>=75'])"
-    visible_condition = "(Row_Def in['50<71']) & (Table_Code in['A and B'])"
-    breakdown_subgroup = {"Row_Def": {"50<71": ["50-52", "53-54", "55-59",
-                                                "60-64", "65-69", "70"]},
-                          "Table_Code": {"A and B": ["A", "B"]}}
-    ts_years = 11
-
-    return create_output_csv_tidy(df, collection, org_level, breakdown,
-                                  measure_column, part, table_code, sort_on,
-                                  measure_order, column_rename,
-                                  filter_condition, visible_condition,
-                                  breakdown_subgroup, ts_years)
-
-
-def create_csv_diagnostic_incident_region(df):
-    collection = "KC62"
-    org_level = "regional"
-    breakdown = ["Row_Def", "Table_Code"]
-    measure_column = "Col_Def"
-    part = part = ["1", "2", "3"]
-    table_code = ["C1", "C2"]
-    sort_on = ["CollectionYearRange", "Row_Def", "Table_Code"]
-    measure_order = ["Rate_benign_biopsy", "Rate_benign_biopsy_warning",
-                     "Rate_non_op_diagnosis", "Rate_non_op_diagnosis_warning",
-                     "Rate_small_invasive", "Rate_small_invasive_warning",
-                     "SDR", "SDR_warning"]
-    column_rename = {"Row_Def": "Age_Band"}
-    filter_condition = "(Row_Def not in['<=44', '45-49', '71-74', '>=75'])"
-    visible_condition = "(Row_Def in['50<71']) & (Table_Code in['C1 and C2'])"
-    breakdown_subgroup = {"Row_Def": {"50<71": ["50-52", "53-54", "55-59",
-                                                "60-64", "65-69", "70"]},
-                          "Table_Code": {"C1 and C2": ["C1", "C2"]}}
-    ts_years = 11
-
-    return create_output_csv_tidy(df, collection, org_level, breakdown,
-                                  measure_column, part, table_code, sort_on,
-                                  measure_order, column_rename,
-                                  filter_condition, visible_condition,
-                                  breakdown_subgroup, ts_years)
-
-
-def create_csv_diagnostic_all_bsu(df):
-    collection = "KC62"
-    org_level = "local"
-    breakdown = ["Row_Def", "Table_Code"]
-    measure_column = "Col_Def"
-    part = None
-    table_code = None
-    sort_on = ["CollectionYearRange", "Row_Def", "Table_Code"]
-    measure_order = ["Rate_benign_biopsy", "Rate_benign_biopsy_warning",
-                     "Non-op_diag_rate_invasive",
-                     "Non-op_diag_rate_non-invasive",
-                     "Rate_non_op_diagnosis", "Rate_non_op_diagnosis_warning"]
-    column_rename = {"Row_Def": "Age_Band"}
-    filter_condition = "((Table_Code == 'T' & Part =='4' & Row_Def == '50-70')) | ((Part in ['1','2'] & Row_Def not in['<=44', '45-49', '71-74', '>=75']))"
-    visible_condition = "(Row_Def in['50<71']) & (Table_Code in['A to F2'])"
-    breakdown_subgroup = {"Row_Def": {"50<71": ["50-52", "53-54", "55-59",
-                                                "60-64", "65-69", "70",
-                                                "50-70"]},
-                          "Table_Code": {"A to F2": ["A", "B", "C1", "C2",
-                                                     "D", "E", "F1", "F2",
-                                                     "T"]}}
-    ts_years = 11
-
-    return create_output_csv_tidy(df, collection, org_level, breakdown,
-                                  measure_column, part, table_code, sort_on,
-                                  measure_order, column_rename,
-                                  filter_condition, visible_condition,
-                                  breakdown_subgroup, ts_years)
-
-
-def create_csv_diagnostic_prevalent_bsu(df):
-    collection = "KC62"
-    org_level = "local"
-    breakdown = ["Row_Def", "Table_Code"]
-    measure_column = "Col_Def"
-    part = part = ["1", "2", "3"]
-    table_code = ["A", "B"]
-    sort_on = ["CollectionYearRange", "Row_Def", "Table_Code"]
-    measure_order = ["Rate_benign_biopsy", "Rate_benign_biopsy_warning",
-                     "Rate_non_op_diagnosis", "Rate_non_op_diagnosis_warning",
-                     "Rate_small_invasive", "Rate_small_invasive_warning",
-                     "SDR", "SDR_warning"]
-    column_rename = {"Row_Def": "Age_Band"}
-    filter_condition = "(Row_Def not in['<=44', '45-49', '71-74', '>=75'])"
-    visible_condition = "(Row_Def in['50<71']) & (Table_Code in['A and B'])"
-    breakdown_subgroup = {"Row_Def": {"50<71": ["50-52", "53-54", "55-59",
-                                                "60-64", "65-69", "70"]},
-                          "Table_Code": {"A and B": ["A", "B"]}}
-    ts_years = 11
-
-    return create_output_csv_tidy(df, collection, org_level, breakdown,
-                                  measure_column, part, table_code, sort_on,
-                                  measure_order, column_rename,
-                                  filter_condition, visible_condition,
-                                  breakdown_subgroup, ts_years)
-
-
-def create_csv_diagnostic_incident_bsu(df):
-    collection = "KC62"
-    org_level = "local"
-    breakdown = ["Row_Def", "Table_Code"]
-    measure_column = "Col_Def"
-    part = part = ["1", "2", "3"]
-    table_code = ["C1", "C2"]
-    sort_on = ["CollectionYearRange", "Row_Def", "Table_Code"]
-    measure_order = ["Rate_benign_biopsy", "Rate_benign_biopsy_warning",
-                     "Rate_non_op_diagnosis", "Rate_non_op_diagnosis_warning",
-                     "Rate_small_invasive", "Rate_small_invasive_warning",
-                     "SDR", "SDR_warning"]
-    column_rename = {"Row_Def": "Age_Band"}
-    filter_condition = "(Row_Def not in['<=44', '45-49', '71-74', '>=75'])"
-    visible_condition = "(Row_Def in['50<71']) & (Table_Code in['C1 and C2'])"
-    breakdown_subgroup = {"Row_Def": {"50<71": ["50-52", "53-54", "55-59",
-                                                "60-64", "65-69", "70"]},
-                          "Table_Code": {"C1 and C2": ["C1", "C2"]}}
-    ts_years = 11
-
-    return create_output_csv_tidy(df, collection, org_level, breakdown,
-                                  measure_column, part, table_code, sort_on,
-                                  measure_order, column_rename,
-                                  filter_condition, visible_condition,
-                                  breakdown_subgroup, ts_years)
+create_csv_coverage_national = CsvTidySpec(
+    name="create_csv_coverage_national",
+    collection="KC63",
+    org_level="national",
+    breakdown=["Row_Def"],
+    measure_column="Col_Def",
+    part=["1"],
+    table_code=None,
+    sort_on=["CollectionYearRange", "Row_Def"],
+    measure_order=["Women_resident", "Women_ineligible", "Women_eligible",
+                   "Women_never_screened", "Percent_never_screened",
+                   "Women_screened_less3yrs", "Coverage"],
+    column_rename={"Row_Def": "Age_Band"},
+    filter_condition="(Row_Def not in['<45','>=75'])",
+    visible_condition=None,
+    breakdown_subgroup={"Row_Def": {"53<71": ["53-54", "55-59", "60-64",
+                                              "65-69", "70"]}},
+    ts_years=11)
+
+
+create_csv_coverage_region = CsvTidySpec(
+    name="create_csv_coverage_region",
+    collection="KC63",
+    org_level="regional",
+    breakdown=["Row_Def"],
+    measure_column="Col_Def",
+    part=["1"],
+    table_code=None,
+    sort_on=["CollectionYearRange", "Row_Def"],
+    measure_order=["Women_resident", "Women_ineligible", "Women_eligible",
+                   "Women_never_screened", "Percent_never_screened",
+                   "Women_screened_less3yrs", "Coverage"],
+    column_rename={"Row_Def": "Age_Band"},
+    filter_condition="(Row_Def in['53-54', '55-59', '60-64', '65-69', '70'])",
+    visible_condition="(Row_Def not in['53-54', '55-59', '60-64', '65-69', '70'])",
+    breakdown_subgroup={"Row_Def": {"53<71": ["53-54", "55-59", "60-64",
+                                              "65-69", "70"]}},
+    ts_years=11)
+
+
+create_csv_coverage_la = CsvTidySpec(
+    name="create_csv_coverage_la",
+    collection="KC63",
+    org_level="local",
+    breakdown=["Row_Def"],
+    measure_column="Col_Def",
+    part=["1"],
+    table_code=None,
+    sort_on=["CollectionYearRange", "Row_Def"],
+    measure_order=["Women_eligible", "Women_screened_less3yrs", "Coverage"],
+    column_rename={"Row_Def": "Age_Band"},
+    filter_condition="(Row_Def in['53-54', '55-59', '60-64', '65-69', '70'])",
+    visible_condition="(Row_Def not in['53-54', '55-59', '60-64', '65-69', '70'])",
+    breakdown_subgroup={"Row_Def": {"53<71": ["53-54", "55-59", "60-64",
+                                              "65-69", "70"]}},
+    ts_years=11)
+
+
+create_csv_uptake_national = CsvTidySpec(
+    name="create_csv_uptake_national",
+    collection="KC62",
+    org_level="national",
+    breakdown=["Row_Def", "Table_Code"],
+    measure_column="Col_Def",
+    part=["1"],
+    table_code=["A", "B", "C1", "C2", "D"],
+    sort_on=["CollectionYearRange", "Row_Def", "Table_Code"],
+    measure_order=["Screened", "Invited", "Uptake"],
+    column_rename={"Row_Def": "Age_Band"},
+    filter_condition="(Row_Def not in['<=44'])",
+    visible_condition="(Row_Def not in['65-69', '70', '71-74', '>=75'])",
+    breakdown_subgroup={"Row_Def": {"50<71": ["50-52", "53-54", "55-59",
+                                              "60-64", "65-69", "70"],
+                                    "45-74": ["45-49", "50-52", "53-54",
+                                              "55-59", "60-64", "65-69",
+                                              "70", "71-74"],
+                                    "65-70": ["65-69", "70"],
+                                    "Over 70": ["71-74", ">=75"]},
+                        "Table_Code": {"A and C1": ["A", "C1"],
+                                       "A to C2": ["A", "B", "C1", "C2"],
+                                       "A to D": ["A", "B", "C1", "C2", "D"]}},
+    ts_years=11)
+
+
+create_csv_uptake_self_gp_national = CsvTidySpec(
+    name="create_csv_uptake_self_gp_national",
+    collection="KC62",
+    org_level="national",
+    breakdown=["Row_Def", "Table_Code"],
+    measure_column="Col_Def",
+    part=["1"],
+    table_code=["E", "F1", "F2"],
+    sort_on=["CollectionYearRange", "Row_Def", "Table_Code"],
+    measure_order=["Screened"],
+    column_rename={"Row_Def": "Age_Band"},
+    filter_condition="(Row_Def not in['<=44'])",
+    visible_condition="(Row_Def not in['65-69', '70', '71-74', '>=75'])",
+    breakdown_subgroup={"Row_Def": {"50<71": ["50-52", "53-54", "55-59",
+                                              "60-64", "65-69", "70"],
+                                    "45-74": ["45-49", "50-52", "53-54",
+                                              "55-59", "60-64", "65-69",
+                                              "70", "71-74"],
+                                    "65-70": ["65-69", "70"],
+                                    "Over 70": ["71-74", ">=75"]}},
+    ts_years=11)
+
+
+create_csv_uptake_region = CsvTidySpec(
+    name="create_csv_uptake_region",
+    collection="KC62",
+    org_level="regional",
+    breakdown=["Row_Def", "Table_Code"],
+    measure_column="Col_Def",
+    part=["1"],
+    table_code=["A", "B", "C1", "C2", "D"],
+    sort_on=["CollectionYearRange", "Row_Def", "Table_Code"],
+    measure_order=["Screened", "Invited", "Uptake"],
+    column_rename={"Row_Def": "Age_Band"},
+    filter_condition="(Row_Def in['50-52', '53-54', '55-59', '60-64', '65-69', '70'])",
+    visible_condition="(Row_Def in['50<71'])",
+    breakdown_subgroup={"Row_Def": {"50<71": ["50-52", "53-54", "55-59",
+                                              "60-64", "65-69", "70"]},
+                        "Table_Code": {"A and C1": ["A", "C1"],
+                                       "A to C2": ["A", "B", "C1", "C2"],
+                                       "A to D": ["A", "B", "C1", "C2", "D"]}},
+    ts_years=11)
+
+
+create_csv_uptake_bsu = CsvTidySpec(
+    name="create_csv_uptake_bsu",
+    collection="KC62",
+    org_level="local",
+    breakdown=["Row_Def", "Table_Code"],
+    measure_column="Col_Def",
+    part=["1"],
+    table_code=["A", "B", "C1", "C2", "D"],
+    sort_on=["CollectionYearRange", "Row_Def", "Table_Code"],
+    measure_order=["Uptake"],
+    column_rename={"Row_Def": "Age_Band"},
+    filter_condition="(Row_Def in['50-52', '53-54', '55-59', '60-64', '65-69', '70'])",
+    visible_condition="(Row_Def in['50<71'])",
+    breakdown_subgroup={"Row_Def": {"50<71": ["50-52", "53-54", "55-59",
+                                              "60-64", "65-69", "70"]},
+                        "Table_Code": {"A and C1": ["A", "C1"],
+                                       "A to C2": ["A", "B", "C1", "C2"],
+                                       "A to D": ["A", "B", "C1", "C2", "D"]}},
+    ts_years=11)
+
+
+create_csv_referral_national = CsvTidySpec(
+    name="create_csv_referral_national",
+    collection="KC62",
+    org_level="national",
+    breakdown=["Row_Def", "Table_Code"],
+    measure_column="Col_Def",
+    part=["1", "2"],
+    table_code=["A", "B", "C1", "C2", "D", "E", "F1", "F2"],
+    sort_on=["CollectionYearRange", "Row_Def", "Table_Code"],
+    measure_order=["Initial_referred", "Percent_assessment",
+                   "Referral_cyt_bio", "Open_biop_total", "Final_STR",
+                   "Percent_STR"],
+    column_rename={"Row_Def": "Age_Band"},
+    filter_condition="(Row_Def not in['<=44'])",
+    visible_condition="(Row_Def not in['65-69', '70', '71-74', '>=75'])",
+    breakdown_subgroup={"Row_Def": {"50<71": ["50-52", "53-54", "55-59",
+                                              "60-64", "65-69", "70"],
+                                    "45-74": ["45-49", "50-52", "53-54",
+                                              "55-59", "60-64", "65-69",
+                                              "70", "71-74"],
+                                    "45 and over": ["45-74", ">=75"],
+                                    "65-70": ["65-69", "70"],
+                                    "Over 70": ["71-74", ">=75"]},
+                        "Table_Code": {"A to F2": ["A", "B", "C1", "C2",
+                                                   "D", "E", "F1", "F2"]}},
+    ts_years=11)
+
+
+create_csv_referral_region = CsvTidySpec(
+    name="create_csv_referral_region",
+    collection="KC62",
+    org_level="regional",
+    breakdown=["Row_Def", "Table_Code"],
+    measure_column="Col_Def",
+    part=["1", "2"],
+    table_code=["A", "B", "C1", "C2", "D", "E", "F1", "F2"],
+    sort_on=["CollectionYearRange", "Row_Def", "Table_Code"],
+    measure_order=["Initial_referred", "Percent_assessment",
+                   "Referral_cyt_bio", "Open_biop_total", "Final_STR",
+                   "Percent_STR"],
+    column_rename={"Row_Def": "Age_Band"},
+    filter_condition="(Row_Def not in['<=44'])",
+    visible_condition="(Row_Def in['50<71', '45 and over']) & (Table_Code in['A to F2'])",
+    breakdown_subgroup={"Row_Def": {"50<71": ["50-52", "53-54", "55-59",
+                                              "60-64", "65-69", "70"],
+                                    "45-74": ["45-49", "50-52", "53-54",
+                                              "55-59", "60-64", "65-69",
+                                              "70", "71-74"],
+                                    "45 and over": ["45-74", ">=75"]},
+                        "Table_Code": {"A to F2": ["A", "B", "C1", "C2",
+                                                   "D", "E", "F1", "F2"]}},
+    ts_years=11)
+
+
+create_csv_referral_bsu = CsvTidySpec(
+    name="create_csv_referral_bsu",
+    collection="KC62",
+    org_level="local",
+    breakdown=["Row_Def", "Table_Code"],
+    measure_column="Col_Def",
+    part=["1", "2"],
+    table_code=["A", "B", "C1", "C2", "D", "E", "F1", "F2"],
+    sort_on=["CollectionYearRange", "Row_Def", "Table_Code"],
+    measure_order=["Percent_assessment"],
+    column_rename={"Row_Def": "Age_Band"},
+    filter_condition="(Row_Def not in['<=44'])",
+    visible_condition="(Row_Def in['50<71', '45 and over']) & (Table_Code in['A to F2'])",
+    breakdown_subgroup={"Row_Def": {"50<71": ["50-52", "53-54", "55-59",
+                                              "60-64", "65-69", "70"],
+                                    "45-74": ["45-49", "50-52", "53-54",
+                                              "55-59", "60-64", "65-69",
+                                              "70", "71-74"],
+                                    "45 and over": ["45-74", ">=75"]},
+                        "Table_Code": {"A to F2": ["A", "B", "C1", "C2",
+                                                   "D", "E", "F1", "F2"]}},
+    ts_years=11)
+
+
+create_csv_cancers_national = CsvTidySpec(
+    name="create_csv_cancers_national",
+    collection="KC62",
+    org_level="national",
+    breakdown=["Row_Def", "Table_Code"],
+    measure_column="Col_Def",
+    part=["1", "3"],
+    table_code=["A", "B", "C1", "C2", "D", "E", "F1", "F2"],
+    sort_on=["CollectionYearRange", "Row_Def", "Table_Code"],
+    measure_order=["Total_with_cancer", "Invasive_total",
+                   "Non_or_micro_invasive", "Cancer_non_microinvasive",
+                   "Cancer_microinvasive", "Small_invasive",
+                   "Invasive_not_known", "Invasive_lessthan10mm",
+                   "Invasive_10mmto15mm", "Invasive_15mmto20mm",
+                   "Invasive_20mmto50mm", "Invasive_50mmplus",
+                   "Invasive_unknown", "Rate_with_cancer",
+                   "Rate_non_or_micro_invasive", "Rate_small_invasive",
+                   "Percent_small_invasive"],
+    column_rename={"Row_Def": "Age_Band"},
+    filter_condition="(Row_Def not in['<=44'])",
+    visible_condition="(Row_Def not in['65-69', '70', '71-74', '>=75'])",
+    breakdown_subgroup={"Row_Def": {"50<71": ["50-52", "53-54", "55-59",
+                                              "60-64", "65-69", "70"],
+                                    "45-74": ["45-49", "50-52", "53-54",
+                                              "55-59", "60-64", "65-69",
+                                              "70", "71-74"],
+                                    "45 and over": ["45-74", ">=75"],
+                                    "65-70": ["65-69", "70"],
+                                    "Over 70": ["71-74", ">=75"]},
+                        "Table_Code": {"A to F2": ["A", "B", "C1", "C2",
+                                                   "D", "E", "F1", "F2"]}},
+    ts_years=11)
+
+
+create_csv_cancers_region = CsvTidySpec(
+    name="create_csv_cancers_region",
+    collection="KC62",
+    org_level="regional",
+    breakdown=["Row_Def", "Table_Code"],
+    measure_column="Col_Def",
+    part=["1", "3"],
+    table_code=["A", "B", "C1", "C2", "D", "E", "F1", "F2"],
+    sort_on=["CollectionYearRange", "Row_Def", "Table_Code"],
+    measure_order=["Total_with_cancer", "Invasive_total",
+                   "Non_or_micro_invasive", "Cancer_non_microinvasive",
+                   "Cancer_microinvasive", "Small_invasive",
+                   "Invasive_not_known", "Invasive_lessthan10mm",
+                   "Invasive_10mmto15mm", "Invasive_15mmto20mm",
+                   "Invasive_20mmto50mm", "Invasive_50mmplus",
+                   "Invasive_unknown", "Rate_with_cancer",
+                   "Rate_non_or_micro_invasive", "Rate_small_invasive",
+                   "Percent_small_invasive"],
+    column_rename={"Row_Def": "Age_Band"},
+    filter_condition="(Row_Def not in['<=44'])",
+    visible_condition="(Row_Def in['50<71', '45 and over']) & (Table_Code in['A to F2'])",
+    breakdown_subgroup={"Row_Def": {"50<71": ["50-52", "53-54", "55-59",
+                                              "60-64", "65-69", "70"],
+                                    "45-74": ["45-49", "50-52", "53-54",
+                                              "55-59", "60-64", "65-69",
+                                              "70", "71-74"],
+                                    "45 and over": ["45-74", ">=75"]},
+                        "Table_Code": {"A to F2": ["A", "B", "C1", "C2",
+                                                   "D", "E", "F1", "F2"]}},
+    ts_years=11)
+
+
+create_csv_cancers_bsu = CsvTidySpec(
+    name="create_csv_cancers_bsu",
+    collection="KC62",
+    org_level="local",
+    breakdown=["Row_Def", "Table_Code"],
+    measure_column="Col_Def",
+    part=["1", "3"],
+    table_code=["A", "B", "C1", "C2", "D", "E", "F1", "F2"],
+    sort_on=["CollectionYearRange", "Row_Def", "Table_Code"],
+    measure_order=["Total_with_cancer", "Rate_with_cancer",
+                   "Rate_non_or_micro_invasive", "Rate_small_invasive",
+                   "Percent_small_invasive"],
+    column_rename={"Row_Def": "Age_Band"},
+    filter_condition="(Row_Def not in['<=44'])",
+    visible_condition="(Row_Def in['50<71', '45 and over']) & (Table_Code in['A to F2'])",
+    breakdown_subgroup={"Row_Def": {"50<71": ["50-52", "53-54", "55-59",
+                                              "60-64", "65-69", "70"],
+                                    "45-74": ["45-49", "50-52", "53-54",
+                                              "55-59", "60-64", "65-69",
+                                              "70", "71-74"],
+                                    "45 and over": ["45-74", ">=75"]},
+                        "Table_Code": {"A to F2": ["A", "B", "C1", "C2",
+                                                   "D", "E", "F1", "F2"]}},
+    ts_years=11)
+
+
+create_csv_diagnostic_all_national = CsvTidySpec(
+    name="create_csv_diagnostic_all_national",
+    collection="KC62",
+    org_level="national",
+    breakdown=["Row_Def", "Table_Code"],
+    measure_column="Col_Def",
+    part=None,
+    table_code=None,
+    sort_on=["CollectionYearRange", "Row_Def", "Table_Code"],
+    measure_order=["Rate_benign_biopsy", "Rate_benign_biopsy_warning",
+                   "Non-op_diag_rate_invasive",
+                   "Non-op_diag_rate_non-invasive",
+                   "Rate_non_op_diagnosis", "Rate_non_op_diagnosis_warning"],
+    column_rename={"Row_Def": "Age_Band"},
+    filter_condition="((Table_Code == 'T' & Part =='4' & Row_Def == '50-70')) | ((Part in ['1','2'] & Row_Def not in['<=44', '45-49', '71-74', '>=75']))",
+    visible_condition="(Row_Def in['50<71']) & (Table_Code in['A to F2'])",
+    breakdown_subgroup={"Row_Def": {"50<71": ["50-52", "53-54", "55-59",
+                                              "60-64", "65-69", "70",
+                                              "50-70"]},
+                        "Table_Code": {"A to F2": ["A", "B", "C1", "C2",
+                                                   "D", "E", "F1", "F2",
+                                                   "T"]}},
+    ts_years=11)
+
+
+create_csv_diagnostic_prevalent_national = CsvTidySpec(
+    name="create_csv_diagnostic_prevalent_national",
+    collection="KC62",
+    org_level="national",
+    breakdown=["Row_Def", "Table_Code"],
+    measure_column="Col_Def",
+    part=["1", "2", "3"],
+    table_code=["A", "B"],
+    sort_on=["CollectionYearRange", "Row_Def", "Table_Code"],
+    measure_order=["Rate_benign_biopsy", "Rate_benign_biopsy_warning",
+                   "Rate_non_op_diagnosis", "Rate_non_op_diagnosis_warning",
+                   "Rate_small_invasive", "Rate_small_invasive_warning",
+                   "SDR", "SDR_warning"],
+    column_rename={"Row_Def": "Age_Band"},
+    filter_condition="(Row_Def not in['<=44', '45-49', '71-74', '>=75'])",
+    visible_condition="(Row_Def in['50<71']) & (Table_Code in['A and B'])",
+    breakdown_subgroup={"Row_Def": {"50<71": ["50-52", "53-54", "55-59",
+                                              "60-64", "65-69", "70"]},
+                        "Table_Code": {"A and B": ["A", "B"]}},
+    ts_years=11)
+
+
+create_csv_diagnostic_incident_national = CsvTidySpec(
+    name="create_csv_diagnostic_incident_national",
+    collection="KC62",
+    org_level="national",
+    breakdown=["Row_Def", "Table_Code"],
+    measure_column="Col_Def",
+    part=["1", "2", "3"],
+    table_code=["C1", "C2"],
+    sort_on=["CollectionYearRange", "Row_Def", "Table_Code"],
+    measure_order=["Rate_benign_biopsy", "Rate_benign_biopsy_warning",
+                   "Rate_non_op_diagnosis", "Rate_non_op_diagnosis_warning",
+                   "Rate_small_invasive", "Rate_small_invasive_warning",
+                   "SDR", "SDR_warning"],
+    column_rename={"Row_Def": "Age_Band"},
+    filter_condition="(Row_Def not in['<=44', '45-49', '71-74', '>=75'])",
+    visible_condition="(Row_Def in['50<71']) & (Table_Code in['C1 and C2'])",
+    breakdown_subgroup={"Row_Def": {"50<71": ["50-52", "53-54", "55-59",
+                                              "60-64", "65-69", "70"]},
+                        "Table_Code": {"C1 and C2": ["C1", "C2"]}},
+    ts_years=11)
+
+
+create_csv_diagnostic_all_region = CsvTidySpec(
+    name="create_csv_diagnostic_all_region",
+    collection="KC62",
+    org_level="regional",
+    breakdown=["Row_Def", "Table_Code"],
+    measure_column="Col_Def",
+    part=None,
+    table_code=None,
+    sort_on=["CollectionYearRange", "Row_Def", "Table_Code"],
+    measure_order=["Rate_benign_biopsy", "Rate_benign_biopsy_warning",
+                   "Non-op_diag_rate_invasive",
+                   "Non-op_diag_rate_non-invasive",
+                   "Rate_non_op_diagnosis", "Rate_non_op_diagnosis_warning"],
+    column_rename={"Row_Def": "Age_Band"},
+    filter_condition="((Table_Code == 'T' & Part =='4' & Row_Def == '50-70')) | ((Part in ['1','2'] & Row_Def not in['<=44', '45-49', '71-74', '>=75']))",
+    visible_condition="(Row_Def in['50<71']) & (Table_Code in['A to F2'])",
+    breakdown_subgroup={"Row_Def": {"50<71": ["50-52", "53-54", "55-59",
+                                              "60-64", "65-69", "70",
+                                              "50-70"]},
+                        "Table_Code": {"A to F2": ["A", "B", "C1", "C2",
+                                                   "D", "E", "F1", "F2",
+                                                   "T"]}},
+    ts_years=11)
+
+
+create_csv_diagnostic_prevalent_region = CsvTidySpec(
+    name="create_csv_diagnostic_prevalent_region",
+    collection="KC62",
+    org_level="regional",
+    breakdown=["Row_Def", "Table_Code"],
+    measure_column="Col_Def",
+    part=["1", "2", "3"],
+    table_code=["A", "B"],
+    sort_on=["CollectionYearRange", "Row_Def", "Table_Code"],
+    measure_order=["Rate_benign_biopsy", "Rate_benign_biopsy_warning",
+                   "Rate_non_op_diagnosis", "Rate_non_op_diagnosis_warning",
+                   "Rate_small_invasive", "Rate_small_invasive_warning",
+                   "SDR", "SDR_warning"],
+    column_rename={"Row_Def": "Age_Band"},
+    filter_condition="(Row_Def not in['<=44', '45-49', '71-74', '>=75'])",
+    visible_condition="(Row_Def in['50<71']) & (Table_Code in['A and B'])",
+    breakdown_subgroup={"Row_Def": {"50<71": ["50-52", "53-54", "55-59",
+                                              "60-64", "65-69", "70"]},
+                        "Table_Code": {"A and B": ["A", "B"]}},
+    ts_years=11)
+
+
+create_csv_diagnostic_incident_region = CsvTidySpec(
+    name="create_csv_diagnostic_incident_region",
+    collection="KC62",
+    org_level="regional",
+    breakdown=["Row_Def", "Table_Code"],
+    measure_column="Col_Def",
+    part=["1", "2", "3"],
+    table_code=["C1", "C2"],
+    sort_on=["CollectionYearRange", "Row_Def", "Table_Code"],
+    measure_order=["Rate_benign_biopsy", "Rate_benign_biopsy_warning",
+                   "Rate_non_op_diagnosis", "Rate_non_op_diagnosis_warning",
+                   "Rate_small_invasive", "Rate_small_invasive_warning",
+                   "SDR", "SDR_warning"],
+    column_rename={"Row_Def": "Age_Band"},
+    filter_condition="(Row_Def not in['<=44', '45-49', '71-74', '>=75'])",
+    visible_condition="(Row_Def in['50<71']) & (Table_Code in['C1 and C2'])",
+    breakdown_subgroup={"Row_Def": {"50<71": ["50-52", "53-54", "55-59",
+                                              "60-64", "65-69", "70"]},
+                        "Table_Code": {"C1 and C2": ["C1", "C2"]}},
+    ts_years=11)
+
+
+create_csv_diagnostic_all_bsu = CsvTidySpec(
+    name="create_csv_diagnostic_all_bsu",
+    collection="KC62",
+    org_level="local",
+    breakdown=["Row_Def", "Table_Code"],
+    measure_column="Col_Def",
+    part=None,
+    table_code=None,
+    sort_on=["CollectionYearRange", "Row_Def", "Table_Code"],
+    measure_order=["Rate_benign_biopsy", "Rate_benign_biopsy_warning",
+                   "Non-op_diag_rate_invasive",
+                   "Non-op_diag_rate_non-invasive",
+                   "Rate_non_op_diagnosis", "Rate_non_op_diagnosis_warning"],
+    column_rename={"Row_Def": "Age_Band"},
+    filter_condition="((Table_Code == 'T' & Part =='4' & Row_Def == '50-70')) | ((Part in ['1','2'] & Row_Def not in['<=44', '45-49', '71-74', '>=75']))",
+    visible_condition="(Row_Def in['50<71']) & (Table_Code in['A to F2'])",
+    breakdown_subgroup={"Row_Def": {"50<71": ["50-52", "53-54", "55-59",
+                                              "60-64", "65-69", "70",
+                                              "50-70"]},
+                        "Table_Code": {"A to F2": ["A", "B", "C1", "C2",
+                                                   "D", "E", "F1", "F2",
+                                                   "T"]}},
+    ts_years=11)
+
+
+create_csv_diagnostic_prevalent_bsu = CsvTidySpec(
+    name="create_csv_diagnostic_prevalent_bsu",
+    collection="KC62",
+    org_level="local",
+    breakdown=["Row_Def", "Table_Code"],
+    measure_column="Col_Def",
+    part=["1", "2", "3"],
+    table_code=["A", "B"],
+    sort_on=["CollectionYearRange", "Row_Def", "Table_Code"],
+    measure_order=["Rate_benign_biopsy", "Rate_benign_biopsy_warning",
+                   "Rate_non_op_diagnosis", "Rate_non_op_diagnosis_warning",
+                   "Rate_small_invasive", "Rate_small_invasive_warning",
+                   "SDR", "SDR_warning"],
+    column_rename={"Row_Def": "Age_Band"},
+    filter_condition="(Row_Def not in['<=44', '45-49', '71-74', '>=75'])",
+    visible_condition="(Row_Def in['50<71']) & (Table_Code in['A and B'])",
+    breakdown_subgroup={"Row_Def": {"50<71": ["50-52", "53-54", "55-59",
+                                              "60-64", "65-69", "70"]},
+                        "Table_Code": {"A and B": ["A", "B"]}},
+    ts_years=11)
+
+
+create_csv_diagnostic_incident_bsu = CsvTidySpec(
+    name="create_csv_diagnostic_incident_bsu",
+    collection="KC62",
+    org_level="local",
+    breakdown=["Row_Def", "Table_Code"],
+    measure_column="Col_Def",
+    part=["1", "2", "3"],
+    table_code=["C1", "C2"],
+    sort_on=["CollectionYearRange", "Row_Def", "Table_Code"],
+    measure_order=["Rate_benign_biopsy", "Rate_benign_biopsy_warning",
+                   "Rate_non_op_diagnosis", "Rate_non_op_diagnosis_warning",
+                   "Rate_small_invasive", "Rate_small_invasive_warning",
+                   "SDR", "SDR_warning"],
+    column_rename={"Row_Def": "Age_Band"},
+    filter_condition="(Row_Def not in['<=44', '45-49', '71-74', '>=75'])",
+    visible_condition="(Row_Def in['50<71']) & (Table_Code in['C1 and C2'])",
+    breakdown_subgroup={"Row_Def": {"50<71": ["50-52", "53-54", "55-59",
+                                              "60-64", "65-69", "70"]},
+                        "Table_Code": {"C1 and C2": ["C1", "C2"]}},
+    ts_years=11)
@@ -1,8 +1,134 @@
 import bs_code.parameters as param
 import bs_code.utilities.helpers as helpers
+import bs_code.utilities.anomalies as anomalies
 import pandas as pd
 import numpy as np
 import logging
+from functools import lru_cache
+
+
+# Register of the percentage/rate measures that can be added by add_measures.
+# Each measure is defined by the numerator and denominator columns it is
+# calculated from, the multiplier applied (e.g. 100 for percents), and whether
+# a low numerator warning column (<measure>_warning) is available for it.
+# Any other registered measures that need to be calculated first can be listed
+# in depends_on (measures used as a numerator or denominator are included
+# automatically).
+MEASURES = {
+    # Coverage measures
+    "Coverage": {"numerator": "Women_screened_less3yrs",
+                 "denominator": "Women_eligible",
+                 "multiplier": 100,
+                 "warning": False},
+    "Percent_never_screened": {"numerator": "Women_never_screened",
+                               "denominator": "Women_eligible",
+                               "multiplier": 100,
+                               "warning": False},
+    # Uptake measures
+    "Uptake": {"numerator": "Screened",
+               "denominator": "Invited",
+               "multiplier": 100,
+               "warning": False},
+    # Assessment referral measures
+    "Percent_assessment": {"numerator": "Initial_referred",
+                           "denominator": "Screened",
+                           "multiplier": 100,
+                           "warning": True},
+    # STR measures
+    "Percent_STR": {"numerator": "Final_STR",
+                    "denominator": "Screened",
+                    "multiplier": 100,
+                    "warning": True},
+    "Percent_STR_referrals": {"numerator": "Final_STR",
+                              "denominator": "Initial_referred",
+                              "multiplier": 100,
+                              "warning": False},
+    # Cancer rate
+    "Rate_with_cancer": {"numerator": "Total_with_cancer",
+                         "denominator": "Screened",
+                         "multiplier": 1000,
+                         "warning": True},
+    # Percent of total cancer measures
+    "Percent_cancer_non_or_micro_invasive": {"numerator": "Non_or_micro_invasive",
+                                             "denominator": "Total_with_cancer",
+                                             "multiplier": 100,
+                                             "warning": False},
+    "Percent_cancer_invasive_total": {"numerator": "Invasive_total",
+                                      "denominator": "Total_with_cancer",
+                                      "multiplier": 100,
+                                      "warning": False},
+    "Percent_cancer_small_invasive": {"numerator": "Small_invasive",
+                                      "denominator": "Total_with_cancer",
+                                      "multiplier": 100,
+                                      "warning": False},
+    "Percent_cancer_invasive_15mmplus": {"numerator": "Invasive_15mmplus",
+                                         "denominator": "Total_with_cancer",
+                                         "multiplier": 100,
+                                         "warning": False},
+    # Invasive cancer measures (percents)
+    "Percent_small_invasive": {"numerator": "Small_invasive",
+                               "denominator": "Invasive_total",
+                               "multiplier": 100,
+                               "warning": True},
+    "Percent_invasive_15mmplus": {"numerator": "Invasive_15mmplus",
+                                  "denominator": "Invasive_total",
+                                  "multiplier": 100,
+                                  "warning": False},
+    "Percent_invasive_unknown": {"numerator": "Invasive_unknown",
+                                 "denominator": "Invasive_total",
+                                 "multiplier": 100,
+                                 "warning": False},
+    # Invasive cancer measures (rates)
+    "Rate_small_invasive": {"numerator": "Small_invasive",
+                            "denominator": "Screened",
+                            "multiplier": 1000,
+                            "warning": True},
+    "Rate_invasive_15mmplus": {"numerator": "Invasive_15mmplus",
+                               "denominator": "Screened",
+                               "multiplier": 1000,
+                               "warning": True},
+    "Rate_non_or_micro_invasive": {"numerator": "Non_or_micro_invasive",
+                                   "denominator": "Screened",
+                                   "multiplier": 1000,
+                                   "warning": True},
+    # Biopsy referral measures
+    "Percent_cyt_biop_referrals": {"numerator": "Referral_cyt_bio",
+                                   "denominator": "Initial_referred",
+                                   "multiplier": 100,
+                                   "warning": False},
+    "Percent_open_biop_referrals": {"numerator": "Open_biop_total",
+                                    "denominator": "Initial_referred",
+                                    "multiplier": 100,
+                                    "warning": False},
+    # Diagnostic measures
+    "Rate_benign_biopsy": {"numerator": "Benign_biopsy",
+                           "denominator": "Screened",
+                           "multiplier": 1000,
+                           "warning": True},
+    "Rate_non_op_diagnosis": {"numerator": "Cyt_bio_cancer",
+                              "denominator": "Cancers_diagnosed",
+                              "multiplier": 100,
+                              "warning": True},
+    # Standardised Detection Ratio (SDR), where SDR_expected is added by
+    # add_sdr_expected
+    "SDR": {"numerator": "Invasive_total",
+            "denominator": "SDR_expected",
+            "multiplier": 1,
+            "warning": True},
+    # High risk measures
+    "Percent_hr_referred_assess": {"numerator": "HR_Total_referred",
+                                   "denominator": "HR_Total_screened",
+                                   "multiplier": 100,
+                                   "warning": False},
+    "Rate_hr_cancer_detected": {"numerator": "HR_Total_women_with_cancer",
+                                "denominator": "HR_Total_screened",
+                                "multiplier": 1000,
+                                "warning": False},
+    "Rate_hr_invasive_cancers": {"numerator": "HR_Total_invasive_cancers",
+                                 "denominator": "HR_Total_screened",
+                                 "multiplier": 1000,
+                                 "warning": False},
+    }
 
 
 def add_measures_counts(df, collection,
@@ -13,6 +139,12 @@ def add_measures_counts(df, collection,
     counts used in reporting to the measure column (Col_Def). These are applied
     to the dataframe directly after import so they can be used throughout the
     pipeline.
+    Counts of 0 that are not in the imported data (most measures are only
+    collected for some parts and table codes) are not stored in the returned
+    dataframe. The measures are recorded as the categories of the measure
+    column (see mark_sparse_measures), and the 0 counts are filled back in
+    when the data is filtered (see fill_zero_counts).
+
     Parameters
     ----------
     df : pandas.DataFrame
@@ -38,8 +170,12 @@ def add_measures_counts(df, collection,
     # Transpose the measure column into columns (one per value in measure column)
     df = df.unstack(measure_column)
     df.columns = df.columns.droplevel(0)
-    # Replace nulls in measure column with 0s
-    df = df.fillna(0)
+    # Record which counts are in the imported data, so these are kept when
+    # they are 0
+    included = df.notnull().astype(pd.SparseDtype(bool, False))
+    # Replace nulls in measure column with 0s, storing each measure as a sparse
+    # column of the counts that are not 0
+    df = df.fillna(0).astype(pd.SparseDtype(float, 0))
 
     # Add KC63 measures to the columns
     if collection == "KC63":
@@ -55,629 +191,595 @@ def add_measures_counts(df, collection,
         df = cancers_diagnosed(df)
         df = benign_biopsy(df)
 
-    # Transpose the measures back into a single column and reapply the counts
+    # Transpose the measures back into a single column, keeping the counts
+    # that are in the imported data or are not 0, and reapply the counts
     # label to the counts column name
-    df = df.stack().reset_index()
-    df.rename(columns={0: counts_column}, inplace=True)
+    df_counts = stack_sparse_counts(df, included, counts_column)
 
-    return df
+    return mark_sparse_measures(df_counts, list(df.columns), measure_column)
 
 
-def check_measure_as_rows(df, column_content,
-                          measure_as_rows=False, row_content=None, rows=None):
+def mark_sparse_measures(df, measures, measure_column="Col_Def"):
     """
-    Checks if there are any rates/percentage measures to be added from the rows
-    content and if so transforms the dataframe for these to be applied (so they
-    are temporarily set as columns) using the add_measures function.
-    Then also applies any rates/percentage that are required for the column
-    content.
-    Parameters
-    ----------
-    df : pandas.DataFrame
-    column_content: list[str]
-        List of column values to be checked which will determine which measures
-        will be added to the column content.
-        Only used if measure_as_rows is False.
-    measure_as_rows: bool
-        Indicates if the measures are currently stored in rows (within the first
-        variable held in the rows input list).
-        Default is False
-    row_content: list[str]
-        List of column values to be checked which will determine which measure
-        will be added to the row content.
-        Only used if measure_as_rows is True.
-    rows : list[str]
-        Variable name that holds the output row information (e.g. region). If
-        there are multiple variable names in the list, only the first is checked.
-        Only used if measure_as_rows is True.
+    Records the measures of a dataframe that does not store its counts of 0
+    (see add_measures_counts), by setting them as the categories of the
+    measure column. The categories are kept when the dataframe is sliced,
+    filtered or saved, so the 0 counts can be filled in (see
+    fill_zero_counts).
 
-    Returns
-    -------
-    pandas.DataFrame
-        df with required measures added
-    """
-    # If the measure as rows flag is set to True
-    # then the datframe will be temporarily transposed so that the measures
-    # are in columns whilst extra measures are added
-    if measure_as_rows:
-        # The measures are always expected to be in a single column, as defined
-        # by the rows input, so only this column will be selected to be transposed
-        rows = rows[0]
-        df.set_index([rows], inplace=True)
-        df = df.transpose()
-        column_content_temp = row_content
-
-        # Add the measures
-        df = add_measures(df, column_content_temp)
-
-        # Then transpose the measures back into rows
-        df = df.transpose()
-        df.reset_index(inplace=True)
-    else:
-        # Else process the measures in columns
-        df = add_measures(df, column_content)
-
-    return df
-
-
-def add_measures(df, columns):
-    """
-    Adds required percentage/rates to the dataframe.
-    These are only applied where needed for a particular output (as determined
-    by the columns content).
     Parameters
     ----------
     df : pandas.DataFrame
-    columns: list[str]
-        List of column values to be checked which will determine which measures
-        will be added to the column content.
+    measures : list[str]
+        Every measure of the data, including those with no rows.
+    measure_column: str
+        Name of column which contains the measure information
 
     Returns
     -------
     pandas.DataFrame
-        df with required measures added
     """
-
-    # This will add a new percentage of (column) total field to a dataframe
-    # where column_order includes a parameter ending in '_of_total'
-    # (e.g 'Invited_of_total to calcuate percentage of individuals invited).
-    for column in columns:
-        if str(column).endswith("_of_total"):
-            helpers.add_percent_of_total(df, column)
-
-    # Add coverage measures
-    if 'Coverage' in columns:
-        df = coverage(df)
-        df = percent_never_screened(df)
-
-    # Add uptake measures
-    if 'Uptake' in columns:
-        df = uptake(df)
-
-    # Add assessment referral measures
-    if 'Percent_assessment' in columns:
-        df = percent_assessment(df)
-
-    # Add STR measures
-    if 'Final_STR' in columns:
-        df = percent_str(df)
-        df = percent_str_referrals(df)
-
-    # Add cancer rate
-    if 'Rate_with_cancer' in columns:
-        df = rate_with_cancer(df)
-
-    # Add percent of total cancer measures
-    if 'Percent_cancer_small_invasive' in columns:
-        df = percent_cancer_non_or_micro_invasive(df)
-        df = percent_cancer_invasive_total(df)
-        df = percent_cancer_small_invasive(df)
-        df = percent_cancer_invasive_15mmplus(df)
-
-    # Add invasive cancer measures (percents)
-    if 'Percent_small_invasive' in columns:
-        df = percent_small_invasive(df)
-        df = percent_invasive_15mmplus(df)
-        df = percent_invasive_unknown(df)
-
-    # Add invasive cancer measures (rates)
-    if ('Rate_small_invasive' in columns) | ('SDR' in columns):
-        df = rate_small_invasive(df)
-        df = rate_invasive_15mmplus(df)
-        df = rate_non_or_micro_invasive(df)
-
-    # Add biopsy referral measures
-    if (('Percent_cyt_biop_referrals' in columns)
-            | ('Percent_open_biop_referrals' in columns)):
-        df = percent_cyt_biop_referrals(df)
-        df = percent_open_biop_referrals(df)
-
-    # Add diagnostic measures
-    if 'Rate_benign_biopsy' in columns:
-        df = rate_benign_biopsy(df)
-    if 'Rate_non_op_diagnosis' in columns:
-        df = rate_non_op_diagnosis(df)
-
-    # Add SDR calculation
-    if 'SDR' in columns:
-        df = sdr(df)
-
-    # Add percent high risk screens referred for assessment
-    if 'Percent_hr_referred_assess' in columns:
-        df = percent_hr_referred_assess(df)
-
-    # Add percent high risk screens referred for assessment
-    if 'Rate_hr_cancer_detected' in columns:
-        df = rate_hr_cancer_detected(df)
-
-    # Add percent high risk screens referred for assessment
-    if 'Rate_hr_invasive_cancers' in columns:
-        df = rate_hr_invasive_cancers(df)
+    df[measure_column] = pd.Categorical(df[measure_column].astype(object),
+                                        categories=measures)
 
     return df
 
 
-def coverage(df):
+def sparse_measures(df, measure_column="Col_Def"):
     """
-    Adds a coverage column to the dataframe
+    Finds the measures recorded by mark_sparse_measures.
 
     Parameters
     ----------
     df : pandas.DataFrame
-        df expects df[Women_screened_less3yrs] and df[Women_eligible]
-        among the columns
+    measure_column: str
+        Name of column which contains the measure information
 
     Returns
     -------
-    pandas.DataFrame
-        df with 'Coverage' column added
-
+    list[str]
+        The measures, or None if the dataframe stores all its counts.
     """
-    new_column_name = "Coverage"
-    numerator = "Women_screened_less3yrs"
-    denominator = "Women_eligible"
-    multiplier = 100
+    if ((measure_column not in df.columns)
+            or not isinstance(df[measure_column].dtype, pd.CategoricalDtype)):
+        return None
 
-    helpers.add_percent_or_rate(df, new_column_name, numerator,
-                                denominator, multiplier)
+    return list(df[measure_column].cat.categories)
 
-    return df
 
-
-def percent_never_screened(df):
+def stack_sparse_counts(df, included, counts_column="Value"):
     """
-    Adds a percent of women never screened column to the dataframe
+    Transposes sparse measure columns into a single measure column, in the
+    same order as pandas stack. Only the counts that are not 0, or that are
+    flagged in included, are kept.
 
     Parameters
     ----------
     df : pandas.DataFrame
-        df expects df[Women_never_screened] and df[Women_eligible]
-        among the columns
+        Counts with one sparse column per measure (0 as the fill value).
+    included : pandas.DataFrame
+        Sparse boolean flags of counts to keep when they are 0. May contain
+        a subset of the columns in df.
+    counts_column: str
+        Name of column which will contain the counts
 
     Returns
     -------
     pandas.DataFrame
-        df with percent never screened column added
-
     """
-    new_column_name = "Percent_never_screened"
-    numerator = "Women_never_screened"
-    denominator = "Women_eligible"
-    multiplier = 100
+    rows, measures, counts = [], [], []
+    for position, measure in enumerate(df.columns):
+        # Positions of the counts that are not 0, and of any counts to keep
+        counts_array = df[measure].array
+        non_zero = counts_array.sp_index.to_int_index().indices
+        keep = non_zero
+        if measure in included:
+            flags = included[measure].array.sp_index.to_int_index().indices
+            keep = np.union1d(keep, flags)
 
-    helpers.add_percent_or_rate(df, new_column_name, numerator,
-                                denominator, multiplier)
+        values = np.zeros(len(keep))
+        values[np.searchsorted(keep, non_zero)] = counts_array.sp_values
+        rows.append(keep)
+        measures.append(np.full(len(keep), position))
+        counts.append(values)
 
-    return df
+    # Order by row and then measure, as per stack
+    rows, measures, counts = (np.concatenate(rows), np.concatenate(measures),
+                              np.concatenate(counts))
+    order = np.lexsort((measures, rows))
 
+    df_counts = df.index.to_frame(index=False).take(rows[order])
+    df_counts[df.columns.name] = df.columns.take(measures[order])
+    df_counts[counts_column] = counts[order]
 
-def women_eligible(df):
+    return df_counts.reset_index(drop=True)
+
+
+def fill_zero_counts(df, counts_column="Value", measure_column="Col_Def"):
     """
-    Adds a women eligible column to the dataframe
+    Fills in the counts of 0 that are not stored by add_measures_counts, so
+    there is a row for each of the sparse measures (see mark_sparse_measures)
+    for every combination of the other columns in the dataframe. Only the
+    missing rows are created, and the rows are ordered by the other columns
+    and then the measures. The measure column is returned as text.
+    Dataframes without sparse measures are returned as is.
 
     Parameters
     ----------
     df : pandas.DataFrame
-        df expects df[Women_resident] and df[Women_ineligible] among
-        the columns
+    counts_column: str
+        Name of column which contains the counts
+    measure_column: str
+        Name of column which contains the measure information
 
     Returns
     -------
     pandas.DataFrame
-        df with women eligible column added
-
     """
-    df["Women_eligible"] = df["Women_resident"] - df["Women_ineligible"]
-
-    return df
+    measures = sparse_measures(df, measure_column)
+    if measures is None:
+        return df
 
+    if df.empty:
+        return df.astype({measure_column: object}).reset_index(drop=True)
 
-def women_never_screened(df):
-    """
-    Adds a women never screened column to the dataframe
-
-    Parameters
-    ----------
-    df : pandas.DataFrame
-        df expects df[Women_selected_no_screen] and
-        df[Women_not_selected_not_screened] among the columns
+    # Number each combination of the other columns (in sorted order), and
+    # find the measures that are stored for each
+    index_columns = [column for column in df.columns
+                     if column not in [measure_column, counts_column]]
+    groups = df.groupby(index_columns, dropna=False).ngroup().to_numpy()
+    codes = df[measure_column].cat.codes.to_numpy()
+    stored = np.zeros((groups.max() + 1, len(measures)), dtype=bool)
+    stored[groups, codes] = True
 
-    Returns
-    -------
-    pandas.DataFrame
-        df with women never screened column added
+    # Create a row with a count of 0 for each measure that is not stored,
+    # copying the other columns from the first row of the combination
+    missing_groups, missing_codes = np.nonzero(~stored)
+    first_rows = np.unique(groups, return_index=True)[1]
+    df_zeros = df.take(first_rows[missing_groups])
+    df_zeros[counts_column] = 0
 
-    """
-    df["Women_never_screened"] = (df["Women_selected_no_screen"]
-                                  + df["Women_not_selected_not_screened"])
+    # Order the rows by the other columns and then the measures
+    groups = np.concatenate([groups, missing_groups])
+    codes = np.concatenate([codes, missing_codes])
+    order = np.lexsort((codes, groups))
+    df_filled = pd.concat([df, df_zeros]).take(order)
+    df_filled.index = pd.RangeIndex(len(df_filled))
+    df_filled[measure_column] = np.asarray(measures, dtype=object)[codes[order]]
 
-    return df
+    return df_filled
 
 
-def uptake(df):
+def check_measure_as_rows(df, column_content,
+                          measure_as_rows=False, row_content=None, rows=None):
     """
-    Adds an uptake column to the dataframe.
-
+    Checks if there are any rates/percentage measures to be added from the rows
+    content and if so adds these as new rows using the add_measures_as_rows
+    function.
+    Then also applies any rates/percentage that are required for the column
+    content.
     Parameters
     ----------
     df : pandas.DataFrame
-        df expects df[Invited] and df[Screened]
-        among the columns
+    column_content: list[str]
+        List of column values to be checked which will determine which measures
+        will be added to the column content.
+    measure_as_rows: bool
+        Indicates if the measures are currently stored in rows (within the first
+        variable held in the rows input list).
+        Default is False
+    row_content: list[str]
+        List of column values to be checked which will determine which measure
+        will be added to the row content.
+        Only used if measure_as_rows is True.
+    rows : list[str]
+        Variable name that holds the output row information (e.g. region). If
+        there are multiple variable names in the list, only the first is checked.
+        Only used if measure_as_rows is True.
 
     Returns
     -------
     pandas.DataFrame
-        df with 'Uptake' column added
-
+        df with required measures added
     """
-    new_column_name = "Uptake"
-    numerator = "Screened"
-    denominator = "Invited"
-    multiplier = 100
+    # If the measure as rows flag is set to True then add the measures as
+    # extra rows
+    if measure_as_rows:
+        # The measures are always expected to be in a single column, as defined
+        # by the rows input
+        df = add_measures_as_rows(df, row_content, rows[0])
 
-    helpers.add_percent_or_rate(df, new_column_name, numerator,
-                                denominator, multiplier)
+    # Then process any measures in columns
+    df = add_measures(df, column_content)
 
     return df
 
 
-def percent_assessment(df):
+def add_measures(df, columns):
     """
-    Adds a referral for assessment percentage column
-    and associated low numerator warning to the dataframe.
-
+    Adds required percentage/rates to the dataframe.
+    These are only applied where needed for a particular output (as determined
+    by the columns content), along with any measures they depend on.
     Parameters
     ----------
     df : pandas.DataFrame
-        df expects df[Women_screened] and
-        df[Initial_referred] among the columns
+    columns: list[str]
+        List of column values to be checked which will determine which measures
+        will be added to the column content. Values ending in '_warning' will
+        add the low numerator warning for the measure.
 
     Returns
     -------
     pandas.DataFrame
-        df with percent referred for assessment added
-
+        df with required measures added
     """
-    new_column_name = "Percent_assessment"
-    numerator = "Initial_referred"
-    denominator = "Screened"
-    multiplier = 100
 
-    helpers.add_percent_or_rate(df, new_column_name, numerator,
-                                denominator, multiplier)
+    # This will add a new percentage of (column) total field to a dataframe
+    # where column_order includes a parameter ending in '_of_total'
+    # (e.g 'Invited_of_total to calcuate percentage of individuals invited).
+    for column in columns:
+        if str(column).endswith("_of_total"):
+            helpers.add_percent_of_total(df, column)
+
+    # Identify the measures for which a low numerator warning is needed
+    warnings = [str(column)[:-len("_warning")] for column in columns
+                if str(column).endswith("_warning")]
+
+    # Add the measures in batches, so any measures that others depend on
+    # are calculated first
+    for measures in resolve_measures(columns):
+        df = calculate_measures(df, measures)
 
-    # Add an extra column with the low numerator warning
-    helpers.low_numerator_warning(df, new_column_name, numerator)
+        for measure in measures:
+            if (measure in warnings) & MEASURES[measure]["warning"]:
+                helpers.low_numerator_warning(df, measure,
+                                              MEASURES[measure]["numerator"])
 
     return df
 
 
-def percent_str(df):
+def add_measures_as_rows(df, rows_content, measure_column, low=25):
     """
-    Adds a short term recall percentage column
-    and associated low numerator warning to the dataframe.
+    Adds required percentage/rates to a dataframe where the measures are held
+    as rows (values within the measure column) rather than as columns. The
+    measures are added as new rows, calculated from the numerator and
+    denominator rows in each of the other (numeric) columns.
 
     Parameters
     ----------
     df : pandas.DataFrame
-        df expects df[Screened] and
-        df[Final_STR] among the columns
+    rows_content: list[str]
+        List of row values to be checked which will determine which measures
+        will be added to the row content. Values ending in '_warning' will
+        add the low numerator warning for the measure.
+    measure_column: str
+        Column that holds the measure names
+    low: int
+        A low numerator warning will be flagged if the numerator is lower than
+        this value.
 
     Returns
     -------
     pandas.DataFrame
-        df with short term recall assessment percentage added
-
-    """
-    new_column_name = "Percent_STR"
-    numerator = "Final_STR"
-    denominator = "Screened"
-    multiplier = 100
-
-    helpers.add_percent_or_rate(df, new_column_name, numerator,
-                                denominator, multiplier)
-
-    # Add an extra column with the low numerator warning
-    helpers.low_numerator_warning(df, new_column_name, numerator)
+        df with required measure rows added. Low numerator warning rows hold
+        1 where the warning applies and 0 otherwise, so the columns stay
+        numeric (the flags are written as text by write.fill_warning_flags).
+    """
+    # Identify the measures for which a low numerator warning is needed
+    warnings = [str(row)[:-len("_warning")] for row in rows_content
+                if str(row).endswith("_warning")]
+
+    # Add the measures in batches, so any measures that others depend on
+    # are calculated first
+    for measures in resolve_measures(rows_content):
+        df = calculate_measures_as_rows(df, measures, measure_column)
+
+        df_values = df.set_index(measure_column)
+        warning_rows = [measure for measure in measures
+                        if (measure in warnings) & MEASURES[measure]["warning"]]
+
+        # Add a row with the low numerator warning for any measures
+        # that require it
+        if warning_rows:
+            numerators = df_values.loc[[MEASURES[measure]["numerator"]
+                                        for measure in warning_rows]]
+            df_warnings = pd.DataFrame((numerators < low).to_numpy(dtype=float),
+                                       columns=df_values.columns)
+            df_warnings.insert(0, measure_column,
+                               [measure + "_warning" for measure in warning_rows])
+            df = pd.concat([df, df_warnings], ignore_index=True)
 
     return df
 
 
-def invasive_15mmplus(df):
+def resolve_measures(columns, measures=MEASURES):
     """
-    Adds an invasive (>=15mm) sub-group total to the dataframe
+    Identifies the registered measures required for the columns content,
+    including any registered measures that they depend on, and groups them
+    into the order they need to be calculated.
 
     Parameters
     ----------
-    df : pandas.DataFrame
-        df expects df[Invasive_15mmto20mm], df[Invasive_20mmto50mm] and
-        df[Invasive_50mmplus] among the columns
+    columns: list[str]
+        List of column values to be checked. Values that are not registered
+        measures (e.g. counts) are ignored, and values ending in '_warning'
+        require the measure they relate to.
+    measures: dict(str, dict)
+        Register of measure definitions.
+        Default is MEASURES
 
     Returns
     -------
-    pandas.DataFrame
-        df with invasive cancer 15mmplus column added
-
+    list[list[str]]
+        Names of the required measures, in batches where each measure only
+        depends on measures in an earlier batch.
     """
-    df["Invasive_15mmplus"] = (df["Invasive_15mmto20mm"]
-                               + df["Invasive_20mmto50mm"]
-                               + df["Invasive_50mmplus"])
+    # Establish the requested measures
+    requested = []
+    for column in columns:
+        column = str(column)
+        if column.endswith("_warning"):
+            column = column[:-len("_warning")]
+        if (column in measures) & (column not in requested):
+            requested.append(column)
 
-    return df
+    # Store the batch number each required measure can be calculated in
+    batch_number = {}
 
+    def find_batch(measure, path):
+        if measure in path:
+            raise ValueError(f"The measure {measure} has a circular dependency")
+        if measure not in measures:
+            raise ValueError(f"The measure {measure} is needed to create {path[-1]} but is not defined")
 
-def small_invasive(df):
-    """
-    Adds a small invasive (<15mm) sub-group total to the dataframe
+        if measure not in batch_number:
+            definition = measures[measure]
+            # A measure depends on any registered measures used as its
+            # numerator or denominator, plus those in depends_on
+            depends_on = [column for column in [definition["numerator"],
+                                                definition["denominator"]]
+                          if column in measures]
+            depends_on += definition.get("depends_on", [])
 
-    Parameters
-    ----------
-    df : pandas.DataFrame
-        df expects df[Invasive_lessthan10mm] and
-        df[Invasive_10mmto15mm] among the columns
+            batch_number[measure] = 1 + max(
+                [find_batch(dependency, path + [measure])
+                 for dependency in depends_on], default=-1)
 
-    Returns
-    -------
-    pandas.DataFrame
-        df with small invasive column added
+        return batch_number[measure]
 
-    """
-    df["Small_invasive"] = (df["Invasive_lessthan10mm"]
-                            + df["Invasive_10mmto15mm"])
+    for measure in requested:
+        find_batch(measure, [])
 
-    return df
+    return [[measure for measure, number in batch_number.items()
+             if number == batch]
+            for batch in range(max(batch_number.values(), default=-1) + 1)]
 
 
-def non_or_micro_invasive(df):
+def required_counts(columns, measures=MEASURES):
     """
-    Adds a non or micro invasive (<15mm) sub-group total to the dataframe
+    Identifies the counts (values that are not registered measures) needed
+    to calculate the measures in the columns content, including those needed
+    by any measures they depend on. Columns content that is not a registered
+    measure is returned as is.
 
     Parameters
     ----------
-    df : pandas.DataFrame
-        df expects df[Cancer_non_microinvasive] and
-        df[Cancer_microinvasive] among the columns
+    columns: list[str]
+        List of column values, which may include registered measures
+    measures: dict(str, dict)
+        Register of measure definitions.
+        Default is MEASURES
 
     Returns
     -------
-    pandas.DataFrame
-        df with non or micro invasive cancer column added
-
+    list[str]
+        Names of the counts needed
     """
-    df["Non_or_micro_invasive"] = (df["Cancer_non_microinvasive"]
-                                   + df["Cancer_microinvasive"])
+    counts = [column for column in columns
+              if (column not in measures) & (not str(column).endswith("_warning"))]
 
-    return df
+    for batch in resolve_measures(columns, measures):
+        for measure in batch:
+            for column in [measures[measure]["numerator"],
+                           measures[measure]["denominator"]]:
+                if (column not in measures) & (column not in counts):
+                    counts.append(column)
+
+    return counts
 
 
-def rate_with_cancer(df):
+def calculate_measures(df, measures):
     """
-    Adds a 'number with cancer per 1000' column
-    and associated low numerator warning to the dataframe.
+    Adds a batch of registered measures to the dataframe, calculating all
+    of them in a single vectorised step. Each is calculated as the numerator
+    divided by the denominator, multiplied by the multiplier.
 
     Parameters
     ----------
     df : pandas.DataFrame
-        df expects df[Total_with_cancer] and
-        df[Screened] among the columns
+    measures: list[str]
+        Names of measures in MEASURES to be added
 
     Returns
     -------
     pandas.DataFrame
-        df with number with cancer per 1000 people column added
-
+        df with measure columns added
     """
-    new_column_name = "Rate_with_cancer"
-    numerator = "Total_with_cancer"
-    denominator = "Screened"
-    multiplier = 1000
+    definitions = [MEASURES[measure] for measure in measures]
+
+    # Check the numerator and denominator for each measure is in the dataframe
+    for measure, definition in zip(measures, definitions):
+        for column in [definition["numerator"], definition["denominator"]]:
+            if column not in df:
+                raise ValueError(f"The column {column} is needed to create {measure} but is not in the dataframe")
 
-    helpers.add_percent_or_rate(df, new_column_name, numerator,
-                                denominator, multiplier)
+    numerators = df[[definition["numerator"] for definition in definitions]]
+    denominators = df[[definition["denominator"] for definition in definitions]]
+    multipliers = np.array([definition["multiplier"] for definition in definitions])
 
-    # Add an extra column with the low numerator warning
-    helpers.low_numerator_warning(df, new_column_name, numerator)
+    # Calculate all the measures together (division by 0 returns inf/NaN as
+    # per pandas)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        values = numerators.to_numpy() / denominators.to_numpy() * multipliers
+
+    for position, measure in enumerate(measures):
+        df[measure] = values[:, position]
 
     return df
 
 
-def rate_non_or_micro_invasive(df):
+def calculate_measures_as_rows(df, measures, measure_column):
     """
-    Adds a 'rate non or micro invasive cancer per 1000' column
-    and associated low numerator warning to the dataframe.
+    Adds a batch of registered measures as new rows to a dataframe where the
+    measures are held as rows, calculating all of them in a single vectorised
+    step for every other column. Each is calculated as the numerator divided
+    by the denominator, multiplied by the multiplier.
 
     Parameters
     ----------
     df : pandas.DataFrame
-        df expects df[Non_micro_invasive] and
-        df[Screened] among the columns
+    measures: list[str]
+        Names of measures in MEASURES to be added
+    measure_column: str
+        Column that holds the measure names
 
     Returns
     -------
     pandas.DataFrame
-        df with number with non or micro invasive cancer per 1000 people screened
-        column added
-
+        df with measure rows added
     """
-    new_column_name = "Rate_non_or_micro_invasive"
-    numerator = "Non_or_micro_invasive"
-    denominator = "Screened"
-    multiplier = 1000
+    definitions = [MEASURES[measure] for measure in measures]
+    df_values = df.set_index(measure_column)
 
-    helpers.add_percent_or_rate(df, new_column_name, numerator,
-                                denominator, multiplier)
+    # Check the numerator and denominator for each measure is in the dataframe
+    for measure, definition in zip(measures, definitions):
+        for row in [definition["numerator"], definition["denominator"]]:
+            if row not in df_values.index:
+                raise ValueError(f"The row {row} is needed to create {measure} but is not in the dataframe")
 
-    # Add an extra column with the low numerator warning
-    helpers.low_numerator_warning(df, new_column_name, numerator)
+    numerators = df_values.loc[[definition["numerator"] for definition in definitions]]
+    denominators = df_values.loc[[definition["denominator"] for definition in definitions]]
+    multipliers = np.array([[definition["multiplier"]] for definition in definitions])
 
-    return df
+    # Calculate all the measures together (division by 0 returns inf/NaN as
+    # per pandas)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        values = numerators.to_numpy() / denominators.to_numpy() * multipliers
+
+    # Replace any existing rows for the measures with the new values
+    df_measures = pd.DataFrame(values, columns=df_values.columns)
+    df_measures.insert(0, measure_column, measures)
+    df = df[~df[measure_column].isin(measures)]
 
+    return pd.concat([df, df_measures], ignore_index=True)
 
-def rate_invasive_15mmplus(df):
+
+def women_eligible(df):
     """
-    Adds a 'rate invasive cancer 15mm plus per 1000' column
-    and associated low numerator warning to the dataframe.
+    Adds a women eligible column to the dataframe
 
     Parameters
     ----------
     df : pandas.DataFrame
-        df expects df[Large_invasive] and
-        df[Screened] among the columns
+        df expects df[Women_resident] and df[Women_ineligible] among
+        the columns
 
     Returns
     -------
     pandas.DataFrame
-        df with number with invasive cancer per 1000 people screened column added
+        df with women eligible column added
 
     """
-    new_column_name = "Rate_invasive_15mmplus"
-    numerator = "Invasive_15mmplus"
-    denominator = "Screened"
-    multiplier = 1000
-
-    helpers.add_percent_or_rate(df, new_column_name, numerator,
-                                denominator, multiplier)
-
-    # Add an extra column with the low numerator warning
-    helpers.low_numerator_warning(df, new_column_name, numerator)
+    df["Women_eligible"] = df["Women_resident"] - df["Women_ineligible"]
 
     return df
 
 
-def rate_small_invasive(df):
+def women_never_screened(df):
     """
-    Adds a 'number with small invasive cancer per 1000' column to the dataframe
-    and associated low numerator warning column to the dataframe.
+    Adds a women never screened column to the dataframe
 
     Parameters
     ----------
     df : pandas.DataFrame
-        df expects df[Small_invasive] and
-        df[Screened] among the columns
+        df expects df[Women_selected_no_screen] and
+        df[Women_not_selected_not_screened] among the columns
 
     Returns
     -------
     pandas.DataFrame
-        df with small invasive cancer per 1000 people screened column added
+        df with women never screened column added
 
     """
-    new_column_name = "Rate_small_invasive"
-    numerator = "Small_invasive"
-    denominator = "Screened"
-    multiplier = 1000
-
-    helpers.add_percent_or_rate(df, new_column_name, numerator,
-                                denominator, multiplier)
-
-    # Add an extra column with the low numerator warning
-    helpers.low_numerator_warning(df, new_column_name, numerator)
+    df["Women_never_screened"] = (df["Women_selected_no_screen"]
+                                  + df["Women_not_selected_not_screened"])
 
     return df
 
 
-def percent_small_invasive(df):
+def invasive_15mmplus(df):
     """
-    Adds a 'percent of small invasive cancers of total invasive cancers'
-    column and associated low numerator warning column to the dataframe.
+    Adds an invasive (>=15mm) sub-group total to the dataframe
 
     Parameters
     ----------
     df : pandas.DataFrame
-        df expects df[Small_invasive] and
-        df[Invasive_total] among the columns
+        df expects df[Invasive_15mmto20mm], df[Invasive_20mmto50mm] and
+        df[Invasive_50mmplus] among the columns
 
     Returns
     -------
     pandas.DataFrame
-        df with percent small invasive column added
+        df with invasive cancer 15mmplus column added
 
     """
-    new_column_name = "Percent_small_invasive"
-    numerator = "Small_invasive"
-    denominator = "Invasive_total"
-    multiplier = 100
-
-    helpers.add_percent_or_rate(df, new_column_name, numerator,
-                                denominator, multiplier)
-
-    # Add an extra column with the low numerator warning
-    helpers.low_numerator_warning(df, new_column_name, numerator)
+    df["Invasive_15mmplus"] = (df["Invasive_15mmto20mm"]
+                               + df["Invasive_20mmto50mm"]
+                               + df["Invasive_50mmplus"])
 
     return df
 
 
-def percent_invasive_15mmplus(df):
+def small_invasive(df):
     """
-    Adds a 'percent of invasive cancers 15mm plus of total invasive cancers'
-    column to the dataframe.
+    Adds a small invasive (<15mm) sub-group total to the dataframe
 
     Parameters
     ----------
     df : pandas.DataFrame
-        df expects df[Invasive_15mmplus] and
-        df[Invasive_total] among the columns
+        df expects df[Invasive_lessthan10mm] and
+        df[Invasive_10mmto15mm] among the columns
 
     Returns
     -------
     pandas.DataFrame
-        df with percent invasive 15mm plus column added
+        df with small invasive column added
 
     """
-    new_column_name = "Percent_invasive_15mmplus"
-    numerator = "Invasive_15mmplus"
-    denominator = "Invasive_total"
-    multiplier = 100
-
-    helpers.add_percent_or_rate(df, new_column_name, numerator,
-                                denominator, multiplier)
+    df["Small_invasive"] = (df["Invasive_lessthan10mm"]
+                            + df["Invasive_10mmto15mm"])
 
     return df
 
 
-def percent_invasive_unknown(df):
+def non_or_micro_invasive(df):
     """
-    Adds a 'percent of invasive cancers unknown of total invasive cancers'
-    column to the dataframe.
+    Adds a non or micro invasive (<15mm) sub-group total to the dataframe
 
     Parameters
     ----------
     df : pandas.DataFrame
-        df expects df[Invasive_unknown] and
-        df[Invasive_total] among the columns
+        df expects df[Cancer_non_microinvasive] and
+        df[Cancer_microinvasive] among the columns
 
     Returns
     -------
     pandas.DataFrame
-        df with percent invasive 15mm plus column added
+        df with non or micro invasive cancer column added
 
     """
-    new_column_name = "Percent_invasive_unknown"
-    numerator = "Invasive_unknown"
-    denominator = "Invasive_total"
-    multiplier = 100
-
-    helpers.add_percent_or_rate(df, new_column_name, numerator,
-                                denominator, multiplier)
+    df["Non_or_micro_invasive"] = (df["Cancer_non_microinvasive"]
+                                   + df["Cancer_microinvasive"])
 
     return df
 
@@ -702,108 +804,124 @@ def benign_biopsy(df):
     return df
 
 
-def rate_benign_biopsy(df):
+def cancers_diagnosed(df):
     """
-    Adds 'benign biopsy rate' column and associated low numerator warning
-    column to the dataframe.
+    Adds a total cancers diagnosed column to the dataframe
 
     Parameters
     ----------
     df: pandas.DataFrame
-        df expects df[Benign_biopsy] and
-        df[Screened] among the columns
+        df expects df[Cyt_bio_cancer] and [Open_biop_cancer] among the columns
 
     Returns
     -------
     pandas.DataFrame
-        df with benign biopsy rate per 1000 screened column added
+        df with cancers diagnosed column added
 
     """
-    new_column_name = "Rate_benign_biopsy"
-    numerator = "Benign_biopsy"
-    denominator = "Screened"
-    multiplier = 1000
-
-    helpers.add_percent_or_rate(df, new_column_name, numerator,
-                                denominator, multiplier)
-
-    # Add an extra column with the low numerator warning
-    helpers.low_numerator_warning(df, new_column_name, numerator)
+    df["Cancers_diagnosed"] = df["Cyt_bio_cancer"] + df["Open_biop_cancer"]
 
     return df
 
 
-def cancers_diagnosed(df):
+@lru_cache(maxsize=None)
+def import_sdr_multipliers(ref_file=param.SDR_MULTIPLIER):
     """
-    Adds a total cancers diagnosed column to the dataframe
+    Imports the Standardised Detection Ratio (SDR) multiplier csv file
+    provided by NHSE. The result is cached so the file is only read once
+    per location.
 
     Parameters
     ----------
-    df: pandas.DataFrame
-        df expects df[Cyt_bio_cancer] and [Open_biop_cancer] among the columns
+    ref_file: Path
+        Location of the SDR multipliers csv file.
 
     Returns
     -------
     pandas.DataFrame
-        df with cancers diagnosed column added
-
+        Should not be modified in place, as it is shared between calls
     """
-    df["Cancers_diagnosed"] = df["Cyt_bio_cancer"] + df["Open_biop_cancer"]
+    logging.info("Importing SDR multipliers from external file")
 
-    return df
+    return pd.read_csv(ref_file, index_col=None,
+                       parse_dates=['Date_start', 'Date_end'], dayfirst=True)
 
 
-def rate_non_op_diagnosis(df):
+@lru_cache(maxsize=None)
+def sdr_multiplier_lookup(years, table_code,
+                          year_column="CollectionYearRange",
+                          ref_file=param.SDR_MULTIPLIER):
     """
-    Adds a 'Non-operative diagnosis rate (overall)' column and associated
-    low numerator warning to the dataframe.
+    Resolves the SDR multiplier that applies to each age band for each of
+    the given years and the table group (incidence or prevalence). The result
+    is cached so each combination is only resolved once.
 
     Parameters
     ----------
-    df: pandas.DataFrame
-        df expects df[Cyt_bio_cancer] and
-        df[Open_biop_cancer] among the columns
+    years: tuple(str)
+        Years (YYYY-YY) to select the applicable version of SDR ratio data for
+    table_code: tuple(str)
+        Collection table codes that determine which multiplier is used
+        (("A", "B"), or ("C1", "C2")).
+    year_column: str
+        Name to be given to the column holding the year
+    ref_file: Path
+        Location of the SDR multipliers csv file.
 
     Returns
     -------
     pandas.DataFrame
-        df with non-operative diagnosis rate (percent) column added
-
+        With columns year_column, Row_Def (age band) and SDR_multiplier.
+        Should not be modified in place, as it is shared between calls.
     """
-    new_column_name = "Rate_non_op_diagnosis"
-    numerator = "Cyt_bio_cancer"
-    denominator = "Cancers_diagnosed"
-    multiplier = 100
+    # Column of the SDR multiplier file that applies to each table group
+    multiplier_columns = {("A", "B"): "Tables A and B",
+                          ("C1", "C2"): "Tables C1 and C2"}
+    multiplier_column = multiplier_columns[table_code]
 
-    helpers.add_percent_or_rate(df, new_column_name, numerator,
-                                denominator, multiplier)
+    df_sdr = import_sdr_multipliers(ref_file)
 
-    # Add an extra column with the low numerator warning
-    helpers.low_numerator_warning(df, new_column_name, numerator)
+    lookups = []
+    for year in years:
+        # Filter SDR multiplier for current year
+        df_year = helpers.filter_for_year(df_sdr, year)
 
-    return df
+        # Check there are no duplicate age band values after filtering
+        if not df_year['Age band'].is_unique:
+            raise ValueError("SDR data in the breast_screening_sdr.csv input file covers overlapping periods. Check the file")
 
+        df_year = df_year[['Age band', multiplier_column]]
+        df_year.columns = ["Row_Def", "SDR_multiplier"]
+        df_year.insert(0, year_column, year)
+        lookups.append(df_year)
 
-def sdr_expected(df, table_code, year,
-                 measure_column="Col_Def",
-                 ref_file=param.SDR_MULTIPLIER):
+    if not lookups:
+        return pd.DataFrame(columns=[year_column, "Row_Def", "SDR_multiplier"])
+
+    return pd.concat(lookups, ignore_index=True)
+
+
+def add_sdr_expected(df, table_code,
+                     measure_column="Col_Def",
+                     year_column="CollectionYearRange",
+                     ref_file=param.SDR_MULTIPLIER):
     """
     Creates the expected number of invasive cancers based on the Standardised
-    Detection Ratio (SDR) multiplier csv file provided by NHSE.
+    Detection Ratio (SDR) multiplier csv file provided by NHSE, for all years
+    in the dataframe. The multipliers applicable to each year are joined in a
+    single step.
 
     Parameters
     ----------
     df : pandas.DataFrame
-    columns: str
-        Variable name that holds the measure(s) values (to identify 'Screened'
-        as used in the SDR calculation)
     table_code: list{str}
         Variable name that holds the collection table code (used to apply the
         correct multiplier - incidence or prevalence).
-    year: str
-        Used to select the applicable version of SDR ratio data
     measure_column: str
         Column that holds the screened information
+    year_column: str
+        Column that holds the year, used to select the applicable version of
+        SDR ratio data
     ref_file: Path
         Location of the SDR multipliers csv file.
 
@@ -817,34 +935,19 @@ def sdr_expected(df, table_code, year,
     table_code_valid = [["A", "B"], ["C1", "C2"]]
     helpers.validate_value_with_list("table_code", table_code, table_code_valid)
 
-    # Import SDR multiplier csv
-    df_sdr = pd.read_csv(ref_file, index_col=None,
-                         parse_dates=['Date_start', 'Date_end'], dayfirst=True)
-
-    # Filter SDR multiplier for current year
-    df_sdr = helpers.filter_for_year(df_sdr, year)
-
-    # Assert there are no duplicate age band values after filtering
-    if not df_sdr['Age band'].is_unique:
-        raise "SDR data in the breast_screening_sdr.csv input file covers \
-               overlapping periods. Check the file"
-
     # Filter just to 'Screened'
     df_expected = df[(df[measure_column] == 'Screened')]
 
-    # Join SDR multipliers
-    df_expected = df_expected.merge(df_sdr, left_on='Row_Def', right_on='Age band')
-    # Add create multiplier to relevant table codes
-    if table_code == ["A", "B"]:
-        df_expected["Value"] = (df_expected["Value"] *
-                                df_expected["Tables A and B"])/1000
-    if table_code == ["C1", "C2"]:
-        df_expected["Value"] = (df_expected["Value"] *
-                                df_expected["Tables C1 and C2"])/1000
+    # Get the multiplier for every year and age band in the data
+    years = tuple(sorted(df_expected[year_column].unique()))
+    df_lookup = sdr_multiplier_lookup(years, tuple(table_code), year_column,
+                                      ref_file)
 
-    # Drop fields that are no longer required
-    df_expected = df_expected.drop(['Tables A and B', 'Tables C1 and C2',
-                                    'Age band'], axis=1)
+    # Join SDR multipliers and create the expected values
+    df_expected = df_expected.merge(df_lookup, on=[year_column, "Row_Def"])
+    df_expected["Value"] = (df_expected["Value"] *
+                            df_expected["SDR_multiplier"])/1000
+    df_expected = df_expected.drop(["SDR_multiplier"], axis=1)
 
     # Rename Col_Def values
     df_expected[measure_column] = "SDR_expected"
@@ -852,413 +955,237 @@ def sdr_expected(df, table_code, year,
     return pd.concat([df, df_expected])
 
 
-def sdr(df):
-    """
-    Adds Standardised Detection Ratio (SDR) column to the dataframe
-
-    Parameters
-    ----------
-    df : pandas.DataFrame
-        df expects df[Observed] and
-        df[Expected] among the columns
-
-    Returns
-    -------
-    pandas.DataFrame
-        df with SDR column added
-    """
-    new_column_name = "SDR"
-    numerator = "Invasive_total"
-    denominator = "SDR_expected"
-    multiplier = 1
-
-    helpers.add_percent_or_rate(df, new_column_name, numerator,
-                                denominator, multiplier)
-
-    # Add an extra column with the low numerator warning
-    helpers.low_numerator_warning(df, new_column_name, numerator)
-
-    return df
-
-
-def percent_cyt_biop_referrals(df):
-    """
-    Adds percentage of referrals that are for cytology or core biopsies.
-    to the dataframe
-
-    Parameters
-    ----------
-    df : pandas.DataFrame
-        df expects df[Referral_cyt_bio] and df[Initial_referred] among the
-        columns
-
-    Returns
-    -------
-    pandas.DataFrame
-        df with Percent_cyt_biop_referrals column added
-    """
-    new_column_name = "Percent_cyt_biop_referrals"
-    numerator = "Referral_cyt_bio"
-    denominator = "Initial_referred"
-    multiplier = 100
-
-    helpers.add_percent_or_rate(df, new_column_name, numerator,
-                                denominator, multiplier)
-
-    return df
-
-
-def percent_open_biop_referrals(df):
-    """
-    Adds percentage of referrals that are for open biopsies to the dataframe
-
-    Parameters
-    ----------
-    df : pandas.DataFrame
-        df expects df[Open_biop_total] and df[Initial_referred] among the
-        columns
-
-    Returns
-    -------
-    pandas.DataFrame
-        df with Percent_open_biop_referrals column added
-    """
-    new_column_name = "Percent_open_biop_referrals"
-    numerator = "Open_biop_total"
-    denominator = "Initial_referred"
-    multiplier = 100
-
-    helpers.add_percent_or_rate(df, new_column_name, numerator,
-                                denominator, multiplier)
-
-    return df
-
-
-def percent_str_referrals(df):
-    """
-    Adds percentage of referrals resulting in short term recalls to the dataframe
-
-    Parameters
-    ----------
-    df : pandas.DataFrame
-        df expects df[Initial_referred] and df[Final_STR] among the
-        columns
-
-    Returns
-    -------
-    pandas.DataFrame
-        df With Percent_str_outcomes column added
-    """
-    new_column_name = "Percent_STR_referrals"
-    numerator = "Final_STR"
-    denominator = "Initial_referred"
-    multiplier = 100
-
-    helpers.add_percent_or_rate(df, new_column_name, numerator,
-                                denominator, multiplier)
-
-    return df
-
-
-def percent_cancer_non_or_micro_invasive(df):
-    """
-    Adds percentage of total cancers that are non or micro invasive to the
-    dataframe.
-
-    Parameters
-    ----------
-    df : pandas.DataFrame
-        df expects df[Non_or_micro_invasive] and df[Total_with_cancer] among the
-        columns
-
-    Returns
-    -------
-    pandas.DataFrame
-        df with Percent_cancer_non_or_micro_invasive column added
-    """
-    new_column_name = "Percent_cancer_non_or_micro_invasive"
-    numerator = "Non_or_micro_invasive"
-    denominator = "Total_with_cancer"
-    multiplier = 100
-
-    helpers.add_percent_or_rate(df, new_column_name, numerator,
-                                denominator, multiplier)
-
-    return df
-
-
-def percent_cancer_invasive_total(df):
-    """
-    Adds percentage of total cancers that invasive to the
-    dataframe.
-
-    Parameters
-    ----------
-    df : pandas.DataFrame
-        df expects df[Invasive_total] and df[Total_with_cancer] among the
-        columns
-
-    Returns
-    -------
-    pandas.DataFrame
-        df with Percent_cancer_invasive_total column added
-    """
-    new_column_name = "Percent_cancer_invasive_total"
-    numerator = "Invasive_total"
-    denominator = "Total_with_cancer"
-    multiplier = 100
-
-    helpers.add_percent_or_rate(df, new_column_name, numerator,
-                                denominator, multiplier)
-
-    return df
-
-
-def percent_cancer_small_invasive(df):
-    """
-    Adds percentage of total cancers that are small invasive (<15mm) to the
-    dataframe.
-
-    Parameters
-    ----------
-    df : pandas.DataFrame
-        df expects df[Small_invasive] and df[Total_with_cancer] among the
-        columns
-
-    Returns
-    -------
-    pandas.DataFrame
-        df with Percent_cancer_small_invasive column added
-    """
-    new_column_name = "Percent_cancer_small_invasive"
-    numerator = "Small_invasive"
-    denominator = "Total_with_cancer"
-    multiplier = 100
-
-    helpers.add_percent_or_rate(df, new_column_name, numerator,
-                                denominator, multiplier)
-
-    return df
-
-
-def percent_cancer_invasive_15mmplus(df):
-    """
-    Adds percentage of total cancers that are invasive (>=15mm) to the
-    dataframe.
-
-    Parameters
-    ----------
-    df : pandas.DataFrame
-        df expects df[Invasive_15mmplus] and df[Total_with_cancer] among the
-        columns
-
-    Returns
-    -------
-    pandas.DataFrame
-        df with Percent_cancer_invasive_15mmplus column added
-    """
-    new_column_name = "Percent_cancer_invasive_15mmplus"
-    numerator = "Invasive_15mmplus"
-    denominator = "Total_with_cancer"
-    multiplier = 100
-
-    helpers.add_percent_or_rate(df, new_column_name, numerator,
-                                denominator, multiplier)
-
-    return df
-
-
-def percent_hr_referred_assess(df):
+def sdr_expected(df, table_code, year,
+                 measure_column="Col_Def",
+                 ref_file=param.SDR_MULTIPLIER):
     """
-    Adds percentage of those screened that are referred for assessment to the
-    dataframe.
+    Creates the expected number of invasive cancers based on the Standardised
+    Detection Ratio (SDR) multiplier csv file provided by NHSE, for data
+    relating to a single year. See add_sdr_expected for multiple years.
 
     Parameters
     ----------
     df : pandas.DataFrame
-        df expects df[HR_Total_referred] and df[HR_Total_screened] among the
-        columns
+    table_code: list{str}
+        Variable name that holds the collection table code (used to apply the
+        correct multiplier - incidence or prevalence).
+    year: str
+        Used to select the applicable version of SDR ratio data
+    measure_column: str
+        Column that holds the screened information
+    ref_file: Path
+        Location of the SDR multipliers csv file.
 
     Returns
     -------
-    pandas.DataFrame
-        df with Percent_hr_referred_assess column added
-    """
-    new_column_name = "Percent_hr_referred_assess"
-    numerator = "HR_Total_referred"
-    denominator = "HR_Total_screened"
-    multiplier = 100
-
-    helpers.add_percent_or_rate(df, new_column_name, numerator,
-                                denominator, multiplier)
-
-    return df
-
-
-def rate_hr_cancer_detected(df):
-    """
-    Adds rate per 1000 of those screened that had cancer detected to the
-    dataframe.
-
-    Parameters
-    ----------
     df : pandas.DataFrame
-        df expects df[HR_Total_women_with_cancer] and df[HR_Total_screened] among the
-        columns
-
-    Returns
-    -------
-    pandas.DataFrame
-        df with Rate_hr_cancer_detected column added
+        With expected values added as additional rows within the 'Col_Def' column
     """
-    new_column_name = "Rate_hr_cancer_detected"
-    numerator = "HR_Total_women_with_cancer"
-    denominator = "HR_Total_screened"
-    multiplier = 1000
+    # Assign the year to a temporary column so the multiplier can be joined
+    df = df.assign(SDR_year=year)
+    df = add_sdr_expected(df, table_code, measure_column, "SDR_year", ref_file)
 
-    helpers.add_percent_or_rate(df, new_column_name, numerator,
-                                denominator, multiplier)
-
-    return df
+    return df.drop(["SDR_year"], axis=1)
 
 
-def rate_hr_invasive_cancers(df):
+def create_breach_table(breaches=param.VALIDATION_BREACHES):
     """
-    Adds rate per 1000 of those screened that had invasive cancer detected to
-    the dataframe.
+    Creates the table of breach thresholds used by validate_time_series,
+    including the warning message for each threshold.
 
     Parameters
     ----------
-    df : pandas.DataFrame
-        df expects df[HR_Total_invasive_cancers] and df[HR_Total_screened] among the
-        columns
+    breaches : list[tuple]
+        Rows of (measure, breach check, threshold, validation column checked,
+        type of change), as per VALIDATION_BREACHES in parameters.
 
     Returns
     -------
     pandas.DataFrame
-       df with Rate_hr_invasive_cancers column added
-    """
-    new_column_name = "Rate_hr_invasive_cancers"
-    numerator = "HR_Total_invasive_cancers"
-    denominator = "HR_Total_screened"
-    multiplier = 1000
-
-    helpers.add_percent_or_rate(df, new_column_name, numerator,
-                                denominator, multiplier)
-
-    return df
-
-
-def add_validation_columns(df, validations, measures):
-    """
-    Defines and adds the required validation check columns for time series
-    validations outputs.
+        With one row per measure and breach check.
+    """
+    return pd.DataFrame(
+        [(measure, validation, threshold, check_column,
+          f"More than {threshold}{change_type} difference compared to "
+          "previous year")
+         for measure, validation, threshold, check_column, change_type
+         in breaches],
+        columns=["Measure", "Validation", "Threshold", "Check_column",
+                 "Message"])
+
+
+def validate_time_series(df_panel, validations, index,
+                         measure_column="Col_Def",
+                         ts_column="CollectionYearRange",
+                         value_column="Value",
+                         breaches=param.VALIDATION_BREACHES):
+    """
+    Validation engine for the time series validations outputs. Takes a long
+    panel with a row for each series (e.g. organisation and measure) and
+    year, for any number of measures, and adds every validation check for
+    all the series in a single pass. Breaches are checked against the
+    threshold for the measure of each series (see create_breach_table), and
+    anomaly scores use every year of each series (see anomalies.py).
 
     Parameters
     ----------
-    df : pandas.DataFrame
+    df_panel : pandas.DataFrame
+        Long panel of values, with the index, measure_column and ts_column
+        columns.
     validations: list[str]
         list of pre-defined validations to include in the output, as defined
         within this function.
-    measures: list[str]
-        list of measures included in the output, which will determine which
-        breach parameter value to use.
+    index : list[str]
+        Columns that identify each series.
+    measure_column: str
+        Column that holds the measure of each series, used to select the
+        breach thresholds.
+    ts_column: str
+        Column that holds the years for the time series.
+    value_column: str
+        Column that holds the values.
+    breaches : list[tuple]
+        Breach thresholds (see create_breach_table).
 
     Returns
     -------
     pandas.DataFrame
-
+        One row for each series (with the index and measure columns), with
+        the years as columns followed by the validation columns.
     """
-    # Define list of valid validation measures
+    # Define list of valid validation measures, in the order they are output
     valid_list = ["YoY_change", "YoY_percent_change", "Avg_columns",
                   "Avg_change", "Avg_percent_change", "YoY_breach",
-                  "Avg_breach"]
+                  "Avg_breach", "Robust_z", "Outlier_years", "Rolling_MAD",
+                  "Break_year", "Break_score", "Anomaly_breach"]
 
     # Check for an invalid validation type in the input argument
     for validation in validations:
         helpers.validate_value_with_list("validations", validation,
                                          valid_list)
 
-    # Apply any validations listed in the validations argument
-
-    validation = "YoY_change"
-    if validation in validations:
-        # Add Year on Year absolute change using years defined in parameters
-        df = helpers.add_column_difference(df, new_column_name=validation,
-                                           col1=None,  col2=None)
-
-    validation = "YoY_percent_change"
-    if validation in validations:
-        # Add Year on Year percent change using years defined in parameters
-        df = helpers.add_percent_change(df, validation, param.YOY_TO_YEAR,
-                                        param.YOY_FROM_YEAR, 100)
-
-    validation = "Avg_columns"
-    years = param.ROLLING_AVG_YEARS
-    if validation in validations:
-        # Add average across number of years, as defined in parameters
-        df = helpers.add_average_of_columns(df, param.YOY_TO_YEAR, years)
-
-    validation = "Avg_change"
-    if validation in validations:
-        # Add absolute change from current year to average across years field
-        df = helpers.add_column_difference(df, new_column_name=validation,
-                                           col1="Avg_columns", col2=param.YOY_TO_YEAR)
-
-    validation = "Avg_percent_change"
-    if validation in validations:
-        # Add percent change from current year to average across years field
-        df = helpers.add_percent_change(df, validation, param.YOY_TO_YEAR,
-                                        "Avg_columns", 100)
-
-    validation = "YoY_breach"
-    if validation in validations:
-        # Add a year on year breach warning based on the measure
-        if "Coverage" in measures:
-            breach = param.YOY_COV_BREACH_KC63
-            check_column = "YoY_change"
-            change_type = "absolute"
-        elif 'Rate_with_cancer' in measures:
-            breach = param.YOY_RATE_BREACH_KC62
-            check_column = "YoY_change"
-            change_type = "absolute"
-        elif ('Women_eligible' in measures) | ('Women_screened_less3yrs' in measures):
-            breach = param.YOY_BREACH_KC63
-            check_column = "YoY_percent_change"
-            change_type = "percentage"
-        elif ('Total_with_cancer' in measures) | ('Invited' in measures):
-            breach = param.YOY_BREACH_KC62
-            check_column = "YoY_percent_change"
-            change_type = "percentage"
-
-        df[validation] = np.where(df[check_column] > breach, "More than "
-                                  + str(breach) + change_type
-                                  + " difference compared to previous year",
-                                  "Pass")
-
-    validation = "Avg_breach"
-    if validation in validations:
-        # Add an average breach warning based on the measure
-        if "Coverage" in measures:
-            breach = param.AVG_COV_BREACH_KC63
-            check_column = "Avg_change"
-            change_type = "percentage point"
-        elif ('Rate_with_cancer' in measures):
-            breach = param.AVG_RATE_BREACH_KC62
-            check_column = "Avg_change"
-            change_type = "rate"
-        elif ('Women_eligible' in measures) | ('Women_screened_less3yrs' in measures):
-            breach = param.AVG_BREACH_KC63
-            check_column = "Avg_percent_change"
-            change_type = "percentage"
-        elif ('Total_with_cancer' in measures) | ('Invited' in measures):
-            breach = param.AVG_BREACH_KC62
-            check_column = "Avg_percent_change"
-            change_type = "percentage"
-
-        df[validation] = np.where(df[check_column] > breach, "More than "
-                                  + str(breach) + change_type
-                                  + " difference compared to previous year",
-                                  "Pass")
-
-    return df
+    # Lay out the years as columns, with one row for each series that has
+    # any values
+    index = list(dict.fromkeys([*index, measure_column]))
+    df = (df_panel.groupby([*index, ts_column])[value_column].sum(min_count=1)
+          .unstack(ts_column)
+          .dropna(how="all"))
+    years = list(df.columns)
+
+    # Select the breach thresholds for the measure of each series
+    df_breaches = create_breach_table(breaches)
+    df_breaches = df_breaches[df_breaches["Validation"].isin(validations)]
+    measures = df.index.get_level_values(measure_column)
+
+    # Identify the checks needed for the validations and breaches
+    required = set(validations) | set(df_breaches["Check_column"])
+    if required & {"Avg_change", "Avg_percent_change"}:
+        required.add("Avg_columns")
+    if "Anomaly_breach" in required:
+        required.update(["Outlier_years", "Rolling_MAD", "Break_year",
+                         "Break_score"])
+
+    to_year = param.YOY_TO_YEAR
+    from_year = param.YOY_FROM_YEAR
+    checks = {}
+
+    # Year on year absolute change between the last 2 years
+    if "YoY_change" in required:
+        if len(years) < 2:
+            raise ValueError("A difference calculation is being attempted on "
+                             "less than 2 columns")
+        checks["YoY_change"] = df[years[-1]] - df[years[-2]]
+
+    # Year on year percent change using years defined in parameters
+    if "YoY_percent_change" in required:
+        checks["YoY_percent_change"] = (((df[to_year] - df[from_year])
+                                         / df[from_year]) * 100)
+
+    # Average across number of years, as defined in parameters
+    if "Avg_columns" in required:
+        avg_years = helpers.get_year_range(to_year, param.ROLLING_AVG_YEARS)
+        checks["Avg_columns"] = df[avg_years].mean(axis=1)
+
+    # Absolute change from current year to average across years
+    if "Avg_change" in required:
+        checks["Avg_change"] = df[to_year] - checks["Avg_columns"]
+
+    # Percent change from current year to average across years
+    if "Avg_percent_change" in required:
+        checks["Avg_percent_change"] = (((df[to_year] - checks["Avg_columns"])
+                                         / checks["Avg_columns"]) * 100)
+
+    # Score every year of each series for anomalies (see anomalies.py): the
+    # latest robust z-score and the number of years that are outliers for
+    # the series, the latest score against a rolling window of previous
+    # years, and the largest shift in the level of the series
+    values = df[years].to_numpy(dtype=float)
+
+    # Calibrate the thresholds to the length of the series, so that series
+    # of noise are rarely flagged
+    if "Outlier_years" in required:
+        z_breach, rolling_breach, break_breach = (
+            np.fmax(breach, calibrated) for breach, calibrated in zip(
+                (param.ANOMALY_Z_BREACH, param.ROLLING_MAD_BREACH,
+                 param.BREAK_BREACH),
+                anomalies.breach_thresholds(
+                    len(years), param.ROLLING_MAD_YEARS,
+                    param.BREAK_MIN_YEARS, param.ANOMALY_FALSE_ALARM_RATE)))
+
+    if required & {"Robust_z", "Outlier_years"}:
+        z_scores = anomalies.robust_z_scores(values)
+        checks["Robust_z"] = z_scores[:, -1]
+        if "Outlier_years" in required:
+            checks["Outlier_years"] = (np.abs(z_scores)
+                                       > z_breach).sum(axis=1)
+
+    if "Rolling_MAD" in required:
+        checks["Rolling_MAD"] = anomalies.rolling_mad_scores(
+            values, param.ROLLING_MAD_YEARS)[:, -1]
+
+    if required & {"Break_year", "Break_score"}:
+        position, score = anomalies.structural_breaks(values,
+                                                      param.BREAK_MIN_YEARS)
+        checks["Break_year"] = np.where(position >= 0,
+                                        np.array(years, dtype=object)[position],
+                                        None)
+        checks["Break_score"] = score
+
+    # Flag any anomalies, listing each type found
+    if "Anomaly_breach" in required:
+        outlier_years = pd.Series(checks["Outlier_years"], index=df.index)
+        break_year = pd.Series(checks["Break_year"], index=df.index)
+        message = (
+            (f"Robust z-score above {z_breach:.1f} in "
+             + outlier_years.astype(str) + " years; ")
+            .where(outlier_years > 0, "")
+            + pd.Series(f"Rolling MAD score above {rolling_breach:.1f} "
+                        "in latest year; ",
+                        index=df.index)
+            .where(np.abs(checks["Rolling_MAD"]) > rolling_breach, "")
+            + ("Level shift from " + break_year.astype(str) + "; ")
+            .where(checks["Break_score"] > break_breach, ""))
+        checks["Anomaly_breach"] = message.str[:-2].where(message != "",
+                                                          "Pass")
+
+    # Flag the breaches, comparing the check for each series with the
+    # threshold for its measure
+    for validation, df_validation in df_breaches.groupby("Validation"):
+        missing = set(measures) - set(df_validation["Measure"])
+        if missing:
+            raise ValueError(f"There is no {validation} threshold for "
+                             f"{sorted(missing)}")
+        df_limits = df_validation.set_index("Measure").loc[measures]
+        check = np.full(len(df), np.nan)
+        for check_column in df_limits["Check_column"].unique():
+            is_column = (df_limits["Check_column"] == check_column).to_numpy()
+            check[is_column] = checks[check_column].to_numpy()[is_column]
+        checks[validation] = np.where(check > df_limits["Threshold"].to_numpy(),
+                                      df_limits["Message"].to_numpy(), "Pass")
+
+    # Add the validations to the output
+    for validation in valid_list:
+        if validation in validations:
+            df[validation] = checks[validation]
+
+    return df.reset_index()
@@ -193,7 +193,36 @@ def replace_col_value(df, col_names, replace_value):
     return df
 
 
-def remove_rows(df, remove_values):
+def use_org_name_key(df, name_column="Org_Name", key_column="Org_Name_Key"):
+    """
+    Returns a copy of the dataframe where the org names are replaced by the
+    normalised (upper case) org name key added in pre-processing. If the key
+    is not available, the upper case names are derived from the org names.
+    The input dataframe is not modified.
+
+    Parameters
+    ----------
+    df : pandas.DataFrame
+    name_column : str
+        Column containing the org names.
+    key_column : str
+        Column containing the normalised org names.
+
+    Returns
+    -------
+    df : pandas.DataFrame
+        df with the org names replaced by their normalised key.
+    """
+    if key_column in df.columns:
+        df = df.drop(columns=name_column).rename(columns={key_column:
+                                                          name_column})
+    else:
+        df = df.assign(**{name_column: df[name_column].str.upper()})
+
+    return df
+
+
+def remove_rows(df, remove_values, columns=None):
     """
     Will remove rows from dataframe that contain the specified values
 
@@ -202,17 +231,24 @@ def remove_rows(df, remove_values):
     df : pandas.DataFrame
     remove_values : list[str]
         List of values based on which the rows will be removed if found
-        in any df columns.
+        in any of the checked columns.
+    columns : list[str]
+        Columns to check for the values (e.g. the row label columns, where
+        totals are labelled by the pivot and subtotal steps). Defaults to all
+        text columns, as other columns can not contain the text values.
 
     Returns
     -------
     df : pandas.DataFrame
         df with rows removed
     """
-    for condition in remove_values:
-        df = df[~df.eq(condition).any(axis=1)]
+    if columns is None:
+        columns = df.select_dtypes(include=["object", "category"]).columns
 
-    return df
+    # Check only the selected columns for any of the values in one pass
+    remove = df[columns].isin(remove_values).any(axis=1)
+
+    return df[~remove]
 
 
 def excel_cell_to_row_num(cell):
@@ -486,8 +522,91 @@ def add_percent_of_total(df, new_col_name, total_name="Grand_total"):
     return df
 
 
+def add_pivot_totals(table, total_name="Grand_total"):
+    """
+    Adds a total column (sum of each row) and a total row (sum of each
+    column) to a crosstab of summed values, in the same layout as
+    pd.pivot_table with margins=True.
+
+    Parameters
+    ----------
+    table : pandas.DataFrame
+        Crosstab indexed by the row labels, with one column per column label.
+    total_name : str
+        Label given to the total row and column.
+
+    Returns
+    -------
+    table : pandas.DataFrame
+        Crosstab with the total row and column added.
+    """
+    rows = list(table.index.names)
+
+    # Label used for the total row (blank for any other row levels)
+    if len(rows) == 1:
+        total_index = pd.Index([total_name], name=rows[0])
+    else:
+        total_index = pd.MultiIndex.from_tuples(
+            [(total_name,) + ("",) * (len(rows) - 1)], names=rows)
+
+    # Add the total column from the sum of the cells for each row
+    table = table.copy()
+    table[total_name] = table.sum(axis=1)
+
+    # Create the total row from the sum of the cells for each column
+    total_row = pd.DataFrame([table.sum().to_numpy()], index=total_index,
+                             columns=table.columns)
+
+    return pd.concat([table, total_row])
+
+
+def pivot_with_totals(df, rows, columns, values="Value",
+                      total_name="Grand_total"):
+    """
+    Pivots the dataframe into a crosstab of summed values, with a total row and
+    (where columns are set) a total column. Gives the same layout as
+    pd.pivot_table with margins=True, but the totals are created from the
+    summed cells rather than by separate aggregations of the data.
+
+    Parameters
+    ----------
+    df : pandas.DataFrame
+    rows : list[str]
+        Variable name(s) that hold the row labels.
+    columns : str
+        Variable name that holds the column labels. Accepts None (values
+        are summed into a single column).
+    values : str
+        Variable name that holds the values to be summed.
+    total_name : str
+        Label given to the total row and column.
+
+    Returns
+    -------
+    table : pandas.DataFrame
+        Crosstab indexed by the row labels.
+    """
+    col_list = [] if columns is None else [columns]
+
+    # Sum the values for each cell in a single aggregation
+    cells = df.groupby(rows + col_list)[values].sum()
+
+    if columns is None:
+        # Label used for the total row (blank for any other row levels)
+        if len(rows) == 1:
+            total_index = pd.Index([total_name], name=rows[0])
+        else:
+            total_index = pd.MultiIndex.from_tuples(
+                [(total_name,) + ("",) * (len(rows) - 1)], names=rows)
+        total_row = pd.DataFrame({values: [cells.sum()]}, index=total_index)
+        return pd.concat([cells.to_frame(), total_row])
+
+    # Lay out the cells with the columns as headers and add the totals
+    return add_pivot_totals(cells.unstack(columns), total_name)
+
+
 def add_subtotals(df, columns,
-                  total_name="Grand_total"):
+                  total_name="Grand_total", total_columns=None):
     """
     Add row totals and sub-totals to a dataframe for all specified dataframe
     column combinations.
@@ -499,6 +618,10 @@ def add_subtotals(df, columns,
         Columns to use in the breakdowns (e.g. age, sex, etc)
     total_name: str
         Default value to be assigned where totals are added.
+    total_columns: list[str]
+        Optional subset of columns for which totals are needed, so only the
+        combinations of these columns are totalled.
+        Default is None (totals added for all columns).
 
     Returns
     -------
@@ -509,11 +632,15 @@ def add_subtotals(df, columns,
     # List to store the different sub-groups
     total_dfs = []
 
+    if total_columns is None:
+        total_columns = columns
+
     # Combinations of columns to be replaced with total_name
     # Firstly don't replace any, then replace a single column, then 2 columns, etc
     # E.g. [[], ["sex"], ["age"], ["sex", "age"], ...]
-    n_replacements = len(columns) + 1
-    replace_combinations = [combinations(columns, n) for n in range(n_replacements)]
+    n_replacements = len(total_columns) + 1
+    replace_combinations = [combinations(total_columns, n)
+                            for n in range(n_replacements)]
     replace_combinations = chain.from_iterable(replace_combinations)
 
     for columns_to_replace in replace_combinations:
@@ -535,10 +662,62 @@ def add_subtotals(df, columns,
     return pd.concat(total_dfs, axis=0).reset_index(drop=True)
 
 
+def create_subgroup_lookup(subgroup_column, subgroup_info,
+                           include_nested=True):
+    """
+    Compiles the subgroup definitions for a single column into a lookup
+    table of member values to subgroup codes.
+    Where a subgroup includes the code of an earlier subgroup in the same
+    column, the members of that earlier subgroup are also mapped to it (e.g.
+    {"45-74": [...], "45 and over": ["45-74", ">=75"]}).
+
+    Parameters
+    ----------
+    subgroup_column: str
+        Name of the column the subgroups apply to
+    subgroup_info: dict(str, list)
+        Contains the new subgroup code(s), and the original values that will
+        form each subgroup.
+    include_nested: bool
+        If True, earlier subgroup codes referenced within a subgroup are
+        expanded to their members.
+        Default is True
+
+    Returns
+    -------
+    pandas.DataFrame
+        One row per member value and subgroup, with the member value held in
+        subgroup_column, and the subgroup code and its position in
+        subgroup_info held in Subgroup_Code and Subgroup_Order.
+    """
+    # Store the expanded list of members of each subgroup, so they can be
+    # used by any later subgroups that reference them
+    subgroup_members = {}
+    lookup = []
+
+    for subgroup_order, (subgroup_code, subgroup_values) in enumerate(subgroup_info.items()):
+        members = []
+        for value in subgroup_values:
+            members.append(value)
+            # Add the members of any earlier subgroup referenced by its code
+            if include_nested:
+                members.extend(subgroup_members.get(value, []))
+        subgroup_members[subgroup_code] = members
+
+        lookup.extend([(member, subgroup_code, subgroup_order)
+                       for member in members])
+
+    return pd.DataFrame(lookup, columns=[subgroup_column, "Subgroup_Code",
+                                         "Subgroup_Order"])
+
+
 def add_subgroup_rows(df, breakdown, subgroup):
     """
     Combines groups of values in specified dataframe column into a subgroup
     and adds new rows to the datatframe with the grouped value.
+    Subgroups are applied in the order they are defined, so a subgroup can
+    include an earlier subgroup code from the same column, and subgroups of
+    a later column are also applied to the subgroup rows of earlier columns.
 
     Parameters
     ----------
@@ -560,22 +739,59 @@ def add_subgroup_rows(df, breakdown, subgroup):
     pandas.DataFrame with subgroup added to target column
 
     """
+    df_subgroup = df.copy()
+    # Identifies which subgroup each row will be aggregated into, where -1
+    # indicates an original (non subgroup) row
+    df_subgroup["Subgroup_Block"] = -1
+    block_offset = 0
+
     # Extract the target column, and the subgroup info (a 2nd dictionary nested
     # within the subgroup dictionary)
     for subgroup_column, subgroup_info in subgroup.items():
-        # For each set of items in subgroup info
-        for subgroup_code, subgroup_values in subgroup_info.items():
-            # Then add new rows for the subgroup
-            df_subgroup = df[df[subgroup_column].isin(subgroup_values)].copy(deep=True)
-            df_subgroup[subgroup_column] = subgroup_code
-            df_subgroup = (
-                df_subgroup.groupby([*breakdown])
-                .sum()
-                .reset_index()
-                )
-            df = pd.concat([df, df_subgroup])
-
-    return df
+        # Create the lookup of member values to subgroup codes. Nested
+        # subgroup codes only exist in the data if the column is retained
+        # in the aggregation.
+        df_lookup = create_subgroup_lookup(subgroup_column, subgroup_info,
+                                           subgroup_column in breakdown)
+
+        # Map each value to itself as well, so that the original values are
+        # retained to be used in the subgroups of any later columns
+        df_identity = pd.DataFrame({subgroup_column: df_subgroup[subgroup_column].unique()})
+        df_identity["Subgroup_Code"] = df_identity[subgroup_column]
+        df_identity["Subgroup_Order"] = -1
+        df_lookup = pd.concat([df_identity, df_lookup], ignore_index=True)
+
+        # Join to the lookup, which adds a copy of each row for every subgroup
+        # its value is a member of
+        df_subgroup = df_subgroup.merge(df_lookup, how="inner",
+                                        on=subgroup_column)
+        df_subgroup[subgroup_column] = df_subgroup["Subgroup_Code"]
+
+        # Rows that were added to a subgroup of this column are aggregated
+        # in that subgroup, after those of any earlier columns
+        df_subgroup["Subgroup_Block"] = np.where(
+            df_subgroup["Subgroup_Order"] >= 0,
+            block_offset + df_subgroup["Subgroup_Order"],
+            df_subgroup["Subgroup_Block"])
+        df_subgroup.drop(columns=["Subgroup_Code", "Subgroup_Order"],
+                         inplace=True)
+        block_offset += len(subgroup_info)
+
+    # Aggregate the rows for all subgroups in one step
+    df_subgroup = df_subgroup[df_subgroup["Subgroup_Block"] >= 0]
+    df_subgroup = (
+        df_subgroup.groupby(["Subgroup_Block", *breakdown])
+        .sum()
+        .reset_index()
+        )
+
+    # Index each subgroup from 0 (as per the aggregated rows of a single
+    # subgroup), then append all the subgroup rows to the original data
+    df_subgroup.index = df_subgroup.groupby("Subgroup_Block").cumcount().values
+    df_subgroup.drop(columns=["Subgroup_Block"], inplace=True)
+    df_subgroup.columns.name = df.columns.name
+
+    return pd.concat([df, df_subgroup])
 
 
 def add_subgroup_columns(df, subgroup):
@@ -603,7 +819,10 @@ def add_subgroup_columns(df, subgroup):
 
 def order_by_list(df, column, order):
     """
-    Orders the dataframe based on a custom list applied to a specified column
+    Orders the dataframe based on a custom list applied to a specified column.
+    Rows with values not in the list are removed, and an empty row is added
+    for any value in the list that is not in the dataframe (so that fixed
+    table layouts are retained).
 
     Parameters
     ----------
@@ -612,18 +831,32 @@ def order_by_list(df, column, order):
     columm: str
         Column name to be ordered on.
     order: list[str]
-        List that contains the custom order for the specified column
+        List that contains the custom (unique) order for the specified column
 
     Returns
     -------
-    pandas.DataFrame with subgroup column(s) added
+    pandas.DataFrame ordered by the list, with the specified column first
 
     """
-    # Create a dummy df with the required list and the column name to sort on
-    dummy = pd.Series(order, name=column).to_frame()
-
-    # Use left merge on the dummy to return a sorted df
-    ordered_df = pd.merge(dummy, df, on=column, how='left')
+    # Rank each row by the position of its value in the custom order
+    # (rows with values not in the order have a rank of -1)
+    ranks = pd.Categorical(df[column], categories=order).codes
+    df = df[ranks >= 0]
+    ranks = ranks[ranks >= 0]
+
+    # Add an empty row for any values in the order that are not in the data
+    missing = np.setdiff1d(np.arange(len(order)), ranks)
+    if len(missing) > 0:
+        df_missing = pd.DataFrame({column: [order[rank] for rank in missing]})
+        df = pd.concat([df, df_missing])
+        ranks = np.concatenate([ranks, missing])
+
+    # Apply the order in a single step (keeping the existing order of rows
+    # with the same value), with the ordered column first
+    columns = [column] + [col for col in df.columns if col != column]
+    ordered_df = (df.take(np.argsort(ranks, kind="stable"))[columns]
+                  .reset_index(drop=True)
+                  .rename_axis(columns=None))
 
     return ordered_df
 
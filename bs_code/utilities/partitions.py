@@ -0,0 +1,101 @@
+import logging
+import pandas as pd
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional, Tuple
+import bs_code.parameters as param
+import bs_code.utilities.field_definitions as definitions
+
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class PartitionedData:
+    """
+    Pre-processed data for a collection that is stored on disk, partitioned
+    by year (see write_partitions). Only the location of the partitions is
+    held, so it can be used in place of the source dataframe (and passed to
+    worker processes) without holding the data in memory. The partitions are
+    loaded one at a time by processing.filter_dataframe.
+
+    Attributes
+    ----------
+    collection : str
+        The collection reference (KC62 or KC63)
+    path : pathlib.Path
+        Folder that holds the partitions for the collection.
+    years : tuple[str]
+        Years with a partition, oldest first.
+    measures : tuple[str]
+        Sparse measures across all the partitions (see
+        field_definitions.add_measures_counts), or None if the data is not
+        sparse.
+    """
+    collection: str
+    path: Path
+    years: Tuple[str, ...]
+    measures: Optional[Tuple[str, ...]] = None
+
+    def partition_path(self, year):
+        """
+        Returns the location of the partition for a year.
+        """
+        return self.path / f"{year}.pkl"
+
+    def load(self, year):
+        """
+        Loads the partition for a year. Every partition has the same sparse
+        measures, so that any counts of 0 are filled in as for the full data.
+        """
+        df = pd.read_pickle(self.partition_path(year))
+        if self.measures is not None:
+            df = definitions.mark_sparse_measures(df, list(self.measures))
+
+        return df
+
+
+def write_partitions(chunks, collection, partition_dir=param.PARTITION_DIR,
+                     year_column="CollectionYearRange"):
+    """
+    Writes pre-processed data to disk with one partition (pickle file) for
+    each year. The data can be passed in chunks (e.g. one year at a time as
+    it is imported), so that the full time series is not held in memory.
+
+    Parameters
+    ----------
+    chunks : iterable[pandas.DataFrame]
+        Pre-processed data for the collection, in one or more dataframes.
+        A year should not be split across dataframes.
+    collection : str
+        The collection reference (KC62 or KC63)
+    partition_dir : pathlib.Path
+        Folder where the partitions are written (in a sub-folder for the
+        collection).
+    year_column : str
+        Column that holds the year.
+
+    Returns
+    -------
+    PartitionedData
+    """
+    path = Path(partition_dir) / collection
+    path.mkdir(parents=True, exist_ok=True)
+
+    years = []
+    measures = None
+
+    for df in chunks:
+        # Keep all the sparse measures found, in the order they are found
+        chunk_measures = definitions.sparse_measures(df)
+        if chunk_measures is not None:
+            measures = list(dict.fromkeys((measures or []) + chunk_measures))
+
+        for year in sorted(df[year_column].unique()):
+            logging.info(f"Writing the {year} {collection} data partition")
+            df_year = df[df[year_column] == year]
+            df_year.to_pickle(path / f"{year}.pkl")
+            years.append(year)
+
+    return PartitionedData(collection, path, tuple(sorted(years)),
+                           None if measures is None else tuple(measures))
@@ -0,0 +1,231 @@
+"""
+Purpose of the script: contains the optional polars engine used to sum the
+counts for the outputs (see parameters.ENGINE). The source dataframe is
+converted to polars once, and each sum is run as a single lazy query, so
+that polars can push the filters and column selections down to the scan,
+reuse any part of the query that is used twice, and run it on all cores.
+The results are returned as pandas, so the layout of the outputs is
+unchanged.
+polars is not a required package: it is only imported where installed.
+"""
+import re
+import logging
+
+try:
+    import polars as pl
+except ImportError:
+    pl = None
+
+
+logger = logging.getLogger(__name__)
+
+# Placeholder for missing text values while the filters are applied, so that
+# comparisons behave as in pandas (a missing value is never equal to, or in
+# a list of, any text value)
+NULL_PLACEHOLDER = "\x00"
+
+
+def check_available():
+    """
+    Checks that the polars package is installed, raising an error if not.
+
+    Returns
+    -------
+    None
+    """
+    if pl is None:
+        raise ValueError("The polars engine was selected but polars is not "
+                         "installed. Install polars or set ENGINE to 'pandas'")
+
+
+def query_to_sql(condition):
+    """
+    Converts a pandas query string, as used in the output filter conditions,
+    into an equivalent SQL expression that can be evaluated by polars.
+    Quoted values are left unchanged (other than using single quotes).
+
+    Parameters
+    ----------
+    condition : str
+        pandas query string (e.g. "(Row_Def not in['<=44']) & (Part == '1')")
+
+    Returns
+    -------
+    str
+        SQL expression (e.g. "(Row_Def NOT IN ('<=44')) AND (Part = '1')")
+    """
+    # Split the condition so that quoted values are kept separate from the
+    # operators, column names and brackets
+    parts = re.split(r"('[^']*'|\"[^\"]*\")", condition)
+
+    sql = []
+    for part in parts:
+        # Quoted values are passed through using SQL single quotes
+        if part.startswith(("'", '"')):
+            sql.append("'" + part[1:-1].replace("'", "''") + "'")
+            continue
+        # Convert list membership (including == and != against a list)
+        part = re.sub(r"(\bnot\s+in|!=)\s*\[", " NOT IN (", part)
+        part = re.sub(r"(\bin|==)\s*\[", " IN (", part)
+        part = part.replace("]", ")")
+        # Convert comparison and logical operators
+        part = part.replace("==", "=").replace("!=", "<>")
+        part = part.replace("&", " AND ").replace("|", " OR ")
+        part = part.replace("~", " NOT ")
+        sql.append(part)
+
+    return "".join(sql)
+
+
+def query_columns(condition, columns):
+    """
+    Finds the columns used by a pandas query string.
+
+    Parameters
+    ----------
+    condition : str
+    columns : list[str]
+        Columns of the dataframe the query is applied to.
+
+    Returns
+    -------
+    list[str]
+        Columns used, in the order of columns.
+    """
+    names = set(re.findall(r"\b\w+\b",
+                           re.sub(r"'[^']*'|\"[^\"]*\"", "", condition)))
+
+    return [column for column in columns if column in names]
+
+
+def to_lazy(df):
+    """
+    Converts a pandas dataframe to a polars lazy frame, with categorical
+    columns as text and missing text values replaced by NULL_PLACEHOLDER.
+    The index is not converted.
+
+    Parameters
+    ----------
+    df : pandas.DataFrame
+
+    Returns
+    -------
+    polars.LazyFrame
+    """
+    check_available()
+
+    df_polars = pl.from_pandas(df)
+    text = [column for column, dtype in df_polars.schema.items()
+            if dtype in (pl.Utf8, pl.Categorical)]
+
+    return df_polars.lazy().with_columns(
+        [pl.col(column).cast(pl.Utf8).fill_null(NULL_PLACEHOLDER)
+         for column in text])
+
+
+def sum_counts(source, year_range, part, table_code, filter_condition,
+               group_columns, measure_column, measures=None,
+               sparse_measures=None, rename=None, dropna=True,
+               value_column="Value", year_column="CollectionYearRange"):
+    """
+    Filters the data as processing.filter_dataframe does, and sums the
+    values for each group, in a single lazy query. Where the data has sparse
+    measures (see field_definitions.fill_zero_counts), a count of 0 is
+    included for each of them in every group, so the groups are the same as
+    for the pandas engine.
+
+    Parameters
+    ----------
+    source : polars.LazyFrame
+        Source data, converted with to_lazy.
+    year_range : list[str]
+        Years to be included.
+    part : list[str]
+        Collection parts to be included. Accepts None (all parts).
+    table_code : list[str]
+        Collection table codes to be included. Accepts None (all tables).
+    filter_condition : str
+        Optional pandas query string, converted using query_to_sql.
+    group_columns : list[str]
+        Columns to sum by (after any columns are renamed), including the
+        measure_column.
+    measure_column : str
+        Column that holds the measure information (e.g. Col_Def).
+    measures : list[str]
+        Measures to be summed. Default is None (all measures).
+    sparse_measures : list[str]
+        Measures with counts of 0 not stored in the data. Default is None.
+    rename : dict
+        Columns to be renamed once the data is filtered, replacing any column
+        of the new name. Default is None.
+    dropna : bool
+        If True, groups with missing values are not included.
+    value_column : str
+        Column that holds the counts.
+    year_column : str
+        Column that holds the year.
+
+    Returns
+    -------
+    pandas.Series
+        Summed values, indexed by the group columns in sorted order.
+    """
+    rename = rename or {}
+    renamed = {new: old for old, new in rename.items()}
+    columns = source.collect_schema().names()
+
+    # Select only the columns needed for the filters and the groups
+    needed = [renamed.get(column, column) for column in group_columns]
+    if filter_condition is not None:
+        needed += query_columns(filter_condition, columns)
+    needed = list(dict.fromkeys(needed))
+    others = [column for column in needed if column != measure_column]
+
+    # Select the years, parts and tables
+    predicates = [pl.col(year_column).is_in(list(year_range))]
+    if part is not None:
+        predicates.append(pl.col("Part").is_in(list(part)))
+    if table_code is not None:
+        predicates.append(pl.col("Table_Code").is_in(list(table_code)))
+    lf = source.filter(pl.all_horizontal(predicates))
+
+    # Add a count of 0 for each sparse measure in every group (the filtered
+    # data is used twice, and only read once)
+    lf_values = lf.select([*needed, value_column])
+    if sparse_measures:
+        lf_zeros = (lf.select(others).unique()
+                    .join(pl.LazyFrame({measure_column: list(sparse_measures)},
+                                       schema={measure_column: pl.Utf8}),
+                          how="cross")
+                    .with_columns(pl.lit(0).cast(lf_values.collect_schema()
+                                                 [value_column])
+                                  .alias(value_column))
+                    .select([*needed, value_column]))
+        lf_values = pl.concat([lf_values, lf_zeros])
+
+    # Apply the optional general filter and select the measures
+    if filter_condition is not None:
+        lf_values = lf_values.filter(pl.sql_expr(query_to_sql(filter_condition)))
+    if measures is not None:
+        lf_values = lf_values.filter(pl.col(measure_column).is_in(
+            list(measures)))
+
+    # Restore the missing text values, and rename any columns
+    text = [column for column, dtype in lf_values.collect_schema().items()
+            if dtype == pl.Utf8]
+    lf_values = lf_values.with_columns(
+        [pl.when(pl.col(column) == NULL_PLACEHOLDER).then(None)
+         .otherwise(pl.col(column)).alias(column) for column in text])
+    replaced = [column for column in rename.values() if column in needed]
+    lf_values = lf_values.drop(replaced).rename(rename)
+
+    if dropna:
+        lf_values = lf_values.drop_nulls(subset=group_columns)
+
+    # Sum the values for each group
+    df_sums = (lf_values.group_by(group_columns)
+               .agg(pl.col(value_column).sum())
+               .collect()
+               .to_pandas())
+
+    return df_sums.set_index(group_columns)[value_column].sort_index()
@@ -1,9 +1,13 @@
 import pandas as pd
 import numpy as np
 import logging
+import pickle
+from functools import partial
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 import bs_code.parameters as param
 import bs_code.utilities.field_definitions as definitions
-from bs_code.utilities import load, helpers
+from bs_code.utilities import load, helpers, partitions
 
 
 logger = logging.getLogger(__name__)
@@ -99,7 +103,61 @@ def combine_small_las(df, lookup):
     return df
 
 
-def update_kc63_data(df):
+def add_org_name_key(df, name_column="Org_Name", key_column="Org_Name_Key"):
+    """
+    Adds a normalised (upper case) copy of the org names, used where LA names
+    need to be grouped regardless of the letter casing used in the source data
+    (e.g. in the validation outputs). The casing is applied to the distinct
+    names only and then mapped back to the rows.
+
+    Parameters
+    ----------
+    df : pandas.DataFrame
+    name_column : str
+        Column containing the org names.
+    key_column : str
+        Name of the new column that will hold the normalised org names.
+
+    Returns
+    -------
+    df : pandas.DataFrame
+        df with the normalised org name column added.
+    """
+    # Standardise letter casing once for each distinct org name
+    names = pd.Series(df[name_column].unique())
+    name_lookup = dict(zip(names, names.str.upper()))
+
+    df[key_column] = df[name_column].map(name_lookup)
+
+    return df
+
+
+def add_filter_index(df, index_columns=["CollectionYearRange", "Part",
+                                         "Table_Code", "Org_Code"]):
+    """
+    Sorts the dataframe on the columns used to select the data for outputs
+    and sets these as a lexsorted MultiIndex (the columns are kept), so that
+    filter_dataframe can find the rows for the required years, parts and
+    table codes by binary search rather than checking every row.
+
+    Parameters
+    ----------
+    df : pandas.DataFrame
+    index_columns : list[str]
+        Columns to sort on and set as the index, starting with the year, part
+        and table code columns.
+
+    Returns
+    -------
+    df : pandas.DataFrame
+        df sorted and indexed on the index columns.
+    """
+    df = df.set_index(pd.MultiIndex.from_frame(df[index_columns]))
+
+    return df.sort_index()
+
+
+def update_kc63_data(df, df_la_updates=None):
     """
     Applies all pre-processing functions to KC63 data needed prior to creating
     publication outputs (e.g. standardising region names, appending region order
@@ -108,6 +166,9 @@ def update_kc63_data(df):
     Parameters
     ----------
     df : pandas.DataFrame
+    df_la_updates : pandas.DataFrame
+        Updates to be made to LAs (see load.import_la_update_info).
+        Default is None (imported from the database).
 
     Returns
     -------
@@ -119,8 +180,9 @@ def update_kc63_data(df):
 
     year_list = helpers.create_year_list(df, "CollectionYearRange")
 
-    # Import data for LA region updates
-    df_la_updates = load.import_la_update_info()
+    # Import data for LA region updates, where not already imported
+    if df_la_updates is None:
+        df_la_updates = load.import_la_update_info()
     # Update LA region info
     df = update_la_regions(df, df_la_updates, year_list)
 
@@ -133,6 +195,12 @@ def update_kc63_data(df):
     # Add any additional measures (counts) required from field definitions
     df = definitions.add_measures_counts(df, "KC63")
 
+    # Add the normalised org name key used to group LAs in validations
+    df = add_org_name_key(df)
+
+    # Sort and index the data on the columns used to select it for outputs
+    df = add_filter_index(df)
+
     return df
 
 
@@ -173,4 +241,100 @@ def update_kc62_data(df):
     # Add any additional measures (counts) required from field definitions
     df = definitions.add_measures_counts(df, "KC62")
 
+    # Sort and index the data on the columns used to select it for outputs
+    df = add_filter_index(df)
+
     return df
+
+
+def import_and_update_data(collection, year_range, executor=None,
+                           df_la_updates=None):
+    """
+    Imports the asset data for a collection and applies all the pre-processing
+    updates for that collection. The imports wait on the database so are run
+    in the calling thread, while the pre-processing updates are run in a
+    separate process (or in the calling thread if the process fails, or the
+    data can not be passed to it). Any error raised by the updates
+    themselves is not caught.
+
+    Parameters
+    ----------
+    collection : str
+        The collection reference (KC62 or KC63)
+    year_range : list[str]
+        The list of years to import.
+    executor : concurrent.futures.ProcessPoolExecutor
+        Process used to apply the updates, so that one process can be used
+        for several imports. Default is None (a process is started for this
+        import only).
+    df_la_updates : pandas.DataFrame
+        Updates to be made to KC63 LAs (see load.import_la_update_info).
+        Default is None (imported for this import).
+
+    Returns
+    -------
+    df : pandas.DataFrame
+        Imported df with all pre-processing applied to data.
+    """
+    helpers.validate_value_with_list("collection", collection, ["KC62", "KC63"])
+
+    # Where no process is given, start one for this import only
+    if executor is None:
+        with ProcessPoolExecutor(max_workers=1) as executor:
+            return import_and_update_data(collection, year_range, executor,
+                                          df_la_updates)
+
+    # Import the data for the collection, and select its pre-processing
+    # updates (importing the LA updates for KC63, where not already imported)
+    df = load.import_asset_data(collection, year_range)
+    if collection == "KC63":
+        if df_la_updates is None:
+            df_la_updates = load.import_la_update_info()
+        update_data = partial(update_kc63_data, df_la_updates=df_la_updates)
+    else:
+        update_data = update_kc62_data
+
+    # Apply the pre-processing updates in the separate process
+    try:
+        return executor.submit(update_data, df).result()
+    except (BrokenProcessPool, pickle.PicklingError) as error:
+        logging.warning(f"Pre-processing {collection} in a separate process "
+                        f"failed ({error!r}), pre-processing in this thread")
+
+    return update_data(df)
+
+
+def import_and_partition_data(collection, year_range,
+                              partition_dir=param.PARTITION_DIR):
+    """
+    Imports and pre-processes the asset data for a collection one year at a
+    time, writing each year to disk as a separate partition (see
+    partitions.write_partitions). Only one year of data is held in memory.
+
+    Parameters
+    ----------
+    collection : str
+        The collection reference (KC62 or KC63)
+    year_range : list[str]
+        The list of years to import.
+    partition_dir : pathlib.Path
+        Folder where the partitions are written.
+
+    Returns
+    -------
+    partitions.PartitionedData
+        Location of the partitioned data, used in place of the dataframe to
+        create the outputs.
+    """
+    # Import the KC63 LA updates once for all the years
+    df_la_updates = (load.import_la_update_info() if collection == "KC63"
+                     else None)
+
+    # Import and pre-process each year in turn as it is written, using one
+    # process for all the years
+    with ProcessPoolExecutor(max_workers=1) as executor:
+        chunks = (import_and_update_data(collection, [year], executor,
+                                         df_la_updates)
+                  for year in year_range)
+
+        return partitions.write_partitions(chunks, collection, partition_dir)
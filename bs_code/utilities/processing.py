@@ -1,21 +1,214 @@
 import pandas as pd
 import numpy as np
 import logging
+import logging.handlers
+import multiprocessing
+import pickle
+import tempfile
+from pathlib import Path
 import bs_code.parameters as param
 import bs_code.utilities.helpers as helpers
 import bs_code.utilities.field_definitions as definitions
+import bs_code.utilities.polars_engine as polars_engine
+from bs_code.utilities.partitions import PartitionedData
 from functools import reduce
+from collections import Counter
+from itertools import product
+from contextlib import contextmanager
+from concurrent.futures import ProcessPoolExecutor, Future
+from concurrent.futures.process import BrokenProcessPool
+from queue import Queue, Full
+from threading import Thread, Event
 
 
 logger = logging.getLogger(__name__)
 
+# Dataframes shared between outputs while the shared_filters context is
+# active (filtered data, local level sums and content data), keyed on the
+# source dataframe and the arguments used to create them. Each is held with
+# the source dataframe and the key of the planned uses it is released with.
+SHARED_FILTERS = None
+
+# Number of planned uses remaining for the shared dataframes, counted from
+# the content specs to be run when the shared_filters context is opened
+# (see plan_shared_uses)
+SHARED_USES = None
+
+# Pool of worker processes used to create the outputs while the output_pool
+# context is active, the folder the source dataframes are passed to the
+# workers through, and the location of each source dataframe passed
+OUTPUT_POOL = None
+POOL_DIR = None
+POOL_SOURCES = None
+
+# Source dataframes loaded by each worker process, keyed on their location
+WORKER_SOURCES = {}
+
+
+@contextmanager
+def shared_filters(contents=None):
+    """
+    Context in which each distinct filter of a source dataframe (as applied
+    by filter_dataframe) is only computed once, with the filtered dataframe
+    shared by all outputs that require it. The data created by equal content
+    specs is shared in the same way (see create_content).
+    Where the contents to be run are given, the shared dataframes are
+    released after their last planned use (see release_shared). Any others
+    are released when the context is closed.
+    Outputs must not modify the filtered dataframe in place.
+
+    Parameters
+    ----------
+    contents : list[ContentSpec or function]
+        Every content to be run within the context, including repeats.
+        Default is None (nothing is released before the context is closed).
+
+    Returns
+    -------
+    None
+    """
+    global SHARED_FILTERS, SHARED_USES
+    SHARED_FILTERS = {}
+    SHARED_USES = None if contents is None else plan_shared_uses(contents)
+    try:
+        yield
+    finally:
+        logging.info(f"Released {len(SHARED_FILTERS)} shared dataframes")
+        SHARED_FILTERS = None
+        SHARED_USES = None
+
+
+def filter_release_key(part, table_code, filter_condition, ts_years):
+    """
+    Creates the key of the planned uses that the data created with a filter
+    (see filter_dataframe) is released with.
+
+    Parameters
+    ----------
+    part : list[str]
+    table_code : list[str]
+    filter_condition : str
+    ts_years : Num
+
+    Returns
+    -------
+    tuple
+    """
+    return ("filter", None if part is None else tuple(part),
+            None if table_code is None else tuple(table_code),
+            filter_condition, ts_years)
+
+
+def content_release_keys(content):
+    """
+    Finds the keys of the planned uses for a content spec (or function): the
+    content itself and, for content specs, the filter it applies.
+
+    Parameters
+    ----------
+    content : ContentSpec or function
+
+    Returns
+    -------
+    list[tuple]
+    """
+    release_keys = [("content", content)]
+    if hasattr(content, "filter_arguments"):
+        release_keys.append(filter_release_key(**content.filter_arguments()))
+
+    return release_keys
+
+
+def plan_shared_uses(contents):
+    """
+    Counts the planned uses of the shared data by the contents to be run, so
+    that each shared dataframe can be released after its last use.
+
+    Parameters
+    ----------
+    contents : list[ContentSpec or function]
+        Every content to be run, including repeats.
+
+    Returns
+    -------
+    collections.Counter
+        Number of uses for each release key (see content_release_keys).
+    """
+    return Counter(release_key for content in contents
+                   for release_key in content_release_keys(content))
+
+
+def share(key, df, data, release_key=None):
+    """
+    Holds data in the shared dataframes while the shared_filters context is
+    active.
+
+    Parameters
+    ----------
+    key : tuple
+        Key of the shared data (including the id of the source dataframe).
+    df : pandas.DataFrame or PartitionedData
+        Source dataframe.
+    data : pandas.DataFrame
+    release_key : tuple
+        Key of the planned uses the data is released with. Default is None
+        (released with the data it was created from, or when the context is
+        closed).
+
+    Returns
+    -------
+    None
+    """
+    if SHARED_FILTERS is not None:
+        SHARED_FILTERS[key] = (df, data, release_key)
+
+
+def release_shared(content):
+    """
+    Counts a use of the shared data by a content spec (or function), and
+    releases any shared dataframes that have no planned uses remaining,
+    together with any data created from them (e.g. the local level sums of
+    filtered data).
+
+    Parameters
+    ----------
+    content : ContentSpec or function
+
+    Returns
+    -------
+    None
+    """
+    if (SHARED_FILTERS is None) or (SHARED_USES is None):
+        return
+
+    # Count the use, where planned
+    released = []
+    for release_key in content_release_keys(content):
+        if release_key not in SHARED_USES:
+            continue
+        SHARED_USES[release_key] -= 1
+        if SHARED_USES[release_key] <= 0:
+            del SHARED_USES[release_key]
+            released.append(release_key)
+
+    if not released:
+        return
+
+    # Release the data with no remaining uses and the data created from it
+    released_data = [data for df, data, release_key
+                     in SHARED_FILTERS.values() if release_key in released]
+    for key, (df, data, release_key) in list(SHARED_FILTERS.items()):
+        if ((release_key in released)
+                or any(df is source for source in released_data)):
+            del SHARED_FILTERS[key]
+
 
 def transpose_for_dashboard(df, name):
     """
     Input dataframe has regional and national level data appended to the local
     level data as part of the standard output production. This function takes
     that and adds region and national measure columns to the local level data
-    by joining instead.
+    instead, matching each local row to its region and the national data.
 
     Parameters
     ----------
@@ -43,30 +236,45 @@ def transpose_for_dashboard(df, name):
     if name == "Dashboard_Uptake":
         breakdown = ["Table_CodeDescription"]
 
-    # Extract the local, region, and national level data to 3 seperate dataframes
-    df_local = df[df[org].notnull()].dropna(axis=1)
-    df_region = df[(df[org].isnull()) &
-                   (df[region].notnull())].dropna(axis=1)
-    df_national = df[df[region].isnull()].dropna(axis=1)
+    # Identify the organisation level of each row
+    is_local = df[org].notnull()
+    is_region = (~is_local) & (df[region].notnull())
+    level = np.select([is_local, is_region], ["local", "region"], "national")
+
+    # Find the columns that are complete for each level in a single pass
+    # (local, regional and national measures are held in separate columns)
+    complete = df.notnull().groupby(level).all()
+    local_columns = [col for col in df.columns if complete.loc["local", col]]
 
-    # Set the fields to be joined on when adding the regional measure columns
-    # to the local level dataframe
+    # Set the fields used to match the regional and national measures to the
+    # local level data
     join_on_region = [year, region, *breakdown]
-    # Set the fields to be joined on when adding the national measure columns
     join_on_national = [year, *breakdown]
 
-    # Join the regional measure columns to the local data
-    df_loc_reg = pd.merge(df_local, df_region, how="left",
-                          on=join_on_region)
-
-    # Join the national measure columns
-    df_loc_reg_nat = pd.merge(df_loc_reg, df_national, how="left",
-                              on=join_on_national)
-
-    return df_loc_reg_nat
-
-
-def filter_dataframe(df, part, table_code, filter_condition, ts_years, year=param.YEAR):
+    df_local = df[is_local][local_columns].reset_index(drop=True)
+
+    # Add the regional then national measure columns to the local data by
+    # looking up the row matching each local row
+    for name, join_on in [("region", join_on_region),
+                          ("national", join_on_national)]:
+        if name not in complete.index:
+            continue
+        measure_columns = [col for col in df.columns
+                           if complete.loc[name, col] &
+                           (col not in join_on) & (col not in local_columns)]
+        df_level = df[level == name]
+        df_measures = df_level[measure_columns].set_axis(
+            pd.MultiIndex.from_frame(df_level[join_on]), axis=0)
+        df_matched = df_measures.reindex(
+            pd.MultiIndex.from_frame(df_local[join_on]))
+        for col in measure_columns:
+            df_local[col] = df_matched[col].to_numpy()
+
+    return df_local
+
+
+def filter_dataframe(df, part, table_code, filter_condition, ts_years,
+                     year=param.YEAR, shared=True):
     """
     Filters a dataframe by a number of parameters, including the number of years
     data required in the table, standard filters on part and table code,
@@ -75,7 +283,9 @@ def filter_dataframe(df, part, table_code, filter_condition, ts_years, year=para
 
     Parameters
     ----------
-    df : pandas.DataFrame
+    df : pandas.DataFrame or PartitionedData
+        Where the data is partitioned on disk, the partition for each year
+        is loaded and filtered in turn.
     part : list[str]
         Variable name that holds the collection part.
         Accepts a list of one or more.
@@ -88,6 +298,11 @@ def filter_dataframe(df, part, table_code, filter_condition, ts_years, year=para
         dataframe variables.
     ts_years : Num
         Defines the number of years required in the table.
+    year : str
+        The latest year to be included (yyyy-yy).
+    shared : bool
+        If True and the shared_filters context is active, the filtered
+        dataframe is shared with any other output using the same filter.
 
     Returns
     -------
@@ -95,16 +310,58 @@ def filter_dataframe(df, part, table_code, filter_condition, ts_years, year=para
         Filtered to the conditions input to the function.
 
     """
-
     # Filter dataframe to number of years defined in ts_years
     year_range = helpers.get_year_range(year, ts_years)
-    df = df[(df["CollectionYearRange"].isin(year_range))]
 
-    # Apply pre-set filters on part and table
-    if part is not None:
-        df = df[df["Part"].isin(part)]
-    if table_code is not None:
-        df = df[df["Table_Code"].isin(table_code)]
+    # Where filters are being shared between outputs, return the previously
+    # filtered dataframe if this filter has already been applied. Data that
+    # is partitioned on disk is not shared, so is not held in memory.
+    if (shared & (SHARED_FILTERS is not None)
+            and not isinstance(df, PartitionedData)):
+        key = (id(df), tuple(year_range),
+               None if part is None else tuple(part),
+               None if table_code is None else tuple(table_code),
+               filter_condition)
+        if key in SHARED_FILTERS and SHARED_FILTERS[key][0] is df:
+            return SHARED_FILTERS[key][1]
+        df_filtered = filter_dataframe(df, part, table_code, filter_condition,
+                                       ts_years, year, shared=False)
+        share(key, df, df_filtered,
+              filter_release_key(part, table_code, filter_condition,
+                                 ts_years))
+        return df_filtered
+
+    # Where the data is partitioned on disk, filter the partition for each
+    # year in turn so only one is loaded at a time
+    if isinstance(df, PartitionedData):
+        years = [ts_year for ts_year in year_range if ts_year in df.years]
+        if not years:
+            raise ValueError(f"There is no {df.collection} data for "
+                             f"{year_range}")
+        df_years = [filter_dataframe(df.load(ts_year), part, table_code,
+                                     filter_condition, 1, ts_year,
+                                     shared=False)
+                    for ts_year in years]
+        return pd.concat(df_years, ignore_index=True)
+
+    # Select the years, parts and tables by binary search where the dataframe
+    # is sorted on them (see pre_processing.add_filter_index)
+    indexed = df.index.names[:3] == ["CollectionYearRange", "Part", "Table_Code"]
+    if indexed:
+        df = select_from_filter_index(df, year_range, part, table_code)
+
+    # Otherwise check every row for the years, and apply pre-set filters on
+    # part and table
+    if not indexed:
+        df = df[(df["CollectionYearRange"].isin(year_range))]
+        if part is not None:
+            df = df[df["Part"].isin(part)]
+        if table_code is not None:
+            df = df[df["Table_Code"].isin(table_code)]
+
+    # Fill in any counts of 0 not stored in the dataframe (see
+    # add_measures_counts), so that every measure is present for the rows
+    df = definitions.fill_zero_counts(df)
 
     # Apply the optional general filter
     if filter_condition is not None:
@@ -113,6 +370,220 @@ def filter_dataframe(df, part, table_code, filter_condition, ts_years, year=para
     return df
 
 
+def filter_partitions(df, part, table_code, filter_condition, ts_years,
+                      year=param.YEAR):
+    """
+    Filters the data using filter_dataframe, yielding the filtered data for
+    all years at once or, where the data is partitioned on disk, for each
+    year in turn (oldest first). Partial results created from each
+    partition can then be merged, so that only one year of data is held in
+    memory at a time.
+
+    Parameters
+    ----------
+    df : pandas.DataFrame or PartitionedData
+    part : list[str]
+        Collection parts to be included.
+    table_code : list[str]
+        Collection table codes to be included.
+    filter_condition : str
+        Optional dataframe filter (see filter_dataframe).
+    ts_years : Num
+        Defines the number of years required.
+    year : str
+        The latest year to be included (yyyy-yy).
+
+    Yields
+    ------
+    df_filtered : pandas.DataFrame
+    """
+    if not isinstance(df, PartitionedData):
+        yield filter_dataframe(df, part, table_code, filter_condition,
+                               ts_years, year)
+        return
+
+    # The data for each year is not shared between outputs, so that only one
+    # year is held in memory at a time
+    year_range = helpers.get_year_range(year, ts_years)
+    years = [ts_year for ts_year in year_range if ts_year in df.years]
+    if not years:
+        raise ValueError(f"There is no {df.collection} data for {year_range}")
+    for ts_year in years:
+        yield filter_dataframe(df, part, table_code, filter_condition, 1,
+                               ts_year, shared=False)
+
+
+def merge_partial_sums(partial_sums):
+    """
+    Merges the sums created from each partition of the data (see
+    filter_partitions) into a single set of sums.
+
+    Parameters
+    ----------
+    partial_sums : list[pandas.Series]
+        Sums for each partition, indexed by the groups summed.
+
+    Returns
+    -------
+    pandas.Series
+        Sums for all the partitions, sorted by the groups.
+    """
+    if len(partial_sums) == 1:
+        return partial_sums[0]
+
+    df_sums = pd.concat(partial_sums)
+
+    return df_sums.groupby(level=list(range(df_sums.index.nlevels)),
+                           dropna=False).sum()
+
+
+def use_polars(df, engine):
+    """
+    Checks the engine set for an output, and whether the polars engine is
+    used for the source dataframe. Data that is partitioned on disk is
+    always summed by pandas, one partition at a time.
+
+    Parameters
+    ----------
+    df : pandas.DataFrame or PartitionedData
+    engine : str
+        Either "pandas" or "polars".
+
+    Returns
+    -------
+    bool
+    """
+    helpers.validate_value_with_list("engine", engine, ["pandas", "polars"])
+
+    return (engine == "polars") and not isinstance(df, PartitionedData)
+
+
+def sum_with_polars(df, part, table_code, filter_condition, ts_years,
+                    group_columns, measure_column, measures=None,
+                    rename=None, dropna=True, year=param.YEAR):
+    """
+    Filters the data and sums the values for each group using the polars
+    engine (see polars_engine.sum_counts). Where the shared_filters context
+    is active, the source dataframe is only converted to polars once, and
+    shared by all the outputs.
+
+    Parameters
+    ----------
+    df : pandas.DataFrame
+    part : list[str]
+        Collection parts to be included.
+    table_code : list[str]
+        Collection table codes to be included.
+    filter_condition : str
+        Optional dataframe filter (see filter_dataframe).
+    ts_years : Num
+        Defines the number of years required.
+    group_columns : list[str]
+        Columns to sum by, including the measure_column.
+    measure_column : str
+    measures : list[str]
+        Measures to be summed. Default is None (all measures).
+    rename : dict
+        Columns to be renamed once the data is filtered. Default is None.
+    dropna : bool
+        If True, groups with missing values are not included.
+    year : str
+        The latest year to be included (yyyy-yy).
+
+    Returns
+    -------
+    pandas.Series
+        Summed values, indexed by the group columns in sorted order.
+    """
+    key = ("polars", id(df))
+    if ((SHARED_FILTERS is not None) and (key in SHARED_FILTERS)
+            and (SHARED_FILTERS[key][0] is df)):
+        source = SHARED_FILTERS[key][1]
+    else:
+        source = polars_engine.to_lazy(df)
+        share(key, df, source)
+
+    return polars_engine.sum_counts(
+        source, helpers.get_year_range(year, ts_years), part, table_code,
+        filter_condition, group_columns, measure_column, measures,
+        definitions.sparse_measures(df, measure_column), rename, dropna)
+
+
+def filter_years(df, part, table_code, filter_condition, ts_years,
+                 year=param.YEAR, year_column="CollectionYearRange"):
+    """
+    Filters the data using filter_partitions and yields the data for each
+    year in turn, oldest first.
+
+    Parameters
+    ----------
+    df : pandas.DataFrame or PartitionedData
+    part : list[str]
+        Collection parts to be included.
+    table_code : list[str]
+        Collection table codes to be included.
+    filter_condition : str
+        Optional dataframe filter (see filter_dataframe).
+    ts_years : Num
+        Defines the number of years required.
+    year : str
+        The latest year to be included (yyyy-yy).
+    year_column : str
+        Column that holds the year.
+
+    Yields
+    ------
+    year : str
+    df_year : pandas.DataFrame
+        Filtered data for the year.
+    """
+    for df_filtered in filter_partitions(df, part, table_code,
+                                         filter_condition, ts_years, year):
+        for ts_year in helpers.create_year_list(df_filtered, year_column):
+            yield ts_year, df_filtered[df_filtered[year_column] == ts_year]
+
+
+def select_from_filter_index(df, year_range, part, table_code):
+    """
+    Selects the rows for the required years, parts and table codes from a
+    dataframe indexed by pre_processing.add_filter_index. The first and last
+    row of each combination of the years, parts and table codes are found by
+    binary search of the sorted index.
+
+    Parameters
+    ----------
+    df : pandas.DataFrame
+    year_range : list[str]
+        Years to be selected.
+    part : list[str]
+        Collection parts to be selected. Accepts None (all parts).
+    table_code : list[str]
+        Collection table codes to be selected. Accepts None (all table codes).
+
+    Returns
+    -------
+    df : pandas.DataFrame
+        Selected rows, in their original order, with the index reset.
+    """
+    # Table codes can only be searched for within a part
+    keys = [year_range]
+    if part is not None:
+        keys.append(part)
+        if table_code is not None:
+            keys.append(table_code)
+
+    # Find the position of the rows for each combination of the keys
+    positions = [np.arange(*df.index.slice_locs(key, key))
+                 for key in product(*keys)]
+    positions = np.sort(np.concatenate([np.arange(0)] + positions))
+    df = df.take(positions).reset_index(drop=True)
+
+    if (part is None) & (table_code is not None):
+        df = df[df["Table_Code"].isin(table_code)]
+
+    return df
+
+
 def sort_for_output_defined(df, rows, row_order):
     """
     Sorts the dataframe in the user defined order required for the output.
@@ -136,18 +607,16 @@ def sort_for_output_defined(df, rows, row_order):
     # If row_order is not defined.
     # Totals are removed by default and row order is not altered
     if row_order is None:
-        df = helpers.remove_rows(df, ["Grand_total"])
+        df = helpers.remove_rows(df, ["Grand_total"], rows)
     # Where order has been defined.
     else:
         # Select the rows to include in table and apply the row order
-        row = rows[0]
-        df = df[(df[row].isin(row_order))]
-        df = helpers.order_by_list(df, row, row_order)
+        df = helpers.order_by_list(df, rows[0], row_order)
 
     return df
 
 
-def sort_for_output(df, sort_on, cols_to_remove=[]):
+def sort_for_output(df, sort_on, cols_to_remove=[], rows=None):
     """
     Sorts the dataframe on specified columns required for the output.
     Drops columns only used for sorting.
@@ -160,13 +629,16 @@ def sort_for_output(df, sort_on, cols_to_remove=[]):
     cols_to_remove : list[str]
         List containing the names of any columns to be removed (i.e. those only
         used for sorting)
+    rows : list[str]
+        Variable name(s) that hold the row labels, where any total rows are
+        labelled. Defaults to all text columns.
 
     Returns
     -------
     df : pandas.DataFrame
     """
     # Drop any total rows (not needed in this pipeline for variable length outputs)
-    df = helpers.remove_rows(df, ["Grand_total"])
+    df = helpers.remove_rows(df, ["Grand_total"], rows)
 
     # Sort the dataframe based on columns defined by sort_on input
     df = df.sort_values(by=sort_on, ascending=True)
@@ -262,6 +734,49 @@ def update_org_level_values(df, org_level, col_parent_code, col_org_code,
     return df
 
 
+def aggregate_local_level(df, local_breakdown, measure_column, shared=True):
+    """
+    Sums the data for each local organisation and breakdown, with the
+    measure_column content set as columns. Regional and national data can
+    then be rolled up from these sums, rather than from the full data.
+    Where filtered data is shared between outputs (see shared_filters), the
+    sums are also shared, so are only created once for all organisation
+    levels using the same filters.
+
+    Parameters
+    ----------
+    df : pandas.DataFrame
+    local_breakdown : list[str]
+        Columns that define each local organisation and breakdown.
+    measure_column : str
+        Variable name that holds the measure information (e.g. Col_Def).
+    shared : bool
+        If True and the shared_filters context is active, the sums are shared
+        with any other output summing the same data.
+
+    Returns
+    -------
+    df_local : pandas.DataFrame
+        Summed values indexed by the local breakdown, one column per measure.
+    """
+    key = ("local_level", id(df), tuple(local_breakdown), measure_column)
+    shared = shared & (SHARED_FILTERS is not None)
+    if shared and (key in SHARED_FILTERS) and (SHARED_FILTERS[key][0] is df):
+        return SHARED_FILTERS[key][1]
+
+    # Sum the values, keeping any breakdowns with missing values as these
+    # may be replaced when rolled up to a higher organisation level
+    df_sums = df[df[measure_column].notnull()]
+    df_local = (df_sums.groupby([*local_breakdown, measure_column],
+                                dropna=False)["Value"].sum()
+                .unstack(measure_column))
+
+    if shared:
+        share(key, df, df_local)
+
+    return df_local
+
+
 def create_output_crosstab(df, rows, columns, part, table_code,
                            sort_on, row_order, column_order, column_rename,
                            filter_condition, visible_condition, row_subgroup,
@@ -275,7 +790,7 @@ def create_output_crosstab(df, rows, columns, part, table_code,
 
     Parameters
     ----------
-    df : pandas.DataFrame
+    df : pandas.DataFrame or PartitionedData
     rows : list[str]
         Variable name(s) that holds the row labels (e.g. regions) that are
         to be included in the output.
@@ -344,12 +859,9 @@ def create_output_crosstab(df, rows, columns, part, table_code,
     df : pandas.DataFrame
         in the form of a crosstab, with aggregated counts
     """
-    # Filter data to years required for timeseries
-    df_filtered = filter_dataframe(df, part, table_code, filter_condition,
-                                   ts_years)
-
-    # Create list of years to use in loop
-    years = helpers.create_year_list(df_filtered, 'CollectionYearRange')
+    # Filter data to years required for timeseries, to be processed one year
+    # at a time
+    df_years = filter_years(df, part, table_code, filter_condition, ts_years)
 
     # Rename the original rows input (those to be included in output) for later
     # use in selecting index
@@ -366,29 +878,23 @@ def create_output_crosstab(df, rows, columns, part, table_code,
         # Now redefine rows to also include the column(s) used for sorting only
         rows = rows + cols_to_remove
 
+    # Check if SDR is part of output, in which case the expected invasive
+    # cancers required to calculate SDR are added to the data for each year
+    add_sdr = (column_order is not None) and ('SDR' in column_order)
+
     # Create an empty dataframe to store the data for each year in loop
     df_all = []
 
     # Loops through the processing steps for each year in the time series
-    for year in years:
-        # Creates dataframe for each year in the loop (oldest first)
-        df_year = (df_filtered[(df_filtered["CollectionYearRange"] == year)]
-                   .copy(deep=True))
-
-        # If SDR is part of output then create the expected invasive cancers
-        # required to calculate SDR and add them to the dataframe
-        if column_order is not None:
-            if 'SDR' in column_order:
-                df_year = definitions.sdr_expected(df_year, table_code, year)
+    # (oldest first)
+    for year, df_year in df_years:
+        # Creates dataframe for each year in the loop
+        df_year = df_year.copy(deep=True)
+        if add_sdr:
+            df_year = definitions.add_sdr_expected(df_year, table_code)
 
         # Pivots the dataframe into a crosstab
-        df_agg = pd.pivot_table(df_year,
-                                values="Value",
-                                index=rows,
-                                columns=columns,
-                                aggfunc="sum",
-                                margins=True,
-                                margins_name="Grand_total").reset_index()
+        df_agg = helpers.pivot_with_totals(df_year, rows, columns).reset_index()
 
         # Add any required row or column subgroups to data
         if row_subgroup is not None:
@@ -444,7 +950,8 @@ def create_output_crosstab(df, rows, columns, part, table_code,
 
     # Apply final row order and remove columns that are only used to sort on
     if sort_on is not None:
-        df_sorted = sort_for_output(df_joined, sort_on, cols_to_remove)
+        df_sorted = sort_for_output(df_joined, sort_on, cols_to_remove,
+                                    rows)
     else:
         df_sorted = sort_for_output_defined(df_joined, rows, row_order)
 
@@ -468,7 +975,8 @@ def create_output_measure(df, measure_column, measure,
                           rows, columns, part, table_code, sort_on,
                           row_order, column_order, column_rename,
                           filter_condition, subgroup,
-                          include_row_labels, ts_years=1):
+                          include_row_labels, ts_years=1,
+                          engine=param.ENGINE):
     """
     A variation on the create_output function that is only used for crosstab
     outputs where the entire output contains a single measure (e.g. uptake)
@@ -524,15 +1032,14 @@ def create_output_measure(df, measure_column, measure,
     ts_years: int
         Number of years to be used in the time series.
         Default is 1.
+    engine : str
+        Engine used to filter and sum the data, "pandas" or "polars" (see
+        polars_engine.py). Both give the same output.
 
     Returns
     -------
     df : pandas.DataFrame
     """
-    # Filter the dataframe by filter conditions
-    df_filtered = filter_dataframe(df, part, table_code, filter_condition,
-                                   ts_years)
-
     # Rename the original rows input (those to be included in output) for later
     # use in selecting index
     rows_output = rows
@@ -553,43 +1060,60 @@ def create_output_measure(df, measure_column, measure,
     # measure.
     rows_columns = [*rows, columns]
 
-    # Pivot and aggregate the data with measure_column content set as columns.
-    df_agg = pd.pivot_table(df_filtered,
-                            values="Value",
-                            index=rows_columns,
-                            columns=measure_column,
-                            aggfunc="sum",
-                            margins=True,
-                            margins_name="Grand_total").reset_index()
-    # Remove the column grand total as this is added during the adding of
-    # subgroups next
-    df_agg = df_agg[~df_agg.eq("Grand_total").any(axis=1)]
+    # If no column order was defined then assign it as Total. Ensures is not
+    # empty where called later.
+    if column_order is None:
+        column_order = ["Grand_total"]
 
-    # Add the subtotals for each column
-    df_agg = helpers.add_subtotals(df_agg, rows_columns)
+    # Identify which totals will be retained in the output, so that only these
+    # are aggregated. Row totals are removed when sorting unless included in
+    # the row_order, and column totals are only kept if in the column_order.
+    total_columns = []
+    if row_order is not None:
+        if "Grand_total" in row_order:
+            total_columns = [rows[0]]
+        total_columns = total_columns + rows[1:]
+    if "Grand_total" in column_order:
+        total_columns = total_columns + [columns]
+
+    # Filter the dataframe by filter conditions and aggregate only the counts
+    # needed for the measure. Where the data is partitioned on disk, each
+    # year is filtered and aggregated in turn and the sums are merged.
+    counts = definitions.required_counts([measure])
+    if use_polars(df, engine):
+        sums = sum_with_polars(df, part, table_code, filter_condition,
+                               ts_years, [*rows_columns, measure_column],
+                               measure_column, counts)
+    else:
+        sums = merge_partial_sums(
+            [df_filtered[df_filtered[measure_column].isin(counts)]
+             .groupby([*rows_columns, measure_column])["Value"].sum()
+             for df_filtered in filter_partitions(df, part, table_code,
+                                                  filter_condition,
+                                                  ts_years)])
+
+    # Set the measure_column content as columns
+    df_agg = (sums
+              .unstack(measure_column, fill_value=0)
+              .reset_index())
+
+    # Add the required totals
+    df_agg = helpers.add_subtotals(df_agg, rows_columns,
+                                   total_columns=total_columns)
 
     # Add any required row subgroups to the dataframe
     if subgroup is not None:
         df_agg = helpers.add_subgroup_rows(df_agg, rows_columns, subgroup)
 
-    # If no column order was defined then assign it as Total. Ensures is not
-    # empty where called later.
-    if column_order is None:
-        column_order = ["Grand_total"]
-
     # If required add the measure from field_definitions file
     df_agg = definitions.add_measures(df_agg, [measure])
 
-    # Retain only the specified measure from the measure column
-    cols_to_retain = [*rows_columns, measure]
-    df_agg = df_agg[cols_to_retain]
-
-    # Now that non-measure counts have been removed, pivot the variable
-    # containing the required column information into the column headers.
-    df_measure = pd.pivot_table(df_agg,
-                                values=measure,
-                                index=rows,
-                                columns=columns).reset_index()
+    # Lay out the measure with the variable containing the required column
+    # information as the column headers.
+    df_measure = (df_agg.dropna(subset=[measure])
+                  .groupby(rows_columns)[measure].mean()
+                  .unstack(columns)
+                  .reset_index())
 
     # Set final df column content (for now including any column that is
     # only used for sorting). Done inside the loop before column renaming.
@@ -597,7 +1121,8 @@ def create_output_measure(df, measure_column, measure,
 
     # Apply final row order and remove columns that are only used to sort on
     if sort_on is not None:
-        df_sorted = sort_for_output(df_measure, sort_on, cols_to_remove)
+        df_sorted = sort_for_output(df_measure, sort_on, cols_to_remove,
+                                    rows)
     else:
         df_sorted = sort_for_output_defined(df_measure, rows, row_order)
 
@@ -617,8 +1142,7 @@ def create_output_csv_tidy(df, collection, org_level, breakdown,
                            measure_column, part, table_code, sort_on,
                            measure_order, column_rename, filter_condition,
                            visible_condition, breakdown_subgroup,
-                           ts_years=1, year_column="CollectionYearRange",
-                           not_applicable=param.NOT_APPLICABLE):
+                           ts_years=1, year_column="CollectionYearRange"):
     """
     Will create an output in a csv ready tidy format based on any breakdown,
     and selection of measures (as defined in measure/measure_order) for a
@@ -627,7 +1151,7 @@ def create_output_csv_tidy(df, collection, org_level, breakdown,
 
     Parameters
     ----------
-    df : pandas.DataFrame
+    df : pandas.DataFrame or PartitionedData
     collection: str
         Screening collection source for the output (KC62 or KC63).
     breakdown : list[str]
@@ -669,12 +1193,11 @@ def create_output_csv_tidy(df, collection, org_level, breakdown,
         Default is 1.
     year_column: str
         Column/variable name that holds the time period (year) information.
-    not_applicable: str
-        The text that will replace null values in the returned calculations.
 
     Returns
     -------
     df : pandas.DataFrame
+        Null values are kept, to be replaced when the output is written.
     """
     # A check is first run to ensure that a valid value has been submitted for
     # the org_level parameter.
@@ -686,16 +1209,10 @@ def create_output_csv_tidy(df, collection, org_level, breakdown,
     col_parent_code, col_org_code, col_parent_name, col_org_name, col_org_type = (define_org_columns
                                                                                   (collection))
 
-    # Filter data to years required for timeseries
-    df_filtered = filter_dataframe(df, part, table_code, filter_condition,
-                                   ts_years)
-
-    # Where the data is to be extracted at national or regional level, lower
-    # level organisation details are replaced with those from the higher level(s)
-    df_updates = update_org_level_values(df_filtered, org_level,
-                                         col_parent_code, col_org_code,
-                                         col_parent_name, col_org_name,
-                                         col_org_type)
+    # Filter data to years required for timeseries (one year at a time where
+    # the data is partitioned on disk)
+    df_partitions = filter_partitions(df, part, table_code, filter_condition,
+                                      ts_years)
 
     # Define a list of columns for the sub-national breakdowns to be included.
     # This varies depending on the collection.
@@ -723,34 +1240,59 @@ def create_output_csv_tidy(df, collection, org_level, breakdown,
         # sorting only
         breakdown = breakdown + cols_to_remove
 
-    # If SDR is part of output then create the expected invasive cancers
-    # required to calculate SDR and add them to the dataframe
-    if 'SDR' in measure_order:
-        # Set up empty list
-        total_dfs = []
+    # Sum the data for each local organisation and breakdown, with the
+    # measure_column content set as columns. Where the data is filtered one
+    # year at a time, the sums for each year are merged (as the year is part
+    # of the breakdown, these do not overlap).
+    local_breakdown = list(dict.fromkeys([year_column, col_parent_code,
+                                          col_parent_name, col_org_code,
+                                          col_org_name, col_org_type,
+                                          *breakdown]))
+    df_local = []
+    expected_sums = []
+
+    for df_filtered in df_partitions:
+        df_local.append(aggregate_local_level(
+            df_filtered, local_breakdown, measure_column,
+            shared=not isinstance(df, PartitionedData)))
+
+        # If SDR is part of output then create the expected invasive cancers
+        # required to calculate SDR and sum them for each breakdown. These are
+        # summed from the individual records as the expected values are not
+        # whole numbers.
+        if 'SDR' in measure_order:
+            df_screened = df_filtered[df_filtered[measure_column] == "Screened"]
+            df_expected = definitions.add_sdr_expected(df_screened, table_code,
+                                                       year_column=year_column)
+            df_expected = df_expected[df_expected[measure_column]
+                                      == "SDR_expected"]
+            df_expected = update_org_level_values(df_expected.copy(), org_level,
+                                                  col_parent_code, col_org_code,
+                                                  col_parent_name, col_org_name,
+                                                  col_org_type)
+            expected_sums.append(df_expected.groupby(breakdown)["Value"].sum())
+
+    df_local = pd.concat(df_local).sort_index(axis=1)
 
-        # Get distinct list of years from data
-        years = list(df_updates["CollectionYearRange"].unique())
+    # Where the data is to be extracted at national or regional level, lower
+    # level organisation details are replaced with those from the higher level(s)
+    df_updates = update_org_level_values(df_local.reset_index(), org_level,
+                                         col_parent_code, col_org_code,
+                                         col_parent_name, col_org_name,
+                                         col_org_type)
 
-        for year in years:
-            # Filter dataframe for each year
-            df_sdr = df_updates[df_updates["CollectionYearRange"] == year]
-            # Apply SDR expected function for given year
-            df_sdr = definitions.sdr_expected(df_sdr, table_code, year)
-            # Add new sdr dataframe to list
-            total_dfs.append(df_sdr)
+    # Roll the local sums up to the organisation level
+    df_cells = (df_updates.groupby(breakdown)[list(df_local.columns)]
+                .sum(min_count=1))
 
-        # Concatenate data for all years
-        df_updates = pd.concat(total_dfs).reset_index()
+    # Add the expected invasive cancers to the sums
+    if 'SDR' in measure_order:
+        df_cells["SDR_expected"] = pd.concat(expected_sums)
+        df_cells = df_cells.sort_index(axis=1)
 
-    # Pivots the dataframe so the measure_column content is set as columm headers
-    df_agg = pd.pivot_table(df_updates,
-                            values="Value",
-                            index=breakdown,
-                            columns=measure_column,
-                            aggfunc="sum",
-                            margins=True,
-                            margins_name="Grand_total").reset_index()
+    # Set the measure_column content as the column headers and add the totals
+    df_cells.columns.name = measure_column
+    df_agg = helpers.add_pivot_totals(df_cells).reset_index()
 
     if breakdown_subgroup is not None:
         df_agg = helpers.add_subgroup_rows(df_agg, breakdown, breakdown_subgroup)
@@ -770,7 +1312,8 @@ def create_output_csv_tidy(df, collection, org_level, breakdown,
 
     # Apply final row order and remove columns that are only used to sort on
     if sort_on is not None:
-        df_sorted = sort_for_output(df_agg, sort_on, cols_to_remove)
+        df_sorted = sort_for_output(df_agg, sort_on, cols_to_remove,
+                                    breakdown)
     else:
         df_sorted = df_agg
 
@@ -782,12 +1325,148 @@ def create_output_csv_tidy(df, collection, org_level, breakdown,
     if column_rename is not None:
         df_sorted = df_sorted.rename(columns=column_rename)
 
-    # Apply the default not applicable symbol to null values
-    df_sorted = df_sorted.fillna(not_applicable)
-
     return df_sorted
 
 
+def create_validation_panel(df, measures, part, table_code, filter_condition,
+                            ts_years, measure_column="Col_Def",
+                            ts_column="CollectionYearRange",
+                            engine=param.ENGINE):
+    """
+    Sums the data at the finest organisation level and breakdown (as set in
+    param.VALIDATION_PANEL_COLUMNS) for each measure and year, as a long panel
+    of the time series. The validation outputs for each organisation level
+    (e.g. LA, region and national) are rolled up from the panel (see
+    rollup_validation_panel) rather than from the full data.
+    The panel holds the counts for all the validated measures (those in
+    param.VALIDATION_BREACHES), so where filtered data is shared between
+    outputs (see shared_filters) the panel is only created once for all the
+    validation outputs using the same filters.
+
+    Parameters
+    ----------
+    df : pandas.DataFrame or PartitionedData
+    measures : list[str]
+        Name of measure(s) needed by the output, which may include
+        registered measures from field_definitions.
+        Accepts None (all measures).
+    part : list[str]
+        Variable name that holds the collection part.
+        Accepts None (no filter applied) or a list of one or more.
+    table_code : list[str]
+        Variable name that holds the collection table code (letter).
+        Accepts None (no filter applied) or a list of one or more.
+    filter_condition : str
+        This is a non-standard, optional dataframe filter as a string.
+    ts_years: int
+        Number of years to be included in the time series.
+    measure_column: str
+        Single column name that holds the measure information (e.g. Col_Def)
+    ts_column: str
+        Single column name that holds the years for the time series.
+    engine : str
+        Engine used to filter and sum the data, "pandas" or "polars" (see
+        polars_engine.py). Both give the same panel.
+
+    Returns
+    -------
+    df_panel : pandas.DataFrame
+        Summed values, one row per series and year.
+    """
+    # Include the counts for all the validated measures, so that the panel
+    # can be shared by all validation outputs
+    if measures is not None:
+        validated = [breach[0] for breach in param.VALIDATION_BREACHES]
+        measures = tuple(dict.fromkeys(
+            definitions.required_counts(list(dict.fromkeys(validated)))
+            + definitions.required_counts(measures)))
+
+    key = ("validation_panel", id(df), ts_years,
+           None if part is None else tuple(part),
+           None if table_code is None else tuple(table_code),
+           filter_condition, measures, measure_column, ts_column)
+    if (SHARED_FILTERS is not None) and (key in SHARED_FILTERS):
+        if SHARED_FILTERS[key][0] is df:
+            return SHARED_FILTERS[key][1]
+
+    # Sum the values for each series and year in a single query, grouping
+    # all LA names on the normalised key where available
+    if use_polars(df, engine):
+        rename = ({"Org_Name_Key": "Org_Name"}
+                  if "Org_Name_Key" in df.columns else None)
+        panel_columns = [column for column in param.VALIDATION_PANEL_COLUMNS
+                         if column in df.columns]
+        df_panel = sum_with_polars(
+            df, part, table_code, filter_condition, ts_years,
+            [*panel_columns, measure_column, ts_column], measure_column,
+            measures, rename, dropna=False).reset_index()
+
+        share(key, df, df_panel,
+              filter_release_key(part, table_code, filter_condition,
+                                 ts_years))
+
+        return df_panel
+
+    # Filter data to years required for timeseries (one year at a time where
+    # the data is partitioned on disk, merging the sums for each year)
+    partial_sums = []
+    for df_filtered in filter_partitions(df, part, table_code,
+                                         filter_condition, ts_years):
+
+        # Filter data to the measures in the panel
+        if measures is not None:
+            df_filtered = df_filtered[df_filtered[measure_column].isin(measures)]
+
+        # Group all LA names on the normalised (upper case) key where available
+        if "Org_Name_Key" in df_filtered.columns:
+            df_filtered = helpers.use_org_name_key(df_filtered)
+
+        # Sum the values for each series and year, keeping any series with
+        # missing values as these are removed when rolled up
+        panel_columns = [column for column in param.VALIDATION_PANEL_COLUMNS
+                         if column in df_filtered.columns]
+        partial_sums.append(df_filtered.groupby(
+            [*panel_columns, measure_column, ts_column],
+            dropna=False)["Value"].sum())
+
+    df_panel = merge_partial_sums(partial_sums).reset_index()
+
+    share(key, df, df_panel,
+          filter_release_key(part, table_code, filter_condition, ts_years))
+
+    return df_panel
+
+
+def rollup_validation_panel(df_panel, rows, measures,
+                            measure_column="Col_Def"):
+    """
+    Sums a validation panel (see create_validation_panel) for the rows of an
+    output, e.g. rolling the finest organisation level up to region or
+    national.
+
+    Parameters
+    ----------
+    df_panel : pandas.DataFrame
+    rows : list[str]
+        Variable name(s) to sum the panel by, which must include the column
+        that holds the years.
+    measures : list[str]
+        Name of measure(s) to be returned. Accepts None (all measures).
+    measure_column: str
+        Single column name that holds the measure information (e.g. Col_Def)
+
+    Returns
+    -------
+    pandas.DataFrame
+        Summed values, one row per combination of the rows.
+    """
+    # Filter panel to measures to output
+    if measures is not None:
+        df_panel = df_panel[df_panel[measure_column].isin(measures)]
+
+    return df_panel.groupby(rows)["Value"].sum().reset_index()
+
+
 def create_output_ts_validations(df, rows, measures, part, table_code, sort_on,
                                  filter_condition, row_subgroup, validations,
                                  ts_years, measure_column="Col_Def",
@@ -824,7 +1503,7 @@ def create_output_ts_validations(df, rows, measures, part, table_code, sort_on,
         grouping(s), and the original subgroup values that will form the group.
     validations: list[str]
         List of pre-defined validations to include in the output. Must
-        exist in processing_steps.add_validation_columns
+        exist in field_definitions.validate_time_series
     ts_years: int
         Number of years to be shown in the time series.
     measure_column: str
@@ -837,35 +1516,34 @@ def create_output_ts_validations(df, rows, measures, part, table_code, sort_on,
     df: pandas.DataFrame
 
     """
-    # Standardardise letter casing to upper case for all LA names within KC63 data
-    if ('Women_eligible' in measures) | ('Women_screened_less3yrs' in measures):
-        df["Org_Name"] = df["Org_Name"].str.upper()
+    # Sum the values for each row and year from the validation panel, as a
+    # long panel of the time series
+    df_panel = create_validation_panel(df, measures, part, table_code,
+                                       filter_condition, ts_years,
+                                       measure_column, ts_column)
+    df_panel = rollup_validation_panel(df_panel, [*rows, ts_column],
+                                       measures, measure_column)
+
+    # Add any required row subgroups to the panel
+    if row_subgroup is not None:
+        df_panel = helpers.add_subgroup_rows(df_panel, [*rows, ts_column],
+                                             row_subgroup)
 
-    # Filter data to years required for timeseries
-    df_filtered = filter_dataframe(df, part, table_code, filter_condition,
-                                   ts_years)
+    # Where the measures are not shown as rows, each row is validated with
+    # the breach thresholds of the first measure
+    if measure_column not in rows:
+        df_panel[measure_column] = measures[0]
 
-    # Filter data to measures to output
-    df_filtered = df_filtered[df_filtered[measure_column].isin(measures)]
-
-    # Pivot dataframe so that the years in the time series are presented as columns
-    df_agg = pd.pivot_table(df_filtered,
-                            values="Value",
-                            index=rows,
-                            columns=ts_column,
-                            aggfunc="sum").reset_index()
-
-    # Add any required row subgroups to the dataframe
-    if row_subgroup is not None:
-        df_agg = helpers.add_subgroup_rows(df_agg, rows, row_subgroup)
+    # Lay out the years as columns and add the required validation columns
+    df_validations = definitions.validate_time_series(df_panel, validations,
+                                                      rows, measure_column,
+                                                      ts_column)
+    if measure_column not in rows:
+        df_validations = df_validations.drop(columns=measure_column)
 
     # Sort rows in dataframe by order defined in sort_on
     if sort_on is not None:
-        df_agg = df_agg.sort_values(by=sort_on, ascending=True)
-
-    # Add required validation columns
-    df_validations = definitions.add_validation_columns(df_agg,
-                                                        validations, measures)
+        df_validations = df_validations.sort_values(by=sort_on, ascending=True)
 
     # Set index ready for writing to Excel
     df_validations.set_index(rows, inplace=True)
@@ -913,7 +1591,7 @@ def create_output_ts_validations_measure(df, rows, measure, part, table_code,
         grouping(s), and the original subgroup values that will form the group.
     validations: list[str]
         list of pre-defined validations to include in the output. Must
-        exist in processing_steps.add_validation_columns
+        exist in field_definitions.validate_time_series
     ts_years: int
         Number of years to be shown in the time series.
     measure_column: str
@@ -926,18 +1604,15 @@ def create_output_ts_validations_measure(df, rows, measure, part, table_code,
     df : pandas.DataFrame
         in the form of a crosstab, with aggregated counts
     """
-    # Standardardise letter casing to upper case for all LA names within KC63 data
-    if ('Coverage' in measure):
-        df["Org_Name"] = df["Org_Name"].str.upper()
-
-    # Filter data to years required for timeseries
-    df_filtered = filter_dataframe(df, part, table_code, filter_condition,
-                                   ts_years)
+    # Sum the counts needed for the measure from the validation panel
+    df_panel = create_validation_panel(df, [measure], part, table_code,
+                                       filter_condition, ts_years,
+                                       measure_column, ts_column)
 
     rows_columns = [*rows, ts_column]
 
     # Pivot and aggregate the data with measure_column content set as columns.
-    df_agg = pd.pivot_table(df_filtered,
+    df_agg = pd.pivot_table(df_panel,
                             values="Value",
                             index=rows_columns,
                             columns=measure_column,
@@ -957,25 +1632,22 @@ def create_output_ts_validations_measure(df, rows, measure, part, table_code,
     cols_to_retain = [*rows_columns, measure]
     df_agg = df_agg[cols_to_retain]
 
-    # Now that non-measure counts have been removed, pivot the variable
-    # containing the required column information into the column headers.
-    df_measure = pd.pivot_table(df_agg,
-                                values=measure,
-                                index=rows,
-                                columns=ts_column).reset_index()
+    # Now that non-measure counts have been removed, use the measure for each
+    # row and year (excluding the total of all years) as a long panel of the
+    # time series
+    df_panel = (df_agg[df_agg[ts_column] != "Grand_total"]
+                .rename(columns={measure: "Value"}))
+    df_panel[measure_column] = measure
 
-    # Drop the grand_total of year column
-    df_measure = df_measure.drop(["Grand_total"], axis=1)
-
-    # Add required validation columns, first adding single measure to a list
-    # as required for validations function
-    measures = [measure]
-    df_validations = definitions.add_validation_columns(df_measure,
-                                                        validations, measures)
+    # Lay out the years as columns and add the required validation columns
+    df_validations = definitions.validate_time_series(df_panel, validations,
+                                                      rows, measure_column,
+                                                      ts_column)
+    df_validations = df_validations.drop(columns=measure_column)
 
     # Apply final row order
     if sort_on is not None:
-        df_validations = sort_for_output(df_measure, sort_on)
+        df_validations = sort_for_output(df_validations, sort_on, rows=rows)
 
     # Set index ready for writing to Excel
     df_validations.set_index(rows, inplace=True)
@@ -983,6 +1655,60 @@ def create_output_ts_validations_measure(df, rows, measure, part, table_code,
     return df_validations
 
 
+def create_output_anomalies(df, rows, measures, part, table_code,
+                            filter_condition, validations, ts_years,
+                            measure_column="Col_Def",
+                            ts_column="CollectionYearRange"):
+    """
+    Creates a time series for every combination of the rows and measures
+    (e.g. every organisation, measure and age band), with the anomaly scores
+    and any other validation checks for each series. Used to validate all
+    the data rather than a selection of series.
+
+    Parameters
+    ----------
+    df : pandas.DataFrame or PartitionedData
+    rows : list[str]
+        Variable name(s) that identify each series (in addition to the
+        measure).
+    measures : list[str]
+        Name of measure(s) to be scored. Accepts None (all measures).
+    part : list[str]
+        Variable name that holds the collection part.
+        Accepts None (no filter applied) or a list of one or more.
+    table_code : list[str]
+        Variable name that holds the collection table code (letter).
+        Accepts None (no filter applied) or a list of one or more.
+    filter_condition : str
+        This is a non-standard, optional dataframe filter as a string.
+    validations: list[str]
+        List of pre-defined validations to include in the output. Must
+        exist in field_definitions.validate_time_series
+    ts_years: int
+        Number of years to be shown in the time series.
+    measure_column: str
+        Single column name that holds the measure information (e.g. Col_Def)
+    ts_column: str
+        Single column name that holds the years for the time series.
+
+    Returns
+    -------
+    df: pandas.DataFrame
+        One row per series, with the years and validations as columns.
+    """
+    # Sum the values for each series and year from the validation panel
+    df_panel = create_validation_panel(df, measures, part, table_code,
+                                       filter_condition, ts_years,
+                                       measure_column, ts_column)
+    series = list(dict.fromkeys([*rows, measure_column]))
+    df_panel = rollup_validation_panel(df_panel, [*series, ts_column],
+                                       measures, measure_column)
+
+    # Lay out the years as columns and add the required validation columns
+    return definitions.validate_time_series(df_panel, validations, rows,
+                                            measure_column, ts_column)
+
+
 def output_specific_updates(df, name):
     """
     This checks the output name and applies any transformations/updates that
@@ -1018,3 +1744,450 @@ def output_specific_updates(df, name):
                                                 "BSU - other")
 
     return df
+
+
+def init_output_worker(log_queue, log_level):
+    """
+    Initialises a worker process used by iter_outputs, sending its log
+    records to the main process so they are written to the run log.
+
+    Parameters
+    ----------
+    log_queue : multiprocessing.Queue
+        Queue read by the main process (see output_pool).
+    log_level : int
+        Level of the root logger in the main process.
+
+    Returns
+    -------
+    None
+    """
+    logger = logging.getLogger()
+    for handler in logger.handlers[:]:
+        logger.removeHandler(handler)
+    logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    logger.setLevel(log_level)
+
+
+@contextmanager
+def output_pool(processes=param.PROCESSES):
+    """
+    Context in which the outputs are created in parallel (see iter_outputs)
+    by a single pool of worker processes, used for every output in the run.
+    Each source dataframe is saved to a temporary file once, and loaded by
+    each worker the first time it is needed (see pool_source). Where the
+    data is partitioned on disk, the workers load the partitions instead.
+    Log records from the workers are written to the run log.
+    Where processes is 1 (or less), no pool is created and the outputs are
+    created in turn.
+
+    Parameters
+    ----------
+    processes : int
+        Number of worker processes.
+
+    Returns
+    -------
+    None
+    """
+    global OUTPUT_POOL, POOL_DIR, POOL_SOURCES
+    if processes <= 1:
+        yield
+        return
+
+    # Pass the log records from the workers to the handlers of the run log
+    logger = logging.getLogger()
+    log_queue = multiprocessing.Queue()
+    listener = logging.handlers.QueueListener(log_queue, *logger.handlers,
+                                              respect_handler_level=True)
+    listener.start()
+
+    with tempfile.TemporaryDirectory() as pool_dir:
+        OUTPUT_POOL = ProcessPoolExecutor(max_workers=processes,
+                                          initializer=init_output_worker,
+                                          initargs=(log_queue,
+                                                    logger.getEffectiveLevel()))
+        POOL_DIR = Path(pool_dir)
+        POOL_SOURCES = {}
+        try:
+            yield
+        finally:
+            OUTPUT_POOL.shutdown(cancel_futures=True)
+            listener.stop()
+            OUTPUT_POOL = None
+            POOL_DIR = None
+            POOL_SOURCES = None
+
+
+def pool_source(df):
+    """
+    Finds the source of a dataframe to be passed to the worker processes of
+    the output_pool: the location of the partitions where the data is
+    partitioned on disk, or otherwise a temporary file that the dataframe is
+    saved to (once for the pool).
+
+    Parameters
+    ----------
+    df : pandas.DataFrame or PartitionedData
+
+    Returns
+    -------
+    PartitionedData or pathlib.Path
+    """
+    if isinstance(df, PartitionedData):
+        return df
+
+    key = id(df)
+    if (key not in POOL_SOURCES) or (POOL_SOURCES[key][0] is not df):
+        source = POOL_DIR / f"source_{len(POOL_SOURCES)}.pkl"
+        df.to_pickle(source)
+        POOL_SOURCES[key] = (df, source)
+
+    return POOL_SOURCES[key][1]
+
+
+def load_source(source):
+    """
+    Loads a source dataframe passed to a worker process (see pool_source),
+    keeping it for any following outputs created by the worker.
+
+    Parameters
+    ----------
+    source : PartitionedData or pathlib.Path
+
+    Returns
+    -------
+    pandas.DataFrame or PartitionedData
+    """
+    if isinstance(source, PartitionedData):
+        return source
+
+    if source not in WORKER_SOURCES:
+        WORKER_SOURCES[source] = pd.read_pickle(source)
+
+    return WORKER_SOURCES[source]
+
+
+def kept_contents(contents):
+    """
+    Finds the contents of an output whose data has planned uses after the
+    output (e.g. by the cross checks), so that where the output is created
+    in a worker process the data is returned to be shared in the main
+    process rather than created again.
+
+    Parameters
+    ----------
+    contents : list[ContentSpec or function]
+        Contents of the output.
+
+    Returns
+    -------
+    tuple[ContentSpec or function]
+    """
+    if (SHARED_FILTERS is None) or (SHARED_USES is None):
+        return ()
+
+    uses = Counter(contents)
+
+    return tuple(content for content in uses
+                 if SHARED_USES.get(("content", content), 0) > uses[content])
+
+
+def create_output_in_worker(output, source, keep=()):
+    """
+    Creates the dataframe for an output in a worker process, with the data
+    shared between the contents of the output (see shared_filters).
+
+    Parameters
+    ----------
+    output : dict
+        Output arguments, including the name and the function(s) that create
+        the data (contents).
+    source : PartitionedData or pathlib.Path
+        Source dataframe, as passed to the worker (see pool_source).
+    keep : tuple[ContentSpec or function]
+        Contents whose data is returned with the output (see kept_contents).
+
+    Returns
+    -------
+    df_final : pandas.DataFrame
+    df_kept : dict
+        Data created by each content in keep.
+    """
+    # Plan a further use of the kept contents, so their data is not released
+    # when the output has been created
+    with shared_filters([*output["contents"], *keep]):
+        df = load_source(source)
+        df_final = create_output(output, df)
+        df_kept = {content: SHARED_FILTERS[("content", id(df), content)][1]
+                   for content in keep}
+
+    return df_final, df_kept
+
+
+def is_picklable(value):
+    """
+    Checks whether a value can be passed to a worker process.
+
+    Parameters
+    ----------
+    value : Any
+
+    Returns
+    -------
+    bool
+    """
+    try:
+        pickle.dumps(value)
+    except (pickle.PicklingError, AttributeError, TypeError):
+        return False
+
+    return True
+
+
+def find_not_included(df_contents, df_output):
+    """
+    Finds the cells of a concatenated output where the column was not
+    included in the dataframe that created the row (e.g. for tidy csvs where
+    different measures are presented at different org levels).
+
+    Parameters
+    ----------
+    df_contents : list[pandas.DataFrame]
+        Dataframes, in the order they were concatenated.
+    df_output : pandas.DataFrame
+        Concatenated dataframe.
+
+    Returns
+    -------
+    not_included : numpy.ndarray
+        Boolean array with the same shape as df_output.
+    """
+    not_included = [np.broadcast_to(~df_output.columns.isin(df_content.columns),
+                                    (len(df_content), len(df_output.columns)))
+                    for df_content in df_contents]
+
+    return np.concatenate(not_included)
+
+
+def create_content(content, df):
+    """
+    Runs a single content spec (or function) of an output. Where the
+    shared_filters context is active, the dataframe created is shared with
+    any other output that includes an equal content spec, so it is only
+    created once. The use is then counted, so shared data with no planned
+    uses remaining is released (see release_shared).
+
+    Parameters
+    ----------
+    content : ContentSpec or function
+        Creates the data when called with the source dataframe.
+    df : pandas.DataFrame
+        Source dataframe.
+
+    Returns
+    -------
+    df_content : pandas.DataFrame
+    """
+    if SHARED_FILTERS is None:
+        return content(df)
+
+    key = ("content", id(df), content)
+    if (key in SHARED_FILTERS) and (SHARED_FILTERS[key][0] is df):
+        df_content = SHARED_FILTERS[key][1]
+    else:
+        df_content = content(df)
+        share(key, df, df_content, ("content", content))
+
+    release_shared(content)
+
+    return df_content
+
+
+def create_output(output, df):
+    """
+    Runs the function(s) in the contents item of a single output and applies
+    any final updates needed for the specific output.
+    Where there are multiple functions in the contents for one output,
+    the returned dataframes are concatenated. For unmatched columns null
+    values will be created (e.g. for tidy csvs where different measures
+    are presented at different org levels). These are recorded in the
+    "not_included" attrs of the returned dataframe (see find_not_included).
+
+    Parameters
+    ----------
+    output : dict
+        Output arguments, including the name and the function(s) that create
+        the data (contents).
+    df : pandas.DataFrame
+        Source dataframe.
+
+    Returns
+    -------
+    df_final : pandas.DataFrame
+    """
+    logging.info(f"Running {output['contents']} to {output['name']}")
+
+    df_contents = [create_content(content, df)
+                   for content in output["contents"]]
+    df_output = pd.concat(df_contents)
+
+    # Perform any final updates to the dataframe for specific outputs
+    df_final = output_specific_updates(df_output, output["name"])
+
+    # Record the null values created by the concatenation, so they can be
+    # told apart from other null values when the output is written. This is
+    # not kept where the updates have changed the layout of the output.
+    if (len(df_contents) > 1
+            and df_final.index.equals(df_output.index)
+            and df_final.columns.equals(df_output.columns)):
+        df_final.attrs["not_included"] = find_not_included(df_contents,
+                                                           df_output)
+    else:
+        df_final.attrs.pop("not_included", None)
+
+    return df_final
+
+
+def iter_outputs(df, output_args, processes=param.PROCESSES,
+                 queue_size=param.OUTPUT_QUEUE_SIZE):
+    """
+    Creates the dataframe for each output in output_args in a background
+    thread, yielding each one in order as soon as it is ready so that it can
+    be written while the following outputs are being created.
+    At most queue_size outputs are created ahead of the one being written,
+    which limits the memory used.
+    Where more than one process is set, the outputs are created in parallel
+    by the pool of worker processes of the output_pool context (a pool is
+    created for this call only if the context is not active). Any output
+    that can not be passed to the workers, or that fails because the pool
+    has broken, is created serially instead. Where the shared_filters
+    context is active, the data created by the workers that has planned
+    uses after the output (e.g. by the cross checks) is shared in this
+    process.
+
+    Parameters
+    ----------
+    df : pandas.DataFrame or PartitionedData
+        Source dataframe used to create the outputs.
+    output_args : list[dict]
+        Arguments for each output, including the name and the function(s)
+        that create the data (contents).
+    processes : int
+        Maximum number of worker processes to use (1 creates each output in
+        turn).
+    queue_size : int
+        Maximum number of outputs created ahead of the output being written.
+
+    Yields
+    ------
+    output : dict
+        Arguments for the output.
+    df_final : pandas.DataFrame
+        Dataframe created for the output.
+    """
+    # Create a pool of worker processes for these outputs only where the
+    # output_pool context is not active
+    if (processes > 1) and (OUTPUT_POOL is None):
+        with output_pool(min(processes, len(output_args))):
+            yield from iter_outputs(df, output_args, processes, queue_size)
+        return
+
+    parallel = (processes > 1) and (OUTPUT_POOL is not None)
+    pending = Queue(maxsize=queue_size)
+    stop = Event()
+
+    def create_serial(output):
+        # Create the output in this thread, holding the result as a future
+        # (no data is kept, as it is already shared in this process)
+        future = Future()
+        try:
+            future.set_result((create_output(output, df), None))
+        except Exception as error:
+            future.set_exception(error)
+        return future
+
+    def submit(output):
+        # Pass the output to the pool, unless it can not be passed to the
+        # worker processes
+        if parallel and is_picklable(output):
+            return OUTPUT_POOL.submit(create_output_in_worker, output,
+                                      pool_source(df),
+                                      kept_contents(output["contents"]))
+        if parallel:
+            logging.warning(f"{output['name']} can not be created in "
+                            "parallel, creating it serially")
+        return create_serial(output)
+
+    def produce():
+        # Create each output in turn, waiting while the queue is full
+        for output in output_args:
+            try:
+                future = submit(output)
+            except Exception as error:
+                future = Future()
+                future.set_exception(error)
+            while not stop.is_set():
+                try:
+                    pending.put(future, timeout=1)
+                    break
+                except Full:
+                    continue
+            if stop.is_set():
+                future.cancel()
+                return
+
+    producer = Thread(target=produce, daemon=True)
+    producer.start()
+
+    try:
+        for output in output_args:
+            future = pending.get()
+            try:
+                df_final, df_kept = future.result()
+            except (BrokenProcessPool, pickle.PicklingError) as error:
+                if not parallel:
+                    raise
+                logging.warning(f"Creating {output['name']} in parallel failed"
+                                f" ({error!r}), creating it serially")
+                df_final = create_output(output, df)
+            else:
+                # Share the data returned by the worker process for its later
+                # uses, then count the uses of any shared data by the output
+                if df_kept is not None:
+                    for content, df_content in df_kept.items():
+                        share(("content", id(df), content), df, df_content,
+                              ("content", content))
+                    for content in output["contents"]:
+                        release_shared(content)
+            yield output, df_final
+    finally:
+        stop.set()
+        producer.join()
+        # Cancel any outputs created ahead that are no longer needed
+        while not pending.empty():
+            pending.get().cancel()
+
+
+def create_outputs(df, output_args, processes=param.PROCESSES):
+    """
+    Creates the dataframe for each output in output_args using iter_outputs.
+
+    Parameters
+    ----------
+    df : pandas.DataFrame
+        Source dataframe used to create the outputs.
+    output_args : list[dict]
+        Arguments for each output, including the name and the function(s)
+        that create the data (contents).
+    processes : int
+        Maximum number of worker processes to use (1 creates each output in
+        turn).
+
+    Returns
+    -------
+    list[pandas.DataFrame]
+        One dataframe per output, in the same order as output_args.
+    """
+    return [df_final for output, df_final
+            in iter_outputs(df, output_args, processes)]
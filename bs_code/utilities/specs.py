@@ -0,0 +1,318 @@
+"""
+Purpose of the script: contains the specification (spec) objects that describe
+each output - the computation that creates its data (content specs) and where
+it is written (OutputSpec).
+Specs are frozen and hashable, so specs that describe the same computation
+are equal (regardless of their name) and can be used to key shared data.
+"""
+from dataclasses import dataclass, field, fields
+from typing import Any, Callable, Optional, Tuple
+from bs_code.utilities import processing
+
+
+class FrozenDict(tuple):
+    """
+    Hashable dictionary, held as a tuple of (key, value) pairs. Used for the
+    dictionary arguments of specs.
+    """
+    __slots__ = ()
+
+
+def freeze(value):
+    """
+    Converts lists and dictionaries (including any nested within them) to
+    hashable tuples and FrozenDicts.
+
+    Parameters
+    ----------
+    value : Any
+
+    Returns
+    -------
+    Any
+    """
+    if isinstance(value, dict):
+        return FrozenDict((key, freeze(item)) for key, item in value.items())
+    if isinstance(value, list):
+        return tuple(freeze(item) for item in value)
+
+    return value
+
+
+def thaw(value):
+    """
+    Converts tuples and FrozenDicts created by freeze back to lists and
+    dictionaries.
+
+    Parameters
+    ----------
+    value : Any
+
+    Returns
+    -------
+    Any
+    """
+    if isinstance(value, FrozenDict):
+        return {key: thaw(item) for key, item in value}
+    if isinstance(value, tuple):
+        return [thaw(item) for item in value]
+
+    return value
+
+
+def spec(cls):
+    """
+    Class decorator that makes a frozen dataclass with __slots__ (as per
+    dataclass slots=True, which is not available before Python 3.10).
+
+    Parameters
+    ----------
+    cls : type
+
+    Returns
+    -------
+    type
+    """
+    cls = dataclass(frozen=True, repr=False)(cls)
+
+    # Recreate the class with slots for the fields it adds
+    inherited = {name for base in cls.__mro__[1:]
+                 for name in getattr(base, "__slots__", ())}
+    slots = tuple(f.name for f in fields(cls) if f.name not in inherited)
+    namespace = {key: value for key, value in cls.__dict__.items()
+                 if key not in slots + ("__dict__", "__weakref__")}
+    namespace["__slots__"] = slots
+
+    return type(cls)(cls.__name__, cls.__bases__, namespace)
+
+
+class Spec:
+    """
+    Base for all specs. Frozen specs are pickled by their field values, so
+    they can be passed to worker processes.
+    """
+    __slots__ = ()
+
+    def __post_init__(self):
+        # Freeze lists and dictionaries so the spec is hashable
+        for spec_field in fields(self):
+            object.__setattr__(self, spec_field.name,
+                               freeze(getattr(self, spec_field.name)))
+
+    def __getstate__(self):
+        return [getattr(self, spec_field.name) for spec_field in fields(self)]
+
+    def __setstate__(self, state):
+        for spec_field, value in zip(fields(self), state):
+            object.__setattr__(self, spec_field.name, value)
+
+    def __repr__(self):
+        return f"{type(self).__name__}({self.name!r})"
+
+
+@spec
+class OutputSpec(Spec):
+    """
+    Describes an output: the name (Excel worksheet or csv filename), how and
+    where it is written, and the content specs (or functions) that create its
+    data. If more than one content is included they will be appended together.
+    Items can also be read by key (e.g. output["name"]), as for the output
+    dictionaries used by write_outputs.
+    """
+    name: str
+    write_type: str
+    contents: Tuple[Callable, ...]
+    write_cell: Optional[str] = None
+    empty_cols: Optional[Tuple[str, ...]] = None
+
+    def __getitem__(self, key):
+        if key not in self.__dataclass_fields__:
+            raise KeyError(key)
+        return thaw(getattr(self, key))
+
+
+@spec
+class ContentSpec(Spec):
+    """
+    Base for content specs, which create the data for an output when called
+    with the source dataframe. The name is not part of the computation, so
+    is not used when comparing or hashing specs.
+    """
+    name: str = field(compare=False)
+
+    def arguments(self):
+        """
+        Returns the arguments for the function that creates the data, with
+        lists and dictionaries restored.
+        """
+        return {spec_field.name: thaw(getattr(self, spec_field.name))
+                for spec_field in fields(self) if spec_field.name != "name"}
+
+    def filter_arguments(self):
+        """
+        Returns the arguments of the filter applied to the source dataframe
+        (see processing.filter_dataframe), used to plan the uses of the
+        shared filtered data.
+        """
+        return {name: thaw(getattr(self, name))
+                for name in ["part", "table_code", "filter_condition",
+                             "ts_years"]}
+
+
+@spec
+class CrosstabSpec(ContentSpec):
+    """
+    Content spec for processing.create_output_crosstab (see that function for
+    details of the arguments).
+    """
+    rows: Tuple[str, ...]
+    columns: Any
+    part: Optional[Tuple[str, ...]]
+    table_code: Optional[Tuple[str, ...]]
+    sort_on: Optional[Tuple[str, ...]]
+    row_order: Optional[Tuple[str, ...]]
+    column_order: Optional[Tuple[str, ...]]
+    column_rename: Optional[FrozenDict]
+    filter_condition: Optional[str]
+    visible_condition: Optional[str]
+    row_subgroup: Optional[FrozenDict]
+    column_subgroup: Optional[FrozenDict]
+    include_row_labels: bool
+    measure_as_rows: bool
+    ts_years: int = 1
+
+    def __call__(self, df):
+        return processing.create_output_crosstab(df, **self.arguments())
+
+
+@spec
+class MeasureSpec(ContentSpec):
+    """
+    Content spec for processing.create_output_measure (see that function for
+    details of the arguments).
+    """
+    measure_column: str
+    measure: str
+    rows: Tuple[str, ...]
+    columns: Any
+    part: Optional[Tuple[str, ...]]
+    table_code: Optional[Tuple[str, ...]]
+    sort_on: Optional[Tuple[str, ...]]
+    row_order: Optional[Tuple[str, ...]]
+    column_order: Optional[Tuple[str, ...]]
+    column_rename: Optional[FrozenDict]
+    filter_condition: Optional[str]
+    subgroup: Optional[FrozenDict]
+    include_row_labels: bool
+    ts_years: int = 1
+
+    def __call__(self, df):
+        return processing.create_output_measure(df, **self.arguments())
+
+
+@spec
+class CsvTidySpec(ContentSpec):
+    """
+    Content spec for processing.create_output_csv_tidy (see that function for
+    details of the arguments).
+    """
+    collection: str
+    org_level: str
+    breakdown: Tuple[str, ...]
+    measure_column: str
+    part: Optional[Tuple[str, ...]]
+    table_code: Optional[Tuple[str, ...]]
+    sort_on: Optional[Tuple[str, ...]]
+    measure_order: Tuple[str, ...]
+    column_rename: Optional[FrozenDict]
+    filter_condition: Optional[str]
+    visible_condition: Optional[str]
+    breakdown_subgroup: Optional[FrozenDict]
+    ts_years: int = 1
+    year_column: str = "CollectionYearRange"
+
+    def __call__(self, df):
+        return processing.create_output_csv_tidy(df, **self.arguments())
+
+
+@spec
+class TsValidationsSpec(ContentSpec):
+    """
+    Content spec for processing.create_output_ts_validations (see that
+    function for details of the arguments).
+    """
+    rows: Tuple[str, ...]
+    measures: Tuple[str, ...]
+    part: Optional[Tuple[str, ...]]
+    table_code: Optional[Tuple[str, ...]]
+    sort_on: Optional[Tuple[str, ...]]
+    filter_condition: Optional[str]
+    row_subgroup: Optional[FrozenDict]
+    validations: Tuple[str, ...]
+    ts_years: int
+    measure_column: str = "Col_Def"
+    ts_column: str = "CollectionYearRange"
+
+    def __call__(self, df):
+        return processing.create_output_ts_validations(df, **self.arguments())
+
+
+@spec
+class TsValidationsMeasureSpec(ContentSpec):
+    """
+    Content spec for processing.create_output_ts_validations_measure (see
+    that function for details of the arguments).
+    """
+    rows: Tuple[str, ...]
+    measure: str
+    part: Optional[Tuple[str, ...]]
+    table_code: Optional[Tuple[str, ...]]
+    sort_on: Optional[Tuple[str, ...]]
+    filter_condition: Optional[str]
+    subgroup: Optional[FrozenDict]
+    validations: Tuple[str, ...]
+    ts_years: int
+    measure_column: str = "Col_Def"
+    ts_column: str = "CollectionYearRange"
+
+    def __call__(self, df):
+        return processing.create_output_ts_validations_measure(
+            df, **self.arguments())
+
+
+@spec
+class AnomaliesSpec(ContentSpec):
+    """
+    Content spec for processing.create_output_anomalies (see that function
+    for details of the arguments).
+    """
+    rows: Tuple[str, ...]
+    measures: Optional[Tuple[str, ...]]
+    part: Optional[Tuple[str, ...]]
+    table_code: Optional[Tuple[str, ...]]
+    filter_condition: Optional[str]
+    validations: Tuple[str, ...]
+    ts_years: int
+    measure_column: str = "Col_Def"
+    ts_column: str = "CollectionYearRange"
+
+    def __call__(self, df):
+        return processing.create_output_anomalies(df, **self.arguments())
+
+
+@spec
+class CrossCheckSpec(Spec):
+    """
+    Describes a cross check of the totals in the table outputs (see
+    cross_checks.run_cross_checks): the rows of the detail content (e.g.
+    regions or organisations) are summed and compared with the total row of
+    the total content (e.g. England). Where a detail_row is given, that row
+    is compared instead of the sum, to check totals shared across tables.
+    """
+    name: str
+    detail: Callable
+    total: Callable
+    measures: Tuple[str, ...]
+    total_measures: Optional[Tuple[str, ...]] = None
+    detail_row: Optional[str] = None
+    total_row: str = "Grand_total"
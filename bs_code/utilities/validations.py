@@ -1,5 +1,6 @@
-from bs_code.utilities.processing import create_output_ts_validations
-from bs_code.utilities.processing import create_output_ts_validations_measure
+from bs_code.utilities.specs import OutputSpec, TsValidationsSpec, TsValidationsMeasureSpec
+from bs_code.utilities.specs import AnomaliesSpec
+import bs_code.parameters as param
 
 """
 This module contains all the user defined inputs for each validation output (data).
@@ -17,30 +18,24 @@ def get_validations_kc63():
 
     """
     all_outputs = [
-        {"name": "National Coverage",
-         "write_type": "excel_sheet",
-         "contents": [create_validation_coverage_age_national]
-         },
-        {"name": "Regional Coverage 53_70",
-         "write_type": "excel_sheet",
-         "contents": [create_validation_coverage_53_70_region]
-         },
-        {"name": "LA Coverage 53_70",
-         "write_type": "excel_sheet",
-         "contents": [create_validation_coverage_53_70_la]
-         },
-        {"name": "National Eligible_Screened",
-         "write_type": "excel_sheet",
-         "contents": [create_validation_elig_screened_national]
-         },
-        {"name": "Regions Eligible_Screened",
-         "write_type": "excel_sheet",
-         "contents": [create_validation_elig_screened_region]
-         },
-        {"name": "LA Eligible_Screened",
-         "write_type": "excel_sheet",
-         "contents": [create_validation_elig_screened_la]
-         },
+        OutputSpec(name="National Coverage",
+                   write_type="excel_sheet",
+                   contents=[create_validation_coverage_age_national]),
+        OutputSpec(name="Regional Coverage 53_70",
+                   write_type="excel_sheet",
+                   contents=[create_validation_coverage_53_70_region]),
+        OutputSpec(name="LA Coverage 53_70",
+                   write_type="excel_sheet",
+                   contents=[create_validation_coverage_53_70_la]),
+        OutputSpec(name="National Eligible_Screened",
+                   write_type="excel_sheet",
+                   contents=[create_validation_elig_screened_national]),
+        OutputSpec(name="Regions Eligible_Screened",
+                   write_type="excel_sheet",
+                   contents=[create_validation_elig_screened_region]),
+        OutputSpec(name="LA Eligible_Screened",
+                   write_type="excel_sheet",
+                   contents=[create_validation_elig_screened_la]),
         ]
 
     return all_outputs
@@ -56,22 +51,60 @@ def get_validations_kc62():
 
     """
     all_outputs = [
-        {"name": "National Counts",
-         "write_type": "excel_sheet",
-         "contents": [create_validation_invited_screened_total_cancer_national]
-         },
-        {"name": "Regional Counts",
-         "write_type": "excel_sheet",
-         "contents": [create_validation_invited_screened_total_cancer_region]
-         },
-        {"name": "BSU Counts",
-         "write_type": "excel_sheet",
-         "contents": [create_validation_invited_screened_total_cancer_bsu]
-         },
-        {"name": "BSU Rate_with_cancer",
-         "write_type": "excel_sheet",
-         "contents": [create_validation_rate_with_cancer_bsu]
-         },
+        OutputSpec(name="National Counts",
+                   write_type="excel_sheet",
+                   contents=[create_validation_invited_screened_total_cancer_national]),
+        OutputSpec(name="Regional Counts",
+                   write_type="excel_sheet",
+                   contents=[create_validation_invited_screened_total_cancer_region]),
+        OutputSpec(name="BSU Counts",
+                   write_type="excel_sheet",
+                   contents=[create_validation_invited_screened_total_cancer_bsu]),
+        OutputSpec(name="BSU Rate_with_cancer",
+                   write_type="excel_sheet",
+                   contents=[create_validation_rate_with_cancer_bsu]),
+        ]
+
+    return all_outputs
+
+
+def get_anomalies_kc63():
+    """
+    Establishes the functions (contents) required for the anomaly scores of
+    every KC63 series, and the arguments needed for the write process.
+
+    Parameters:
+        None
+
+    """
+    all_outputs = [
+        OutputSpec(name="breast_screening_kc63_anomalies_national",
+                   write_type="csv",
+                   contents=[create_anomalies_kc63_national]),
+        OutputSpec(name="breast_screening_kc63_anomalies_la",
+                   write_type="csv",
+                   contents=[create_anomalies_kc63_la]),
+        ]
+
+    return all_outputs
+
+
+def get_anomalies_kc62():
+    """
+    Establishes the functions (contents) required for the anomaly scores of
+    every KC62 series, and the arguments needed for the write process.
+
+    Parameters:
+        None
+
+    """
+    all_outputs = [
+        OutputSpec(name="breast_screening_kc62_anomalies_national",
+                   write_type="csv",
+                   contents=[create_anomalies_kc62_national]),
+        OutputSpec(name="breast_screening_kc62_anomalies_bsu",
+                   write_type="csv",
+                   contents=[create_anomalies_kc62_bsu]),
         ]
 
     return all_outputs
@@ -90,6 +123,7 @@ def get_validations_kc62():
         Name of single measure to be added and returned.
         Must exist in field_definitions.
         create_output_ts_validations_measure function
+        (for create_output_anomalies, measures can be None for all measures)
     rows : list[str]
         Variable name(s) that holds the output row content (multiple variables can
         be selected).
@@ -115,7 +149,7 @@ def get_validations_kc62():
         grouping(s), and the original subgroup values that will form the group.
     validations: list[str]
         list of pre-defined validations to include in the output. Must
-        exist in processing_steps.add_validation_columns
+        exist in field_definitions.validate_time_series
     ts_years: int
         Defines the number of time series years required in the output.
         Default is 1.
@@ -127,181 +161,195 @@ Returns:
 """
 
 
-def create_validation_coverage_age_national(df):
-    rows = ["Row_Def"]
-    measure = "Coverage"
-    part = ["1"]
-    table_code = None
-    sort_on = None
-    filter_condition = "(Row_Def in['53-54', '55-59', '60-64', '65-69', '70'])"
-    row_subgroup = None
-    validations = ["YoY_change", "Avg_columns", "Avg_change",
-                   "YoY_breach", "Avg_breach"]
-    ts_years = 9
-
-    return create_output_ts_validations_measure(df, rows, measure,
-                                                part, table_code, sort_on,
-                                                filter_condition, row_subgroup,
-                                                validations, ts_years)
-
-
-def create_validation_coverage_53_70_region(df):
-    rows = ["Parent_Org_Name"]
-    measure = "Coverage"
-    part = ["1"]
-    table_code = None
-    sort_on = ["Parent_Org_Name"]
-    filter_condition = "(Row_Def in['53-54', '55-59', '60-64', '65-69', '70'])"
-    row_subgroup = {"Parent_Org_Name": {"South": ["South East", "South West"]}}
-    validations = ["YoY_change", "Avg_columns", "Avg_change",
-                   "YoY_breach", "Avg_breach"]
-    ts_years = 9
-
-    return create_output_ts_validations_measure(df, rows, measure,
-                                                part, table_code, sort_on,
-                                                filter_condition, row_subgroup,
-                                                validations, ts_years)
-
-
-def create_validation_coverage_53_70_la(df):
-    rows = ["Parent_Org_Name", "Org_ONSCode", "Org_Name"]
-    measure = "Coverage"
-    part = ["1"]
-    table_code = None
-    sort_on = ["Org_Name"]
-    filter_condition = "(Row_Def in['53-54', '55-59', '60-64', '65-69', '70'])"
-    row_subgroup = None
-    validations = ["YoY_change", "Avg_columns", "Avg_change",
-                   "YoY_breach", "Avg_breach"]
-    ts_years = 9
-
-    return create_output_ts_validations_measure(df, rows, measure,
-                                                part, table_code, sort_on,
-                                                filter_condition, row_subgroup,
-                                                validations, ts_years)
-
-
-def create_validation_elig_screened_national(df):
-    rows = ["Col_Def", "Row_Def"]
-    measures = ["Women_resident", "Women_eligible", "Women_screened_less3yrs"]
-    part = ["1"]
-    table_code = None
-    sort_on = ["Col_Def", "Row_Def"]
-    filter_condition = "(Row_Def in['53-54', '55-59', '60-64', '65-69', '70'])"
-    row_subgroup = {"Row_Def": {" 53<71":
-                                ["53-54", "55-59", "60-64", "65-69", "70"]}}
-    validations = ["YoY_percent_change", "Avg_columns", "Avg_percent_change",
-                   "YoY_breach", "Avg_breach"]
-    ts_years = 9
-
-    return create_output_ts_validations(df, rows, measures, part, table_code, sort_on,
-                                        filter_condition, row_subgroup,
-                                        validations, ts_years)
-
-
-def create_validation_elig_screened_region(df):
-    rows = ["Parent_Org_Name", "Col_Def", "Row_Def"]
-    measures = ["Women_resident", "Women_eligible", "Women_screened_less3yrs"]
-    part = ["1"]
-    table_code = None
-    sort_on = ["Parent_Org_Name", "Col_Def", "Row_Def"]
-    filter_condition = "(Row_Def in['53-54', '55-59', '60-64', '65-69', '70'])"
-    row_subgroup = {"Row_Def": {" 53<71":
-                                ["53-54", "55-59", "60-64", "65-69", "70"]}}
-    validations = ["YoY_percent_change", "Avg_columns", "Avg_percent_change",
-                   "YoY_breach", "Avg_breach"]
-    ts_years = 9
-
-    return create_output_ts_validations(df, rows, measures, part, table_code, sort_on,
-                                        filter_condition, row_subgroup,
-                                        validations, ts_years)
-
-
-def create_validation_elig_screened_la(df):
-    rows = ["Parent_Org_Name", "Org_ONSCode", "Org_Name", "Col_Def", "Row_Def"]
-    measures = ["Women_resident", "Women_eligible", "Women_screened_less3yrs"]
-    part = ["1"]
-    table_code = None
-    sort_on = ["Org_Name", "Col_Def", "Row_Def"]
-    filter_condition = "(Row_Def in['53-54', '55-59', '60-64', '65-69', '70'])"
-    row_subgroup = {"Row_Def": {" 53<71":
-                                ["53-54", "55-59", "60-64", "65-69", "70"]}}
-    validations = ["YoY_percent_change", "Avg_columns", "Avg_percent_change",
-                   "YoY_breach", "Avg_breach"]
-    ts_years = 9
-
-    return create_output_ts_validations(df, rows, measures, part, table_code, sort_on,
-                                        filter_condition, row_subgroup,
-                                        validations, ts_years)
-
-
-def create_validation_invited_screened_total_cancer_national(df):
-    rows = ["Col_Def", "Row_Def"]
-    measures = ["Invited", "Screened", "Total_with_cancer"]
-    part = ["1", "3"]
-    table_code = None
-    sort_on = ["Col_Def", "Row_Def"]
-    filter_condition = "(Row_Def in['53-54', '55-59', '60-64', '65-69', '70'])"
-    row_subgroup = {"Row_Def": {" 53<71":
-                                ["53-54", "55-59", "60-64", "65-69", "70"]}}
-    validations = ["YoY_percent_change", "Avg_columns", "Avg_percent_change",
-                   "YoY_breach", "Avg_breach"]
-    ts_years = 9
-
-    return create_output_ts_validations(df, rows, measures, part, table_code, sort_on,
-                                        filter_condition, row_subgroup,
-                                        validations, ts_years)
-
-
-def create_validation_invited_screened_total_cancer_region(df):
-    rows = ["Parent_Org_Name", "Col_Def", "Row_Def"]
-    measures = ["Invited", "Screened", "Total_with_cancer"]
-    part = ["1", "3"]
-    table_code = None
-    sort_on = ["Parent_Org_Name", "Col_Def", "Row_Def"]
-    filter_condition = "(Row_Def in['53-54', '55-59', '60-64', '65-69', '70'])"
-    row_subgroup = {"Row_Def": {" 53<71":
-                                ["53-54", "55-59", "60-64", "65-69", "70"]}}
-    validations = ["YoY_percent_change", "Avg_columns", "Avg_percent_change",
-                   "YoY_breach", "Avg_breach"]
-    ts_years = 9
-
-    return create_output_ts_validations(df, rows, measures, part, table_code, sort_on,
-                                        filter_condition, row_subgroup,
-                                        validations, ts_years)
-
-
-def create_validation_invited_screened_total_cancer_bsu(df):
-    rows = ["Org_Code", "Org_Name", "Col_Def", "Row_Def"]
-    measures = ["Invited", "Screened", "Total_with_cancer"]
-    part = ["1", "3"]
-    table_code = None
-    sort_on = ["Org_Name", "Col_Def", "Row_Def"]
-    filter_condition = "(Row_Def in['53-54', '55-59', '60-64', '65-69', '70'])"
-    row_subgroup = {"Row_Def": {" 53<71":
-                                ["53-54", "55-59", "60-64", "65-69", "70"]}}
-    validations = ["YoY_percent_change", "Avg_columns", "Avg_percent_change",
-                   "YoY_breach", "Avg_breach"]
-    ts_years = 9
-
-    return create_output_ts_validations(df, rows, measures, part, table_code, sort_on,
-                                        filter_condition, row_subgroup,
-                                        validations, ts_years)
-
-
-def create_validation_rate_with_cancer_bsu(df):
-    rows = ["Org_Code", "Org_Name"]
-    measure = "Rate_with_cancer"
-    part = ["1", "3"]
-    table_code = None
-    sort_on = ["Org_Name"]
-    filter_condition = "(Row_Def in['53-54', '55-59', '60-64', '65-69', '70'])"
-    row_subgroup = None
-    validations = ["YoY_change", "Avg_columns", "Avg_change",
-                   "YoY_breach", "Avg_breach"]
-    ts_years = 9
-
-    return create_output_ts_validations_measure(df, rows, measure,
-                                                part, table_code, sort_on,
-                                                filter_condition, row_subgroup,
-                                                validations, ts_years)
+create_validation_coverage_age_national = TsValidationsMeasureSpec(
+    name="create_validation_coverage_age_national",
+    rows=["Row_Def"],
+    measure="Coverage",
+    part=["1"],
+    table_code=None,
+    sort_on=None,
+    filter_condition="(Row_Def in['53-54', '55-59', '60-64', '65-69', '70'])",
+    subgroup=None,
+    validations=["YoY_change", "Avg_columns", "Avg_change",
+                 "YoY_breach", "Avg_breach"],
+    ts_years=9)
+
+
+create_validation_coverage_53_70_region = TsValidationsMeasureSpec(
+    name="create_validation_coverage_53_70_region",
+    rows=["Parent_Org_Name"],
+    measure="Coverage",
+    part=["1"],
+    table_code=None,
+    sort_on=["Parent_Org_Name"],
+    filter_condition="(Row_Def in['53-54', '55-59', '60-64', '65-69', '70'])",
+    subgroup={"Parent_Org_Name": {"South": ["South East", "South West"]}},
+    validations=["YoY_change", "Avg_columns", "Avg_change",
+                 "YoY_breach", "Avg_breach"],
+    ts_years=9)
+
+
+create_validation_coverage_53_70_la = TsValidationsMeasureSpec(
+    name="create_validation_coverage_53_70_la",
+    rows=["Parent_Org_Name", "Org_ONSCode", "Org_Name"],
+    measure="Coverage",
+    part=["1"],
+    table_code=None,
+    sort_on=["Org_Name"],
+    filter_condition="(Row_Def in['53-54', '55-59', '60-64', '65-69', '70'])",
+    subgroup=None,
+    validations=["YoY_change", "Avg_columns", "Avg_change",
+                 "YoY_breach", "Avg_breach"],
+    ts_years=9)
+
+
+create_validation_elig_screened_national = TsValidationsSpec(
+    name="create_validation_elig_screened_national",
+    rows=["Col_Def", "Row_Def"],
+    measures=["Women_resident", "Women_eligible", "Women_screened_less3yrs"],
+    part=["1"],
+    table_code=None,
+    sort_on=["Col_Def", "Row_Def"],
+    filter_condition="(Row_Def in['53-54', '55-59', '60-64', '65-69', '70'])",
+    row_subgroup={"Row_Def": {" 53<71":
+                              ["53-54", "55-59", "60-64", "65-69", "70"]}},
+    validations=["YoY_percent_change", "Avg_columns", "Avg_percent_change",
+                 "YoY_breach", "Avg_breach"],
+    ts_years=9)
+
+
+create_validation_elig_screened_region = TsValidationsSpec(
+    name="create_validation_elig_screened_region",
+    rows=["Parent_Org_Name", "Col_Def", "Row_Def"],
+    measures=["Women_resident", "Women_eligible", "Women_screened_less3yrs"],
+    part=["1"],
+    table_code=None,
+    sort_on=["Parent_Org_Name", "Col_Def", "Row_Def"],
+    filter_condition="(Row_Def in['53-54', '55-59', '60-64', '65-69', '70'])",
+    row_subgroup={"Row_Def": {" 53<71":
+                              ["53-54", "55-59", "60-64", "65-69", "70"]}},
+    validations=["YoY_percent_change", "Avg_columns", "Avg_percent_change",
+                 "YoY_breach", "Avg_breach"],
+    ts_years=9)
+
+
+create_validation_elig_screened_la = TsValidationsSpec(
+    name="create_validation_elig_screened_la",
+    rows=["Parent_Org_Name", "Org_ONSCode", "Org_Name", "Col_Def", "Row_Def"],
+    measures=["Women_resident", "Women_eligible", "Women_screened_less3yrs"],
+    part=["1"],
+    table_code=None,
+    sort_on=["Org_Name", "Col_Def", "Row_Def"],
+    filter_condition="(Row_Def in['53-54', '55-59', '60-64', '65-69', '70'])",
+    row_subgroup={"Row_Def": {" 53<71":
+                              ["53-54", "55-59", "60-64", "65-69", "70"]}},
+    validations=["YoY_percent_change", "Avg_columns", "Avg_percent_change",
+                 "YoY_breach", "Avg_breach"],
+    ts_years=9)
+
+
+create_validation_invited_screened_total_cancer_national = TsValidationsSpec(
+    name="create_validation_invited_screened_total_cancer_national",
+    rows=["Col_Def", "Row_Def"],
+    measures=["Invited", "Screened", "Total_with_cancer"],
+    part=["1", "3"],
+    table_code=None,
+    sort_on=["Col_Def", "Row_Def"],
+    filter_condition="(Row_Def in['53-54', '55-59', '60-64', '65-69', '70'])",
+    row_subgroup={"Row_Def": {" 53<71":
+                              ["53-54", "55-59", "60-64", "65-69", "70"]}},
+    validations=["YoY_percent_change", "Avg_columns", "Avg_percent_change",
+                 "YoY_breach", "Avg_breach"],
+    ts_years=9)
+
+
+create_validation_invited_screened_total_cancer_region = TsValidationsSpec(
+    name="create_validation_invited_screened_total_cancer_region",
+    rows=["Parent_Org_Name", "Col_Def", "Row_Def"],
+    measures=["Invited", "Screened", "Total_with_cancer"],
+    part=["1", "3"],
+    table_code=None,
+    sort_on=["Parent_Org_Name", "Col_Def", "Row_Def"],
+    filter_condition="(Row_Def in['53-54', '55-59', '60-64', '65-69', '70'])",
+    row_subgroup={"Row_Def": {" 53<71":
+                              ["53-54", "55-59", "60-64", "65-69", "70"]}},
+    validations=["YoY_percent_change", "Avg_columns", "Avg_percent_change",
+                 "YoY_breach", "Avg_breach"],
+    ts_years=9)
+
+
+create_validation_invited_screened_total_cancer_bsu = TsValidationsSpec(
+    name="create_validation_invited_screened_total_cancer_bsu",
+    rows=["Org_Code", "Org_Name", "Col_Def", "Row_Def"],
+    measures=["Invited", "Screened", "Total_with_cancer"],
+    part=["1", "3"],
+    table_code=None,
+    sort_on=["Org_Name", "Col_Def", "Row_Def"],
+    filter_condition="(Row_Def in['53-54', '55-59', '60-64', '65-69', '70'])",
+    row_subgroup={"Row_Def": {" 53<71":
+                              ["53-54", "55-59", "60-64", "65-69", "70"]}},
+    validations=["YoY_percent_change", "Avg_columns", "Avg_percent_change",
+                 "YoY_breach", "Avg_breach"],
+    ts_years=9)
+
+
+create_validation_rate_with_cancer_bsu = TsValidationsMeasureSpec(
+    name="create_validation_rate_with_cancer_bsu",
+    rows=["Org_Code", "Org_Name"],
+    measure="Rate_with_cancer",
+    part=["1", "3"],
+    table_code=None,
+    sort_on=["Org_Name"],
+    filter_condition="(Row_Def in['53-54', '55-59', '60-64', '65-69', '70'])",
+    subgroup=None,
+    validations=["YoY_change", "Avg_columns", "Avg_change",
+                 "YoY_breach", "Avg_breach"],
+    ts_years=9)
+
+
+create_anomalies_kc63_national = AnomaliesSpec(
+    name="create_anomalies_kc63_national",
+    rows=["Row_Def"],
+    measures=None,
+    part=None,
+    table_code=None,
+    filter_condition=None,
+    validations=["Robust_z", "Outlier_years", "Rolling_MAD", "Break_year",
+                 "Break_score", "Anomaly_breach"],
+    ts_years=param.TS_YEARS_KC63)
+
+
+create_anomalies_kc63_la = AnomaliesSpec(
+    name="create_anomalies_kc63_la",
+    rows=["Org_ONSCode", "Org_Name", "Row_Def"],
+    measures=None,
+    part=None,
+    table_code=None,
+    filter_condition=None,
+    validations=["Robust_z", "Outlier_years", "Rolling_MAD", "Break_year",
+                 "Break_score", "Anomaly_breach"],
+    ts_years=param.TS_YEARS_KC63)
+
+
+create_anomalies_kc62_national = AnomaliesSpec(
+    name="create_anomalies_kc62_national",
+    rows=["Part", "Table_Code", "Row_Def"],
+    measures=None,
+    part=None,
+    table_code=None,
+    filter_condition=None,
+    validations=["Robust_z", "Outlier_years", "Rolling_MAD", "Break_year",
+                 "Break_score", "Anomaly_breach"],
+    ts_years=param.TS_YEARS_KC62)
+
+
+create_anomalies_kc62_bsu = AnomaliesSpec(
+    name="create_anomalies_kc62_bsu",
+    rows=["Org_Code", "Org_Name", "Part", "Table_Code", "Row_Def"],
+    measures=None,
+    part=None,
+    table_code=None,
+    filter_condition=None,
+    validations=["Robust_z", "Outlier_years", "Rolling_MAD", "Break_year",
+                 "Break_score", "Anomaly_breach"],
+    ts_years=param.TS_YEARS_KC62)
@@ -1,6 +1,7 @@
 """
 Purpose of the script: contains the Excel automation script.
 """
+import numpy as np
 import pandas as pd
 import xlwings as xw
 import bs_code.parameters as param
@@ -308,8 +309,83 @@ def write_csv(df, output_path, output_name):
     df.to_csv(save_path, index=False)
 
 
+def fill_null_values(df, not_included_value,
+                     not_applicable=param.NOT_APPLICABLE):
+    """
+    Replaces the null values in an output with text, as the last step before
+    it is written, so that the data is kept numeric until this point.
+    Null values created by the concatenation of multiple dataframes for one
+    output (as recorded by processing.create_output) are replaced separately
+    from all other null values.
+
+    Parameters
+    ----------
+    df : pandas.DataFrame
+    not_included_value: str
+        Replacement value for nulls created during the concatenation of
+        multiple dataframes for one output.
+    not_applicable: str
+        Replacement value for all other nulls. Default is the project default.
+
+    Returns
+    -------
+    df : pandas.DataFrame
+    """
+    # Replace the nulls in columns that were not included in the dataframe
+    # that created the row
+    not_included = df.attrs.get("not_included")
+    if not_included is not None:
+        df = df.mask(not_included, not_included_value)
+
+    # Replace all remaining nulls
+    df = df.fillna(not_applicable)
+
+    return df
+
+
+def fill_warning_flags(df, flag=param.LOW_NUMERATOR):
+    """
+    Replaces the low numerator warnings held in rows (see
+    field_definitions.add_measures_as_rows) with text, as the output is
+    written. Warning rows are identified by a row label ending in
+    '_warning', and hold 1 where the warning applies and 0 otherwise.
+
+    Parameters
+    ----------
+    df : pandas.DataFrame
+    flag: str
+        The flag value that will be shown for low numerator warnings.
+
+    Returns
+    -------
+    df : pandas.DataFrame
+    """
+    # Find the warning rows from the row labels in the index and any text
+    # columns
+    labels = [df.index.get_level_values(level)
+              for level in range(df.index.nlevels)]
+    labels += [df[column] for column in df.select_dtypes("object").columns]
+    is_warning = np.zeros(len(df), dtype=bool)
+    for label in labels:
+        is_warning |= pd.Series(label).astype(str).str.endswith("_warning").to_numpy()
+
+    if not is_warning.any():
+        return df
+
+    # Replace the flags in the numeric columns of the warning rows
+    df = df.copy()
+    numeric = [df.columns.get_loc(column)
+               for column in df.select_dtypes("number").columns]
+    df[df.columns[numeric]] = df[df.columns[numeric]].astype(object)
+    flags = df.iloc[is_warning, numeric].to_numpy(dtype=float)
+    df.iloc[is_warning, numeric] = np.where(flags > 0, flag, "")
+
+    return df
+
+
 def select_write_type(df, write_type, output_path, output_name,
-                      write_cell=None, empty_cols=None):
+                      write_cell=None, empty_cols=None,
+                      not_applicable=param.NOT_APPLICABLE):
     """
     Determines which type of write function is needed and performs that
     function.
@@ -334,6 +410,9 @@ def select_write_type(df, write_type, output_path, output_name,
         columns in the worksheet. Empty columns will be inserted into the
         dataframe in these positions. Not required if the write_type is
         csv.
+    not_applicable: str
+        Replacement value for nulls created during the concatenation of
+        multiple dataframes for one output. Default is the project default.
 
     Returns
     -------
@@ -344,6 +423,11 @@ def select_write_type(df, write_type, output_path, output_name,
     valid_values = ["csv", "excel_static", "excel_variable", "excel_sheet"]
     helpers.validate_value_with_list("write_type", write_type, valid_values)
 
+    # Replace the low numerator warnings and null values with the required
+    # text replacements
+    df = fill_warning_flags(df)
+    df = fill_null_values(df, not_applicable)
+
     # If write_type is csv, then write the output to a csv
     if write_type == "csv":
         write_csv(df, output_path, output_name)
@@ -387,8 +471,9 @@ def write_outputs(df, output_args, output_path,
     None
 
     """
-    # For each item in the output_args dictionary
-    for output in output_args:
+    # For each item in the output_args dictionary, write the data as soon as
+    # it has been created (the following outputs are created in the meantime)
+    for output, df_final in processing.iter_outputs(df, output_args):
         # Extract all the required arguments from the output_args dictionary
         # Some arguments are not needed if the write_type is csv
         name = output["name"]
@@ -397,29 +482,14 @@ def write_outputs(df, output_args, output_path,
         if write_type == "csv":
             write_cell = None
             empty_cols = None
-        if write_type == "excel_sheet":
+        elif write_type == "excel_sheet":
             write_cell = "A1"
             empty_cols = None
         else:
             write_cell = output["write_cell"]
             empty_cols = output["empty_cols"]
 
-        logging.info(f"Running {output['contents']} to {name}")
-
-        # Run the function(s) in the contents item.
-        # Where there are multiple functions in the contents for one output,
-        # the returned dataframes are concatenated. For unmatched columns null
-        # values will be created (e.g. for tidy csvs where different measures
-        # are presented at different org levels)
-        df_output = pd.concat([content(df) for content in output["contents"]])
-
-        # Perform any final updates to the dataframe for specific outputs
-        df_final = processing.output_specific_updates(df_output, name)
-
-        # Replace remaining nulls with the required 'not_applicable' replacement
-        # value.
-        df_final = df_final.fillna(not_applicable)
-
-        # Write the output as per the selected write type
+        # Write the output as per the selected write type, replacing nulls
+        # as it is written
         select_write_type(df_final, write_type, output_path,
-                          name, write_cell, empty_cols)
+                          name, write_cell, empty_cols, not_applicable)
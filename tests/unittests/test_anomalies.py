@@ -0,0 +1,89 @@
+import numpy as np
+from bs_code.utilities import anomalies
+
+
+def test_robust_z_scores():
+    """
+    Tests that robust z-scores are scored against the median and MAD of each
+    series, ignoring missing values, and that any change in a flat series
+    is scored as infinite.
+    """
+    values = np.array([[10.0, 12.0, 8.0, 10.0, 30.0],
+                       [5.0, 5.0, np.nan, 5.0, 5.0],
+                       [5.0, 5.0, 5.0, 5.0, 6.0]])
+
+    # Median 10, MAD 2 (scale 2 / 0.6745, corrected by 5 / 4.2 for the 5
+    # values)
+    correction = 5 / 4.2
+    expected = np.array([[0.0, 0.6745, -0.6745, 0.0, 6.745],
+                         [0.0, 0.0, np.nan, 0.0, 0.0],
+                         [0.0, 0.0, 0.0, 0.0, 1 / (0.2 * 1.253314)]])
+    expected = expected / correction
+
+    actual = anomalies.robust_z_scores(values)
+
+    np.testing.assert_allclose(actual, expected)
+
+
+def test_rolling_mad_scores():
+    """
+    Tests that each value is scored against the previous years in the window,
+    and that years without a full window are not scored.
+    """
+    values = np.array([[10.0, 12.0, 8.0, 10.0, 14.0]])
+
+    # 10 against [10, 12, 8] and 14 against [12, 8, 10] (median 10, MAD 2,
+    # corrected by 3 / 2.2 for the 3 values)
+    expected = np.array([[np.nan, np.nan, np.nan, 0.0,
+                          2 * 0.6745 * 2.2 / 3]])
+
+    actual = anomalies.rolling_mad_scores(values, 3)
+
+    np.testing.assert_allclose(actual, expected)
+    assert np.isnan(anomalies.rolling_mad_scores(values, 5)).all()
+
+
+def test_structural_breaks():
+    """
+    Tests that the largest shift in the level of each series is found, and
+    that no break is scored where the series is too short.
+    """
+    values = np.array([[10.0, 11.0, 10.0, 20.0, 21.0, 20.0],
+                       [10.0, 10.0, 10.0, 10.0, 10.0, 10.0]])
+
+    position, score = anomalies.structural_breaks(values, 2)
+
+    np.testing.assert_array_equal(position, [3, -1])
+    assert score[0] > 10
+    assert score[1] == 0
+
+    position, score = anomalies.structural_breaks(values, 4)
+
+    np.testing.assert_array_equal(position, [-1, -1])
+    assert np.isnan(score).all()
+
+
+def test_breach_thresholds():
+    """
+    Tests that the thresholds are calibrated to the length of the series, so
+    that each check flags the false alarm rate of series of simulated noise,
+    and that checks which cannot be scored have no threshold.
+    """
+    rng = np.random.default_rng(1)
+    noise = rng.standard_normal((20000, 13))
+
+    z, rolling, level_shift = anomalies.breach_thresholds(13, 8, 3, 0.01)
+
+    flagged = (np.abs(anomalies.robust_z_scores(noise)) > z).any(axis=1)
+    assert abs(flagged.mean() - 0.01) < 0.003
+    flagged = np.abs(anomalies.rolling_mad_scores(noise, 8)[:, -1]) > rolling
+    assert abs(flagged.mean() - 0.01) < 0.003
+    _, score = anomalies.structural_breaks(noise, 3)
+    assert abs((score > level_shift).mean() - 0.01) < 0.003
+
+    # A shorter series has more uncertain scores, so higher thresholds
+    assert anomalies.breach_thresholds(9, 8, 3, 0.01)[0] > z
+
+    _, rolling, level_shift = anomalies.breach_thresholds(5, 8, 3, 0.01)
+    assert np.isnan(rolling)
+    assert np.isnan(level_shift)
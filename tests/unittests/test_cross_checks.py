@@ -0,0 +1,121 @@
+import logging
+import pandas as pd
+import pytest
+from bs_code.utilities import cross_checks
+from bs_code.utilities.specs import CrossCheckSpec
+
+
+def create_region_table(df):
+    """Example region output used by the cross check tests"""
+    return pd.DataFrame(
+        {
+            "Screened 2020-21": [60.0, 20.0, 40.0],
+            "Screened 2021-22": [70.0, 30.0, 40.0],
+            "Invited 2020-21": [60.0, 25.0, 35.0],
+            "Invited 2021-22": [70.0, 40.0, 30.0],
+            "Uptake 2021-22": [100.0, 75.0, 133.3],
+            },
+        index=pd.Index(["Grand_total", "R1", "R2"], name="Parent_Org_Code")
+        )
+
+
+def create_org_table(df):
+    """Example organisation output used by the cross check tests"""
+    return pd.DataFrame(
+        {
+            "Org_Name": ["A", "B", "C"],
+            "Screened 2020-21": [20.0, 30.0, 10.0],
+            "Screened 2021-22": [30.0, 30.0, 20.0],
+            }
+        )
+
+
+def test_run_cross_checks(caplog):
+    """
+    Tests that the run_cross_checks function compares the sum of the detail
+    rows (excluding the total row) with the total row for every year of the
+    measures, and reports any failures in the log.
+    """
+    checks = [CrossCheckSpec(name="Regions sum to England",
+                             detail=create_region_table,
+                             total=create_region_table,
+                             measures=["Screened"]),
+              CrossCheckSpec(name="Orgs sum to England",
+                             detail=create_org_table,
+                             total=create_region_table,
+                             measures=["Screened"])]
+
+    expected = pd.DataFrame(
+        {
+            "Check": ["Regions sum to England", "Regions sum to England",
+                      "Orgs sum to England", "Orgs sum to England"],
+            "Detail_column": ["Screened 2020-21", "Screened 2021-22",
+                              "Screened 2020-21", "Screened 2021-22"],
+            "Total_column": ["Screened 2020-21", "Screened 2021-22",
+                             "Screened 2020-21", "Screened 2021-22"],
+            "Detail_value": [60.0, 70.0, 60.0, 80.0],
+            "Total_value": [60.0, 70.0, 60.0, 70.0],
+            "Difference": [0.0, 0.0, 0.0, 10.0],
+            "Pass": [True, True, True, False],
+            }
+        )
+
+    with caplog.at_level(logging.WARNING):
+        actual = cross_checks.run_cross_checks(None, checks)
+
+    pd.testing.assert_frame_equal(actual, expected)
+    assert "Orgs sum to England - Screened 2021-22" in caplog.text
+    assert "Regions sum to England" not in caplog.text
+
+
+def test_run_cross_checks_shared_total():
+    """
+    Tests that a detail row can be compared with a total that is named
+    differently, and that an error is raised if the total columns for the
+    measure are not in the output.
+    """
+    check = CrossCheckSpec(name="Shared total",
+                           detail=create_region_table,
+                           total=create_region_table,
+                           measures=["Screened"],
+                           total_measures=["Invited"],
+                           detail_row="Grand_total")
+
+    actual = cross_checks.run_cross_checks(None, [check])
+
+    assert actual["Total_column"].tolist() == ["Invited 2020-21",
+                                               "Invited 2021-22"]
+    assert actual["Pass"].all()
+
+    missing = CrossCheckSpec(name="Missing total",
+                             detail=create_region_table,
+                             total=create_region_table,
+                             measures=["Screened"],
+                             total_measures=["Uptake"],
+                             detail_row="Grand_total")
+
+    with pytest.raises(ValueError):
+        cross_checks.run_cross_checks(None, [missing])
+
+
+def create_float_table(df):
+    """Example output with floating point sums used by the cross check tests"""
+    return pd.DataFrame({"Rate": [0.3, 0.1, 0.2]},
+                        index=pd.Index(["Grand_total", "R1", "R2"],
+                                       name="Parent_Org_Code"))
+
+
+def test_run_cross_checks_tolerance():
+    """
+    Tests that differences from floating point sums are within the default
+    tolerance, and that they fail a check with no tolerance.
+    """
+    check = CrossCheckSpec(name="Float sums",
+                           detail=create_float_table,
+                           total=create_float_table,
+                           measures=["Rate"])
+
+    assert cross_checks.run_cross_checks(None, [check])["Pass"].all()
+    assert not cross_checks.run_cross_checks(None, [check],
+                                             tolerance=0)["Pass"].any()
+
@@ -158,3 +158,375 @@ def test_sdr_expected():
 
     pd.testing.assert_frame_equal(actual.reset_index(drop=True),
                                   expected.reset_index(drop=True))
+
+
+def test_add_sdr_expected(tmp_path):
+    """
+    Tests the add_sdr_expected function, which calculates and appends
+    SDR_expected values for multiple years, using the SDR multiplier ratios
+    applicable to each year
+    """
+    ref_file = tmp_path / "sdr.csv"
+    pd.DataFrame(
+        {
+            "Age band": ["50-52", "65-69", "50-52", "65-69"],
+            "Tables A and B": [3.64, 10.76, 2.0, 10.0],
+            "Tables C1 and C2": [1.5, 4.2, 1.0, 4.0],
+            "Date_start": ["01/04/2015", "01/04/2015",
+                           "01/04/2000", "01/04/2000"],
+            "Date_end": ["", "", "31/03/2015", "31/03/2015"]
+            }
+        ).to_csv(ref_file, index=False)
+
+    input_df = pd.DataFrame(
+        {
+            "CollectionYearRange": ["2019-20", "2019-20", "2014-15", "2014-15"],
+            "Row_Def": ["50-52", "65-69", "50-52", "65-69"],
+            "Col_Def": ["Screened", "Screened", "Screened", "Invited"],
+            "Value": [100, 200, 400, 50]
+            }
+        )
+
+    expected = pd.DataFrame(
+        {
+            "CollectionYearRange": ["2019-20", "2019-20", "2014-15", "2014-15",
+                                    "2019-20", "2019-20", "2014-15"],
+            "Row_Def": ["50-52", "65-69", "50-52", "65-69",
+                        "50-52", "65-69", "50-52"],
+            "Col_Def": ["Screened", "Screened", "Screened", "Invited",
+                        "SDR_expected", "SDR_expected", "SDR_expected"],
+            "Value": [100, 200, 400, 50, 0.15, 0.84, 0.4]
+            })
+
+    actual = field_definitions.add_sdr_expected(
+        input_df,
+        table_code=["C1", "C2"],
+        ref_file=ref_file)
+
+    pd.testing.assert_frame_equal(actual.reset_index(drop=True),
+                                  expected.reset_index(drop=True))
+
+
+def test_add_measures():
+    """
+    Tests the add_measures function, which adds only the requested
+    percentage/rate measures (and low numerator warnings) to the dataframe
+    """
+    input_df = pd.DataFrame(
+        {
+            "Screened": [1000, 200, 0],
+            "Invited": [2000, 400, 10],
+            "Small_invasive": [30, 10, 0],
+            }
+        )
+
+    expected = pd.DataFrame(
+        {
+            "Screened": [1000, 200, 0],
+            "Invited": [2000, 400, 10],
+            "Small_invasive": [30, 10, 0],
+            "Uptake": [50.0, 50.0, 0.0],
+            "Rate_small_invasive": [30.0, 50.0, np.nan],
+            "Rate_small_invasive_warning": ["", "!", "!"],
+            }
+        )
+
+    actual = field_definitions.add_measures(
+        input_df,
+        ["Screened", "Uptake", "Rate_small_invasive_warning"])
+
+    pd.testing.assert_frame_equal(actual, expected)
+
+
+def test_resolve_measures():
+    """
+    Tests the resolve_measures function, which returns the requested measures
+    and their dependencies in the batches they are to be calculated in
+    """
+    measures = {"Rate_a": {"numerator": "A", "denominator": "B",
+                           "multiplier": 100, "warning": False},
+                "Rate_b": {"numerator": "C", "denominator": "B",
+                           "multiplier": 100, "warning": True},
+                "Ratio_a_b": {"numerator": "Rate_a", "denominator": "Rate_b",
+                              "multiplier": 1, "warning": False},
+                "Rate_c": {"numerator": "D", "denominator": "B",
+                           "multiplier": 100, "warning": False,
+                           "depends_on": ["Ratio_a_b"]},
+                "Rate_d": {"numerator": "E", "denominator": "B",
+                           "multiplier": 100, "warning": False}}
+
+    expected = [["Rate_a", "Rate_b"], ["Ratio_a_b"], ["Rate_c"]]
+
+    actual = field_definitions.resolve_measures(
+        ["Invited", "Rate_c", "Rate_b_warning"], measures)
+
+    assert actual == expected, f"When resolving measures expected {expected} but found {actual}"
+
+
+def test_add_measures_as_rows():
+    """
+    Tests the add_measures_as_rows function, which adds the requested
+    percentage/rate measures as rows where the measures are held in rows
+    """
+    input_df = pd.DataFrame(
+        {
+            "Col_Def": ["Invited", "Screened", "Small_invasive"],
+            "2020-21": [2000, 1000, 30],
+            "2021-22": [400, 200, 10],
+            }
+        )
+
+    expected = pd.DataFrame(
+        {
+            "Col_Def": ["Invited", "Screened", "Small_invasive", "Uptake",
+                        "Rate_small_invasive"],
+            "2020-21": [2000.0, 1000.0, 30.0, 50.0, 30.0],
+            "2021-22": [400.0, 200.0, 10.0, 50.0, 50.0],
+            }
+        )
+
+    actual = field_definitions.add_measures_as_rows(
+        input_df,
+        ["Screened", "Uptake", "Rate_small_invasive"],
+        "Col_Def")
+
+    pd.testing.assert_frame_equal(actual, expected)
+
+
+def test_add_measures_as_rows_warning():
+    """
+    Tests that low numerator warnings added as rows by add_measures_as_rows
+    are held as numeric flags, so the year columns are not turned into text
+    """
+    input_df = pd.DataFrame(
+        {
+            "Col_Def": ["Small_invasive", "Screened"],
+            "2020-21": [30, 1000],
+            "2021-22": [10, 200],
+            }
+        )
+
+    expected = pd.DataFrame(
+        {
+            "Col_Def": ["Small_invasive", "Screened", "Rate_small_invasive",
+                        "Rate_small_invasive_warning"],
+            "2020-21": [30.0, 1000.0, 30.0, 0.0],
+            "2021-22": [10.0, 200.0, 50.0, 1.0],
+            }
+        )
+
+    actual = field_definitions.add_measures_as_rows(
+        input_df,
+        ["Small_invasive", "Rate_small_invasive",
+         "Rate_small_invasive_warning"],
+        "Col_Def")
+
+    pd.testing.assert_frame_equal(actual, expected)
+
+
+def test_required_counts():
+    """
+    Tests the required_counts function, which returns the counts needed to
+    calculate the measures in the columns content
+    """
+    expected = ["Invited", "Small_invasive", "Screened", "Invasive_total"]
+
+    actual = field_definitions.required_counts(
+        ["Invited", "Rate_small_invasive_warning", "Percent_small_invasive"])
+
+    assert actual == expected, f"When finding required counts expected {expected} but found {actual}"
+
+
+def test_add_measures_counts_sparse():
+    """
+    Tests that add_measures_counts only stores the counts that are in the
+    input data or are not 0, and that fill_zero_counts fills in the 0 counts
+    for every measure.
+    """
+    input_df = pd.DataFrame(
+        {
+            "Org_Code": ["A", "A", "A", "A", "A", "B"],
+            "Col_Def": ["Women_resident", "Women_ineligible",
+                        "Women_screened_less3yrs", "Women_selected_no_screen",
+                        "Women_not_selected_not_screened", "Women_resident"],
+            "Value": [100, 10, 0, 5, 0, 50],
+            }
+        )
+
+    measures = ["Women_ineligible", "Women_not_selected_not_screened",
+                "Women_resident", "Women_screened_less3yrs",
+                "Women_selected_no_screen", "Women_eligible",
+                "Women_never_screened"]
+
+    expected = pd.DataFrame(
+        {
+            "Org_Code": ["A", "A", "A", "A", "A", "A", "A", "B", "B"],
+            "Col_Def": pd.Categorical(
+                ["Women_ineligible", "Women_not_selected_not_screened",
+                 "Women_resident", "Women_screened_less3yrs",
+                 "Women_selected_no_screen", "Women_eligible",
+                 "Women_never_screened", "Women_resident", "Women_eligible"],
+                categories=measures),
+            "Value": [10.0, 0.0, 100.0, 0.0, 5.0, 90.0, 5.0, 50.0, 50.0],
+            }
+        )
+
+    actual = field_definitions.add_measures_counts(input_df, "KC63")
+
+    pd.testing.assert_frame_equal(actual, expected)
+
+    filled = field_definitions.fill_zero_counts(actual)
+    filled_b = filled[filled["Org_Code"] == "B"].set_index("Col_Def")["Value"]
+
+    assert len(filled) == 14
+    assert filled_b.to_dict() == {"Women_ineligible": 0.0,
+                                  "Women_not_selected_not_screened": 0.0,
+                                  "Women_resident": 50.0,
+                                  "Women_screened_less3yrs": 0.0,
+                                  "Women_selected_no_screen": 0.0,
+                                  "Women_eligible": 50.0,
+                                  "Women_never_screened": 0.0}
+    assert filled["Col_Def"].dtype == object
+    assert field_definitions.sparse_measures(filled) is None
+
+
+def test_fill_zero_counts_pickled_slice(tmp_path):
+    """
+    Tests that the sparse measures are kept when the data is sliced and
+    saved, so that fill_zero_counts fills in the 0 counts in the same order
+    as for the unsliced data.
+    """
+    input_df = pd.DataFrame(
+        {
+            "CollectionYearRange": ["2020-21", "2020-21", "2021-22"],
+            "Org_Code": ["B", "A", "A"],
+            "Col_Def": ["Invited", "Screened", "Invited"],
+            "Value": [5.0, 10.0, 20.0],
+            }
+        )
+    input_df = field_definitions.mark_sparse_measures(
+        input_df, ["Screened", "Invited", "Referred"])
+
+    expected = pd.DataFrame(
+        {
+            "CollectionYearRange": ["2020-21"] * 6,
+            "Org_Code": ["A", "A", "A", "B", "B", "B"],
+            "Col_Def": ["Screened", "Invited", "Referred"] * 2,
+            "Value": [10.0, 0.0, 0.0, 0.0, 5.0, 0.0],
+            }
+        )
+
+    input_df.to_pickle(tmp_path / "data.pkl")
+    df_loaded = pd.read_pickle(tmp_path / "data.pkl")
+    df_slice = df_loaded[df_loaded["CollectionYearRange"] == "2020-21"]
+
+    actual = field_definitions.fill_zero_counts(df_slice)
+
+    pd.testing.assert_frame_equal(actual, expected)
+
+
+def test_validate_time_series(monkeypatch):
+    """
+    Tests that validate_time_series lays out a long panel of several measures
+    with the years as columns and adds the validation checks, flagging
+    breaches with the threshold and check for the measure of each row.
+    """
+    monkeypatch.setattr(field_definitions.param, "YOY_TO_YEAR", "2021-22")
+    monkeypatch.setattr(field_definitions.param, "YOY_FROM_YEAR", "2020-21")
+    monkeypatch.setattr(field_definitions.param, "ROLLING_AVG_YEARS", 2)
+
+    breaches = [("Coverage", "YoY_breach", 5, "YoY_change", "absolute"),
+                ("Invited", "YoY_breach", 10, "YoY_percent_change",
+                 "percentage")]
+
+    input_df = pd.DataFrame(
+        {
+            "Org_Code": ["A", "A", "A", "A", "B", "B"],
+            "Col_Def": ["Coverage", "Coverage", "Invited", "Invited",
+                        "Invited", "Invited"],
+            "CollectionYearRange": ["2020-21", "2021-22", "2020-21",
+                                    "2021-22", "2020-21", "2021-22"],
+            "Value": [70.0, 76.0, 100.0, 105.0, 100.0, 120.0],
+            }
+        )
+
+    expected = pd.DataFrame(
+        {
+            "Org_Code": ["A", "A", "B"],
+            "Col_Def": ["Coverage", "Invited", "Invited"],
+            "2020-21": [70.0, 100.0, 100.0],
+            "2021-22": [76.0, 105.0, 120.0],
+            "YoY_change": [6.0, 5.0, 20.0],
+            "Avg_columns": [73.0, 102.5, 110.0],
+            "YoY_breach": ["More than 5absolute difference compared to "
+                           "previous year", "Pass",
+                           "More than 10percentage difference compared to "
+                           "previous year"],
+            }
+        )
+    expected.columns.name = "CollectionYearRange"
+
+    actual = field_definitions.validate_time_series(
+        input_df, ["YoY_change", "Avg_columns", "YoY_breach"], ["Org_Code"],
+        breaches=breaches)
+
+    pd.testing.assert_frame_equal(actual, expected)
+
+
+def test_validate_time_series_anomaly_noise():
+    """
+    Tests that few series of noise (normal values and small Poisson counts,
+    over the 13 years of the time series) are flagged as anomalies.
+    """
+    rng = np.random.default_rng(0)
+    n_series = 2000
+    years = [f"{year}-{year % 100 + 1:02d}" for year in range(2009, 2022)]
+
+    for values in (rng.normal(1000, 50, (n_series, len(years))),
+                   rng.poisson(3, (n_series, len(years))).astype(float)):
+        input_df = pd.DataFrame(
+            {
+                "Org_Code": np.repeat(np.arange(n_series), len(years)),
+                "Col_Def": "Screened",
+                "CollectionYearRange": np.tile(years, n_series),
+                "Value": values.ravel(),
+                }
+            )
+
+        actual = field_definitions.validate_time_series(
+            input_df, ["Anomaly_breach"], ["Org_Code"], breaches=[])
+
+        assert len(actual) == n_series
+        assert (actual["Anomaly_breach"] != "Pass").mean() < 0.03
+
+
+def test_validate_time_series_anomaly_checks():
+    """
+    Tests that each anomaly validation can be requested on its own, and
+    gives the same values as when all are requested together.
+    """
+    rng = np.random.default_rng(0)
+    years = [f"{year}-{year % 100 + 1:02d}" for year in range(2009, 2022)]
+
+    input_df = pd.DataFrame(
+        {
+            "Org_Code": np.repeat(["A", "B"], len(years)),
+            "Col_Def": "Screened",
+            "CollectionYearRange": np.tile(years, 2),
+            "Value": rng.normal(1000, 50, 2 * len(years)),
+            }
+        )
+
+    validations = ["Robust_z", "Outlier_years", "Rolling_MAD", "Break_year",
+                   "Break_score", "Anomaly_breach"]
+
+    expected = field_definitions.validate_time_series(
+        input_df, validations, ["Org_Code"], breaches=[])
+
+    for validation in validations:
+        actual = field_definitions.validate_time_series(
+            input_df, [validation], ["Org_Code"], breaches=[])
+
+        pd.testing.assert_series_equal(actual[validation],
+                                       expected[validation])
+
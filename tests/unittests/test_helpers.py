@@ -62,6 +62,33 @@ def test_replace_col_value():
     pd.testing.assert_frame_equal(actual, expected)
 
 
+def test_use_org_name_key():
+    """
+    Tests the use_org_name_key function, which replaces the org names with
+    the normalised org name key without modifying the input dataframe
+    """
+    input_df = pd.DataFrame(
+        {
+            "Org_Name": ["Hackney", "HACKNEY", "Cornwall"],
+            "Org_Name_Key": ["HACKNEY", "HACKNEY", "CORNWALL"],
+            "Value": [1, 2, 3]
+            }
+        )
+    input_copy = input_df.copy()
+
+    expected = pd.DataFrame(
+        {
+            "Org_Name": ["HACKNEY", "HACKNEY", "CORNWALL"],
+            "Value": [1, 2, 3]
+            }
+        )
+
+    actual = helpers.use_org_name_key(input_df)
+
+    pd.testing.assert_frame_equal(actual, expected)
+    pd.testing.assert_frame_equal(input_df, input_copy)
+
+
 def test_remove_rows():
     """Tests the remove rows function, which removes rows from dataframe where
     any column contains a specified value(s)
@@ -93,6 +120,36 @@ def test_remove_rows():
                                   expected.reset_index(drop=True))
 
 
+def test_remove_rows_columns():
+    """Tests the remove rows function where only selected columns are checked
+    for the specified value(s)
+    """
+    input_df = pd.DataFrame(
+        {
+            "BreakdownA": ["Grand_total", "Group1", "Group2"],
+            "Note": ["Group1", "Grand_total", "Group2"],
+            "MeasureA": [200, 100, 200],
+            }
+        )
+
+    expected = pd.DataFrame(
+        {
+            "BreakdownA": ["Group1", "Group2"],
+            "Note": ["Grand_total", "Group2"],
+            "MeasureA": [100, 200],
+            }
+        )
+
+    actual = helpers.remove_rows(
+        input_df,
+        remove_values=["Grand_total"],
+        columns=["BreakdownA"]
+        )
+
+    pd.testing.assert_frame_equal(actual.reset_index(drop=True),
+                                  expected.reset_index(drop=True))
+
+
 def test_excel_cell_to_col_num():
     """
    Tests that the excel_cell_to_col_num function works as expected
@@ -399,6 +456,62 @@ def test_add_subtotals():
     pd.testing.assert_frame_equal(actual, expected)
 
 
+def test_pivot_with_totals():
+    """Tests the pivot_with_totals function, which creates a crosstab with
+    total rows and columns in the same layout as pandas pivot_table margins.
+    """
+    input_df = pd.DataFrame(
+        {
+            "Region": ["A", "A", "B", "B", "B", "C"],
+            "Age": ["50-52", "53-54", "50-52", "50-52", "53-54", "53-54"],
+            "Col_Def": ["Invited", "Screened", "Invited", "Screened",
+                        "Invited", "Invited"],
+            "Value": [10.0, 20.0, 30.0, 40.0, 50.0, 60.0],
+            }
+        )
+
+    for rows in [["Region"], ["Region", "Age"]]:
+        for columns in ["Col_Def", None]:
+            expected = pd.pivot_table(input_df, values="Value", index=rows,
+                                      columns=columns, aggfunc="sum",
+                                      margins=True,
+                                      margins_name="Grand_total")
+
+            actual = helpers.pivot_with_totals(input_df, rows, columns)
+
+            pd.testing.assert_frame_equal(actual, expected)
+
+
+def test_add_subtotals_total_columns():
+    """Tests the add_subtotals function where totals are only required for
+    a subset of the columns.
+    """
+    input_df = pd.DataFrame(
+        {
+            "CollectionYearRange": ["2019-20", "2019-20", "2020-21", "2020-21"],
+            "Table_Code": ["A", "B", "A", "B"],
+            "Value": [10, 50, 20, 100],
+            }
+        )
+
+    expected = pd.DataFrame(
+        {
+            "CollectionYearRange": ["2019-20", "2019-20", "2020-21", "2020-21",
+                                    "2019-20", "2020-21"],
+            "Table_Code": ["A", "B", "A", "B", "Total", "Total"],
+            "Value": [10, 50, 20, 100, 60, 120]
+            })
+
+    actual = helpers.add_subtotals(
+        df=input_df,
+        columns=["CollectionYearRange", "Table_Code"],
+        total_name="Total",
+        total_columns=["Table_Code"]
+        )
+
+    pd.testing.assert_frame_equal(actual, expected)
+
+
 def test_add_subgroup_rows():
     """Tests add_subgroup_rows, which adds extra subgroup rows
     based on the subgroup input. This tests the function using age groups.
@@ -430,6 +543,66 @@ def test_add_subgroup_rows():
                                   expected.reset_index(drop=True))
 
 
+def test_add_subgroup_rows_nested():
+    """Tests add_subgroup_rows where a subgroup includes an earlier subgroup
+    from the same column, and where subgroups are applied to more than one
+    column.
+    """
+    input_df = pd.DataFrame(
+        {
+            "Table_Code": ["A", "A", "A", "B", "B", "B"],
+            "Row_Def": ["45-49", "50-52", ">=75", "45-49", "50-52", ">=75"],
+            "Total": [1, 2, 4, 10, 20, 40]
+        }
+    )
+
+    expected = pd.DataFrame(
+        {
+            "Table_Code": ["A", "A", "A", "B", "B", "B",
+                           "A", "B", "A", "B",
+                           "A and B", "A and B", "A and B",
+                           "A and B", "A and B"],
+            "Row_Def": ["45-49", "50-52", ">=75", "45-49", "50-52", ">=75",
+                        "45-52", "45-52", "45 and over", "45 and over",
+                        "45 and over", "45-49", "45-52", "50-52", ">=75"],
+            "Total": [1, 2, 4, 10, 20, 40, 3, 30, 7, 70, 77, 11, 33, 22, 44]
+        }
+    )
+
+    actual = helpers.add_subgroup_rows(
+        input_df,
+        breakdown=["Table_Code", "Row_Def"],
+        subgroup={"Row_Def": {"45-52": ["45-49", "50-52"],
+                              "45 and over": ["45-52", ">=75"]},
+                  "Table_Code": {"A and B": ["A", "B"]}},
+    )
+
+    pd.testing.assert_frame_equal(actual.reset_index(drop=True),
+                                  expected.reset_index(drop=True))
+
+
+def test_create_subgroup_lookup():
+    """Tests create_subgroup_lookup, which compiles subgroup definitions
+    into a lookup of member values to subgroup codes.
+    """
+    expected = pd.DataFrame(
+        {
+            "Row_Def": ["45-49", "50-52", "45-52", "45-49", "50-52", ">=75"],
+            "Subgroup_Code": ["45-52", "45-52", "45 and over", "45 and over",
+                              "45 and over", "45 and over"],
+            "Subgroup_Order": [0, 0, 1, 1, 1, 1]
+        }
+    )
+
+    actual = helpers.create_subgroup_lookup(
+        "Row_Def",
+        {"45-52": ["45-49", "50-52"],
+         "45 and over": ["45-52", ">=75"]}
+    )
+
+    pd.testing.assert_frame_equal(actual, expected)
+
+
 def test_add_subgroup_columns():
     """Tests add_subgroup_columns function, which combines groups of columns
     into a single summed column. This tests the function using Table Code
@@ -495,6 +668,34 @@ def test_order_by_list():
     pd.testing.assert_frame_equal(actual, expected)
 
 
+def test_order_by_list_missing():
+    """Tests the order_by_list function where the dataframe contains values
+    not in the custom list (removed), and the list contains values not in the
+    dataframe (added as empty rows).
+    """
+    input_df = pd.DataFrame(
+        {
+            "Total": [10, 20, 30, 40],
+            "Row_Def": ["50-52", "Grand_total", "53-54", "50-52"],
+            }
+        )
+
+    expected = pd.DataFrame(
+        {
+            "Row_Def": ["53-54", "45-49", "50-52", "50-52"],
+            "Total": [30, np.nan, 10, 40],
+            }
+        )
+
+    actual = helpers.order_by_list(
+        input_df,
+        column="Row_Def",
+        order=["53-54", "45-49", "50-52"],
+       )
+
+    pd.testing.assert_frame_equal(actual, expected)
+
+
 def test_fyear_to_year_start_end():
     """
    Tests that the fyear_to_year_start_end function works as expected
@@ -0,0 +1,46 @@
+import pandas as pd
+from bs_code.utilities import partitions, field_definitions
+
+
+def test_write_partitions(tmp_path):
+    """
+    Tests that write_partitions writes one partition for each year, whether
+    the data is passed in one or more chunks, and that every partition is
+    loaded with the sparse measures found across all the partitions.
+    """
+    df_first = pd.DataFrame(
+        {
+            "CollectionYearRange": ["2019-20", "2020-21", "2019-20"],
+            "Col_Def": ["Screened", "Screened", "Invited"],
+            "Value": [10, 20, 30],
+            }
+        )
+    df_first = field_definitions.mark_sparse_measures(df_first,
+                                                      ["Invited", "Screened"])
+
+    df_second = pd.DataFrame(
+        {
+            "CollectionYearRange": ["2021-22"],
+            "Col_Def": ["Referred"],
+            "Value": [5],
+            }
+        )
+    df_second = field_definitions.mark_sparse_measures(df_second,
+                                                       ["Referred", "Screened"])
+
+    data = partitions.write_partitions([df_first, df_second], "KC62",
+                                       tmp_path)
+
+    assert data.years == ("2019-20", "2020-21", "2021-22")
+    assert data.measures == ("Invited", "Screened", "Referred")
+    assert sorted(path.name for path in (tmp_path / "KC62").iterdir()) == [
+        "2019-20.pkl", "2020-21.pkl", "2021-22.pkl"]
+
+    df_year = data.load("2019-20")
+    pd.testing.assert_frame_equal(
+        df_year.astype({"Col_Def": object}),
+        df_first[df_first["CollectionYearRange"] == "2019-20"].astype(
+            {"Col_Def": object}))
+    assert field_definitions.sparse_measures(df_year) == ["Invited",
+                                                          "Screened",
+                                                          "Referred"]
@@ -0,0 +1,107 @@
+import numpy as np
+import pandas as pd
+import pytest
+import bs_code.parameters as param
+import bs_code.utilities.field_definitions as definitions
+from bs_code.utilities import polars_engine, processing, helpers
+
+pytest.importorskip("polars")
+
+
+def create_engine_data():
+    """
+    Example source data used by the engine tests, with counts of 0 not
+    stored for the sparse measures, a missing row value and LA names that
+    differ only by case.
+    """
+    previous, latest = helpers.get_year_range(param.YEAR, 2)
+
+    df = pd.DataFrame(
+        {
+            "CollectionYearRange": [previous, previous, latest, latest,
+                                    latest, latest],
+            "Part": ["1", "1", "1", "1", "1", "2"],
+            "Table_Code": ["A", "A", "A", "A", "A", "A"],
+            "Org_Code": ["X1", "X2", "X1", "X1", "X2", "X1"],
+            "Org_Name": ["Kent", "Essex", "Kent", "KENT", "Essex", "Kent"],
+            "Org_Name_Key": ["KENT", "ESSEX", "KENT", "KENT", "ESSEX",
+                             "KENT"],
+            "Row_Def": ["50-52", "<=44", "50-52", np.nan, "53-54", "50-52"],
+            "Col_Def": ["Invited", "Screened", "Invited", "Screened",
+                        "Invited", "Invited"],
+            "Value": [10, 5, 20, 8, 30, 40],
+            }
+        )
+
+    return definitions.mark_sparse_measures(df, ["Invited", "Screened"])
+
+
+def test_query_to_sql():
+    """
+    Tests that the pandas query strings used by the outputs are converted to
+    the equivalent SQL expressions.
+    """
+    condition = ("(Row_Def not in['<=44', '>=75']) & (Col_Def ==['Screened'])"
+                 " | (Part == '1')")
+
+    expected = ("(Row_Def NOT IN ('<=44', '>=75')) AND (Col_Def IN "
+                "('Screened')) OR (Part = '1')")
+
+    # Compare ignoring the spacing
+    actual = polars_engine.query_to_sql(condition)
+    assert " ".join(actual.split()) == expected
+
+
+@pytest.mark.parametrize("filter_condition",
+                         [None, "(Row_Def not in['<=44'])",
+                          "(Row_Def in['50-52']) & (Org_Code in['X1'])"])
+def test_create_output_measure_engines(filter_condition):
+    """
+    Tests that the measure outputs created by the polars engine are equal
+    to those created by the pandas engine.
+    """
+    input_df = create_engine_data()
+
+    arguments = dict(measure_column="Col_Def", measure="Uptake",
+                     rows=["Org_Code"], columns="Part", part=None,
+                     table_code=["A"], sort_on=["Org_Code"], row_order=None,
+                     column_order=["1", "2"], column_rename=None,
+                     filter_condition=filter_condition, subgroup=None,
+                     include_row_labels=True, ts_years=2)
+
+    expected = processing.create_output_measure(input_df, engine="pandas",
+                                                **arguments)
+    actual = processing.create_output_measure(input_df, engine="polars",
+                                              **arguments)
+
+    pd.testing.assert_frame_equal(actual, expected)
+
+
+@pytest.mark.parametrize("measures", [None, ["Invited"]])
+def test_create_validation_panel_engines(measures):
+    """
+    Tests that the validation panel summed by the polars engine is equal to
+    the panel summed by the pandas engine, including the series with
+    missing values, and that the converted source data is shared.
+    """
+    input_df = create_engine_data()
+
+    expected = processing.create_validation_panel(
+        input_df, measures, ["1"], None, "(Row_Def not in['<=44'])", 2,
+        engine="pandas")
+
+    with processing.shared_filters():
+        actual = processing.create_validation_panel(
+            input_df, measures, ["1"], None, "(Row_Def not in['<=44'])", 2,
+            engine="polars")
+        assert ("polars", id(input_df)) in processing.SHARED_FILTERS
+
+    pd.testing.assert_frame_equal(actual, expected)
+
+
+def test_use_polars():
+    """
+    Tests that an invalid engine raises an error.
+    """
+    with pytest.raises(ValueError):
+        processing.use_polars(create_engine_data(), "spark")
@@ -1,5 +1,7 @@
+import os
 import pandas as pd
 import numpy as np
+import pytest
 from bs_code.utilities import pre_processing
 
 
@@ -103,3 +105,127 @@ def test_update_la_regions():
 
     pd.testing.assert_frame_equal(actual.reset_index(drop=True),
                                   expected.reset_index(drop=True))
+
+
+def test_add_org_name_key():
+    """
+    Tests the add_org_name_key function, which adds an upper case copy of the
+    org names used to group LAs regardless of letter casing
+    """
+    input_df = pd.DataFrame(
+        {
+            "Org_Name": ["Hackney", "HACKNEY", "Cornwall", "Hackney"],
+            "Value": [1, 2, 3, 4]
+            }
+        )
+
+    expected = pd.DataFrame(
+        {
+            "Org_Name": ["Hackney", "HACKNEY", "Cornwall", "Hackney"],
+            "Value": [1, 2, 3, 4],
+            "Org_Name_Key": ["HACKNEY", "HACKNEY", "CORNWALL", "HACKNEY"]
+            }
+        )
+
+    actual = pre_processing.add_org_name_key(input_df)
+
+    pd.testing.assert_frame_equal(actual, expected)
+
+
+def test_add_filter_index():
+    """
+    Tests the add_filter_index function, which sorts the data on the columns
+    used to select data for outputs and sets them as a lexsorted MultiIndex,
+    keeping the columns.
+    """
+    input_df = pd.DataFrame(
+        {
+            "CollectionYearRange": ["2020-21", "2019-20", "2020-21"],
+            "Part": ["1", "1", "1"],
+            "Table_Code": ["B", "B", "A"],
+            "Org_Code": ["X1", "X1", "X2"],
+            "Value": [10, 20, 30],
+            }
+        )
+
+    actual = pre_processing.add_filter_index(input_df)
+
+    assert actual["Value"].tolist() == [20, 30, 10]
+    assert actual.index.names == ["CollectionYearRange", "Part", "Table_Code",
+                                  "Org_Code"]
+    assert actual.index.is_monotonic_increasing
+    assert list(actual.columns) == list(input_df.columns)
+
+
+def add_one(df, df_la_updates=None):
+    """Example pre-processing update used by test_import_and_update_data"""
+    return df + 1
+
+
+def fail_update(df, df_la_updates=None):
+    """Example pre-processing update used by test_import_and_update_data"""
+    raise ValueError("Update failed")
+
+
+# Example pre-processing update that can not be passed to a separate process
+unpicklable_update = lambda df, df_la_updates=None: df + 2
+
+
+def test_import_and_update_data(monkeypatch):
+    """
+    Tests that import_and_update_data applies the pre-processing updates in
+    a separate process, only falling back to this thread where the updates
+    can not be passed to the process, and raising any error from the updates.
+    """
+    input_df = pd.DataFrame({"Value": [1, 2]})
+    monkeypatch.setattr(pre_processing.load, "import_asset_data",
+                        lambda collection, year_range: input_df)
+    monkeypatch.setattr(pre_processing.load, "import_la_update_info",
+                        lambda: pd.DataFrame())
+
+    monkeypatch.setattr(pre_processing, "update_kc63_data", add_one)
+    actual = pre_processing.import_and_update_data("KC63", ["2021-22"])
+    pd.testing.assert_frame_equal(actual, input_df + 1)
+
+    monkeypatch.setattr(pre_processing, "update_kc63_data",
+                        unpicklable_update)
+    actual = pre_processing.import_and_update_data("KC63", ["2021-22"])
+    pd.testing.assert_frame_equal(actual, input_df + 2)
+
+    monkeypatch.setattr(pre_processing, "update_kc63_data", fail_update)
+    with pytest.raises(ValueError):
+        pre_processing.import_and_update_data("KC63", ["2021-22"])
+
+
+def record_update(df, df_la_updates=None):
+    """Example pre-processing update used by
+    test_import_and_partition_data, recording the process it is run in and
+    the LA updates passed to it"""
+    return df.assign(Process=os.getpid(), Updates=len(df_la_updates))
+
+
+def test_import_and_partition_data(monkeypatch, tmp_path):
+    """
+    Tests that import_and_partition_data pre-processes every year in the
+    same separate process, and only imports the LA updates once.
+    """
+    imports = []
+    monkeypatch.setattr(pre_processing.load, "import_asset_data",
+                        lambda collection, year_range: pd.DataFrame(
+                            {"CollectionYearRange": year_range,
+                             "Value": [1]}))
+    monkeypatch.setattr(pre_processing.load, "import_la_update_info",
+                        lambda: imports.append(1) or pd.DataFrame({"A": [1]}))
+    monkeypatch.setattr(pre_processing, "update_kc63_data", record_update)
+
+    data = pre_processing.import_and_partition_data(
+        "KC63", ["2020-21", "2021-22"], tmp_path)
+
+    df_years = [data.load(year) for year in data.years]
+
+    assert data.years == ("2020-21", "2021-22")
+    assert len(imports) == 1
+    assert all(df_year["Updates"].eq(1).all() for df_year in df_years)
+    assert df_years[0]["Process"].iloc[0] == df_years[1]["Process"].iloc[0]
+    assert df_years[0]["Process"].iloc[0] != os.getpid()
+
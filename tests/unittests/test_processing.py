@@ -1,6 +1,16 @@
+import logging
+import os
 import pandas as pd
 import numpy as np
-from bs_code.utilities import processing
+import pytest
+from functools import partial
+import bs_code.parameters as param
+import bs_code.utilities.field_definitions as definitions
+from bs_code.utilities import processing, partitions, helpers
+
+# Largest difference allowed between the SDR measures rolled up from the local
+# sums and those created from the individual records
+SDR_TOLERANCE = 1e-9
 
 
 def test_filter_dataframe():
@@ -41,6 +51,354 @@ def test_filter_dataframe():
                                   expected.reset_index(drop=True))
 
 
+def test_filter_dataframe_filter_index():
+    """Tests that filter_dataframe selects the same rows from a dataframe
+    sorted and indexed on the filter columns (as per
+    pre_processing.add_filter_index) as from the unsorted dataframe.
+    """
+    input_df = pd.DataFrame(
+        {
+            "CollectionYearRange": ["2020-21", "2019-20", "2020-21", "2020-21",
+                                    "2020-21", "2020-21", "2020-21"],
+            "Part": ["1", "1", "1", "2", "1", "1", "1"],
+            "Table_Code": ["U", "U", "D", "U", "D", "A", "U"],
+            "Org_Code": ["X2", "X1", "X1", "X1", "X2", "X1", "X1"],
+            "Row_Def": ["50", "51-52", "60", "50", "51-52", "60", "<45"],
+            "Total": [10, 50, 50, 100, 10, 50, 20],
+            }
+        )
+
+    index_columns = ["CollectionYearRange", "Part", "Table_Code", "Org_Code"]
+    indexed_df = input_df.set_index(
+        pd.MultiIndex.from_frame(input_df[index_columns])).sort_index()
+
+    for part, table_code in [(["1"], ["U", "D"]), (["1", "2"], None),
+                             (None, ["U"]), (["3"], ["U"])]:
+        expected = processing.filter_dataframe(input_df, part, table_code,
+                                               "(Row_Def not in['<45'])",
+                                               ts_years=1, year="2020-21")
+        actual = processing.filter_dataframe(indexed_df, part, table_code,
+                                             "(Row_Def not in['<45'])",
+                                             ts_years=1, year="2020-21")
+
+        pd.testing.assert_frame_equal(
+            actual.sort_values(index_columns).reset_index(drop=True),
+            expected.sort_values(index_columns).reset_index(drop=True))
+
+
+def test_filter_dataframe_partitioned(tmp_path):
+    """Tests that filter_dataframe selects the same rows from data that is
+    partitioned on disk by year (as per partitions.write_partitions) as from
+    the dataframe, and that filter_years yields the same data for each year.
+    """
+    input_df = pd.DataFrame(
+        {
+            "CollectionYearRange": ["2020-21", "2019-20", "2020-21", "2018-19",
+                                    "2019-20"],
+            "Part": ["1", "1", "1", "1", "2"],
+            "Table_Code": ["U", "U", "D", "U", "U"],
+            "Row_Def": ["50", "51-52", "60", "50", "<45"],
+            "Value": [10, 50, 50, 100, 20],
+            }
+        )
+    data = partitions.write_partitions([input_df], "KC62", tmp_path)
+
+    expected = processing.filter_dataframe(input_df, ["1"], ["U"],
+                                           "(Row_Def not in['60'])",
+                                           ts_years=2, year="2020-21")
+    actual = processing.filter_dataframe(data, ["1"], ["U"],
+                                         "(Row_Def not in['60'])",
+                                         ts_years=2, year="2020-21")
+
+    pd.testing.assert_frame_equal(
+        actual.sort_values("Value").reset_index(drop=True),
+        expected.sort_values("Value").reset_index(drop=True))
+
+    expected_years = processing.filter_years(input_df, ["1"], None, None,
+                                             ts_years=3, year="2020-21")
+    actual_years = processing.filter_years(data, ["1"], None, None,
+                                           ts_years=3, year="2020-21")
+
+    for (expected_year, expected), (actual_year, actual) in zip(
+            expected_years, actual_years):
+        assert actual_year == expected_year
+        pd.testing.assert_frame_equal(actual.reset_index(drop=True),
+                                      expected.reset_index(drop=True))
+
+
+def test_create_validation_panel_partitioned(tmp_path):
+    """Tests that the validation panel summed one partition at a time from
+    data that is partitioned on disk matches the panel summed from the
+    dataframe, and that the partitions are not held in the shared data.
+    """
+    previous, latest = helpers.get_year_range(param.YEAR, 2)
+
+    input_df = pd.DataFrame(
+        {
+            "CollectionYearRange": [previous, latest, latest, previous],
+            "Part": ["1", "1", "1", "1"],
+            "Table_Code": ["A", "A", "A", "A"],
+            "Org_Code": ["X1", "X1", "X1", "X2"],
+            "Row_Def": ["50", "50", "50", "50"],
+            "Col_Def": ["Invited", "Invited", "Invited", "Invited"],
+            "Value": [10, 20, 5, 40],
+            }
+        )
+    data = partitions.write_partitions([input_df], "KC62", tmp_path)
+
+    expected = processing.create_validation_panel(input_df, ["Invited"],
+                                                  ["1"], None, None, 2)
+
+    with processing.shared_filters():
+        actual = processing.create_validation_panel(data, ["Invited"],
+                                                    ["1"], None, None, 2)
+        shared = [value[1] for value in processing.SHARED_FILTERS.values()]
+
+    pd.testing.assert_frame_equal(actual, expected)
+    assert len(shared) == 1
+    assert shared[0] is actual
+
+
+def test_filter_dataframe_shared_filters():
+    """Tests that within the shared_filters context the filter_dataframe
+    function only filters the data once for each distinct filter, returning
+    the same filtered dataframe to each output that requires it.
+    """
+    input_df = pd.DataFrame(
+        {
+            "CollectionYearRange": ["2019-20", "2020-21", "2020-21"],
+            "Part": ["1", "1", "2"],
+            "Table_Code": ["U", "U", "U"],
+            "Row_Def": ["50", "51-52", "60"],
+            "Total": [10, 50, 50],
+            }
+        )
+
+    with processing.shared_filters():
+        first = processing.filter_dataframe(input_df, ["1"], ["U"], None,
+                                            ts_years=1, year="2020-21")
+        second = processing.filter_dataframe(input_df, ["1"], ["U"], None,
+                                             ts_years=1, year="2020-21")
+        other = processing.filter_dataframe(input_df, ["2"], ["U"], None,
+                                            ts_years=1, year="2020-21")
+
+    outside = processing.filter_dataframe(input_df, ["1"], ["U"], None,
+                                          ts_years=1, year="2020-21")
+
+    assert first is second
+    assert other is not first
+    assert outside is not first
+    pd.testing.assert_frame_equal(outside, first)
+
+
+class FilterPart:
+    """Example content spec used by test_shared_filters_release, which
+    filters the data to a single part"""
+    def __init__(self, part):
+        self.part = part
+
+    def filter_arguments(self):
+        return {"part": [self.part], "table_code": None,
+                "filter_condition": None, "ts_years": 1}
+
+    def __call__(self, df):
+        return processing.filter_dataframe(df, [self.part], None, None, 1)
+
+
+def test_shared_filters_release():
+    """Tests that the data shared within the shared_filters context is
+    released after the last use planned from the contents, together with
+    the data created from it, and that unplanned data is kept.
+    """
+    year = param.YEAR
+    input_df = pd.DataFrame(
+        {
+            "CollectionYearRange": [year, year, year],
+            "Part": ["1", "1", "2"],
+            "Org_Code": ["X1", "X2", "X1"],
+            "Col_Def": ["Invited", "Invited", "Invited"],
+            "Value": [10, 50, 50],
+            }
+        )
+
+    first, second = FilterPart("1"), FilterPart("1")
+
+    with processing.shared_filters([first, second, count_total,
+                                    count_total]):
+        df_first = processing.create_content(first, input_df)
+        processing.aggregate_local_level(df_first, ["Org_Code"], "Col_Def")
+        processing.filter_dataframe(input_df, ["2"], None, None, 1)
+        processing.create_content(count_total, input_df)
+
+        # The filter of part 1 and the total are still to be used again
+        assert len(processing.SHARED_FILTERS) == 4
+
+        df_second = processing.create_content(second, input_df)
+        processing.create_content(count_total, input_df)
+
+        # Only the unplanned filter of part 2 is kept
+        assert len(processing.SHARED_FILTERS) == 1
+
+    assert df_first is df_second
+    assert processing.SHARED_FILTERS is None
+
+
+def test_aggregate_local_level():
+    """Tests the aggregate_local_level function, which sums the data for each
+    local organisation with the measures as columns, sharing the sums between
+    outputs within the shared_filters context.
+    """
+    input_df = pd.DataFrame(
+        {
+            "Org_Code": ["X1", "X1", "X1", "X2", "X2"],
+            "Row_Def": ["50", "50", "51", "50", "51"],
+            "Col_Def": ["Invited", "Invited", "Screened", "Invited", None],
+            "Value": [10, 20, 5, 40, 50],
+            }
+        )
+
+    expected = pd.DataFrame(
+        {
+            "Org_Code": ["X1", "X1", "X2"],
+            "Row_Def": ["50", "51", "50"],
+            "Invited": [30.0, np.nan, 40.0],
+            "Screened": [np.nan, 5.0, np.nan],
+            }
+        ).set_index(["Org_Code", "Row_Def"]).rename_axis(columns="Col_Def")
+
+    with processing.shared_filters():
+        first = processing.aggregate_local_level(input_df,
+                                                 ["Org_Code", "Row_Def"],
+                                                 "Col_Def")
+        second = processing.aggregate_local_level(input_df,
+                                                  ["Org_Code", "Row_Def"],
+                                                  "Col_Def")
+
+    assert first is second
+    pd.testing.assert_frame_equal(first, expected)
+
+
+@pytest.mark.parametrize("org_level", ["national", "regional", "local"])
+def test_create_output_csv_tidy_sdr(tmp_path, monkeypatch, org_level):
+    """Tests that the SDR measures of the tidy csv outputs, rolled up from
+    the local level sums (see aggregate_local_level), match those created
+    from the individual records at each organisation level (the layout used
+    before the sums were rolled up), within SDR_TOLERANCE.
+    """
+    ref_file = tmp_path / "sdr.csv"
+    pd.DataFrame(
+        {
+            "Age band": ["50-52", "65-69"],
+            "Tables A and B": [3.64, 10.76],
+            "Tables C1 and C2": [1.5, 4.2],
+            "Date_start": ["01/04/2000", "01/04/2000"],
+            "Date_end": ["", ""]
+            }
+        ).to_csv(ref_file, index=False)
+    monkeypatch.setattr(definitions, "add_sdr_expected",
+                        partial(definitions.add_sdr_expected,
+                                ref_file=ref_file))
+
+    # Three organisations in two regions, each with every age band, table
+    # and measure
+    rows = pd.MultiIndex.from_product(
+        [[("R1", "North", "X1", "Leeds"), ("R1", "North", "X2", "York"),
+          ("R2", "South", "X3", "Bath")],
+         ["50-52", "65-69"], ["A", "B"], ["Screened", "Invasive_total"]],
+        names=["Org", "Row_Def", "Table_Code", "Col_Def"]).to_frame(index=False)
+    input_df = pd.DataFrame(rows["Org"].tolist(),
+                            columns=["Parent_Org_Code", "Parent_Org_Name",
+                                     "Org_Code", "Org_Name"])
+    input_df = input_df.assign(CollectionYearRange=param.YEAR, Part="1",
+                               Org_Type="BSU", Row_Def=rows["Row_Def"],
+                               Table_Code=rows["Table_Code"],
+                               Col_Def=rows["Col_Def"],
+                               Value=np.arange(len(rows)) * 37 % 101 + 3)
+
+    breakdown = ["Row_Def", "Table_Code"]
+    breakdown_subgroup = {"Row_Def": {"50<71": ["50-52", "65-69"]},
+                          "Table_Code": {"A and B": ["A", "B"]}}
+    measure_order = ["Invasive_total", "SDR_expected", "SDR"]
+
+    actual = processing.create_output_csv_tidy(
+        input_df, "KC62", org_level, breakdown, "Col_Def", ["1"], ["A", "B"],
+        None, measure_order, None, None, None, breakdown_subgroup)
+
+    # Create the same output from the individual records
+    columns = processing.define_org_columns("KC62")
+    breakdown_all = ["CollectionYearRange", columns[0], columns[2],
+                     columns[3], columns[4], *breakdown]
+    df_updates = processing.update_org_level_values(input_df.copy(),
+                                                    org_level, *columns)
+    df_updates = definitions.add_sdr_expected(df_updates, ["A", "B"])
+    expected = helpers.pivot_with_totals(df_updates, breakdown_all,
+                                         "Col_Def").reset_index()
+    expected = helpers.add_subgroup_rows(expected, breakdown_all,
+                                         breakdown_subgroup)
+    expected = definitions.add_measures(expected, measure_order)
+    expected = expected[breakdown_all + measure_order]
+
+    # Compare the outputs in the same row order
+    actual = actual.sort_values(breakdown_all).reset_index(drop=True)
+    expected = expected.sort_values(breakdown_all).reset_index(drop=True)
+    assert len(actual) == len(expected)
+    np.testing.assert_allclose(actual[measure_order].to_numpy(dtype=float),
+                               expected[measure_order].to_numpy(dtype=float),
+                               rtol=0, atol=SDR_TOLERANCE)
+
+
+def test_create_validation_panel():
+    """Tests that the create_validation_panel function sums the validated
+    counts at the finest organisation level for each year, grouping the org
+    names on the normalised key, and that the panel is shared between outputs
+    and can be rolled up to a higher organisation level.
+    """
+    previous, latest = helpers.get_year_range(param.YEAR, 2)
+
+    input_df = pd.DataFrame(
+        {
+            "CollectionYearRange": [previous, latest, latest, latest, latest],
+            "Part": ["1", "1", "1", "1", "1"],
+            "Table_Code": ["A", "A", "A", "A", "A"],
+            "Parent_Org_Name": ["North", "North", "North", "North", "South"],
+            "Org_Code": ["X1", "X1", "X1", "X1", "X2"],
+            "Org_Name": ["Leeds", "Leeds", "LEEDS", "Leeds", "Bath"],
+            "Org_Name_Key": ["LEEDS", "LEEDS", "LEEDS", "LEEDS", "BATH"],
+            "Row_Def": ["50", "50", "50", "50", "50"],
+            "Col_Def": ["Invited", "Invited", "Invited", "Cancers", "Invited"],
+            "Value": [10, 20, 5, 1, 40],
+            }
+        )
+
+    expected = pd.DataFrame(
+        {
+            "Parent_Org_Name": ["North", "North", "South"],
+            "Org_Code": ["X1", "X1", "X2"],
+            "Org_Name": ["LEEDS", "LEEDS", "BATH"],
+            "Part": ["1", "1", "1"],
+            "Table_Code": ["A", "A", "A"],
+            "Row_Def": ["50", "50", "50"],
+            "Col_Def": ["Invited", "Invited", "Invited"],
+            "CollectionYearRange": [previous, latest, latest],
+            "Value": [10, 25, 40],
+            }
+        )
+
+    with processing.shared_filters():
+        first = processing.create_validation_panel(input_df, ["Invited"],
+                                                   ["1"], None, None, 2)
+        second = processing.create_validation_panel(input_df, ["Screened"],
+                                                    ["1"], None, None, 2)
+
+    assert first is second
+    pd.testing.assert_frame_equal(first, expected)
+
+    actual = processing.rollup_validation_panel(
+        first, ["Col_Def", "CollectionYearRange"], ["Invited"])
+
+    assert actual["Value"].tolist() == [10, 65]
+
+
 def test_sort_for_output_defined():
     """
     Tests the sort for output_defined function, which sorts a dataframe
@@ -194,3 +552,218 @@ def test_transpose_for_dashboard():
 
     pd.testing.assert_frame_equal(actual.reset_index(drop=True),
                                   expected.reset_index(drop=True))
+
+
+def count_by_region(df):
+    """Example output content function used by test_create_outputs"""
+    return df.groupby("Region", as_index=False)["Value"].sum()
+
+
+def count_total(df):
+    """Example output content function used by test_create_outputs"""
+    return pd.DataFrame({"Region": ["Grand_total"], "Value": [df["Value"].sum()]})
+
+
+def test_transpose_for_dashboard_no_breakdown():
+    """
+    Tests transpose_for_dashboard where there is no breakdown, so the
+    national measures are matched to the local data on year only.
+    """
+    input_df = pd.DataFrame(
+        {
+            "CollectionYearRange": ["2019-20", "2020-21", "2020-21", "2019-20",
+                                    "2020-21", "2019-20", "2020-21"],
+            "Parent_Org_Code": ["R1", "R1", "R2", "R1", "R1", np.nan, np.nan],
+            "Org_Name": ["Gateshead", "Gateshead", "Crewe", np.nan, np.nan,
+                         np.nan, np.nan],
+            "Coverage": [60.6, 70.4, 75.2, np.nan, np.nan, np.nan, np.nan],
+            "REG_Coverage": [np.nan, np.nan, np.nan, 65.1, 76.5, np.nan,
+                             np.nan],
+            "ENG_Coverage": [np.nan, np.nan, np.nan, np.nan, np.nan, 69.4,
+                             72.8],
+        }
+    )
+
+    expected = pd.DataFrame(
+        {
+            "CollectionYearRange": ["2019-20", "2020-21", "2020-21"],
+            "Parent_Org_Code": ["R1", "R1", "R2"],
+            "Org_Name": ["Gateshead", "Gateshead", "Crewe"],
+            "Coverage": [60.6, 70.4, 75.2],
+            "REG_Coverage": [65.1, 76.5, np.nan],
+            "ENG_Coverage": [69.4, 72.8, 72.8],
+        }
+    )
+
+    actual = processing.transpose_for_dashboard(
+        input_df,
+        name="Dashboard_Coverage",
+    )
+
+    pd.testing.assert_frame_equal(actual, expected)
+
+
+def test_create_outputs():
+    """
+    Tests the create_outputs function, which creates the dataframe for each
+    output. The outputs must be returned in the order they are defined,
+    and be the same whether created in parallel, serially, or serially after
+    creating them in parallel has failed.
+    """
+    input_df = pd.DataFrame(
+        {
+            "Region": ["A", "B", "A", "C"],
+            "Value": [10, 20, 30, 40],
+            }
+        )
+
+    output_args = [{"name": "Output 1", "contents": [count_total]},
+                   {"name": "Output 2", "contents": [count_by_region,
+                                                     count_total]},
+                   {"name": "Output 3", "contents": [count_by_region]}]
+
+    expected = [count_total(input_df),
+                pd.concat([count_by_region(input_df), count_total(input_df)]),
+                count_by_region(input_df)]
+
+    serial = processing.create_outputs(input_df, output_args, processes=1)
+    parallel = processing.create_outputs(input_df, output_args, processes=2)
+
+    # Functions that can not be passed to a worker process cause the
+    # outputs to be created serially
+    output_args_fallback = output_args + [{"name": "Output 4",
+                                           "contents": [lambda df: df]}]
+    fallback = processing.create_outputs(input_df, output_args_fallback,
+                                         processes=2)
+
+    for actual in [serial, parallel, fallback[:3]]:
+        assert len(actual) == len(expected)
+        for actual_df, expected_df in zip(actual, expected):
+            pd.testing.assert_frame_equal(actual_df, expected_df)
+    pd.testing.assert_frame_equal(fallback[3], input_df)
+
+
+def count_regions(df):
+    """Example output content function used by test_create_output_not_included"""
+    return pd.DataFrame({"Region": ["Grand_total"],
+                         "Regions": [df["Region"].nunique()],
+                         "Value": [np.nan]})
+
+
+def test_create_output_not_included():
+    """
+    Tests that the create_output function keeps null values as nulls, and
+    records those created by the concatenation of the content dataframes
+    separately from the null values in the content.
+    """
+    input_df = pd.DataFrame(
+        {
+            "Region": ["A", "B", "A", "C"],
+            "Value": [10, 20, 30, 40],
+            }
+        )
+
+    output = {"name": "Output 1", "contents": [count_by_region, count_regions]}
+
+    expected = np.array([[False, False, True],
+                         [False, False, True],
+                         [False, False, True],
+                         [False, False, False]])
+
+    actual = processing.create_output(output, input_df)
+
+    assert actual["Value"].dtype == "float64"
+    assert actual.columns.tolist() == ["Region", "Value", "Regions"]
+    np.testing.assert_array_equal(actual.attrs["not_included"], expected)
+
+
+def test_iter_outputs_error():
+    """
+    Tests that the iter_outputs function yields the outputs created before an
+    error, and then raises the error from the output that failed.
+    """
+    input_df = pd.DataFrame({"Region": ["A", "B"], "Value": [10, 20]})
+
+    output_args = [{"name": "Output 1", "contents": [count_total]},
+                   {"name": "Output 2", "contents": [count_by_region]},
+                   {"name": "Output 3", "contents": [count_total]}]
+
+    created = []
+    with pytest.raises(KeyError):
+        for output, df_final in processing.iter_outputs(input_df.drop(
+                columns="Region"), output_args, processes=1, queue_size=1):
+            created.append(output["name"])
+
+    assert created == ["Output 1"]
+
+
+
+def count_in_main(df):
+    """Example output content function used by test_iter_outputs_parallel,
+    which fails where it is not run in the main process"""
+    if os.getpid() != MAIN_PID:
+        raise ValueError("Not run in the main process")
+    return count_total(df)
+
+
+MAIN_PID = os.getpid()
+
+
+def test_iter_outputs_parallel(caplog):
+    """
+    Tests that the outputs created in parallel are logged by the main
+    process, and that an error raised while creating an output in a worker
+    process is raised rather than the output being created again serially.
+    """
+    input_df = pd.DataFrame({"Region": ["A", "B"], "Value": [10, 20]})
+
+    output_args = [{"name": "Output 1", "contents": [count_total]},
+                   {"name": "Output 2", "contents": [count_in_main]}]
+
+    created = []
+    with caplog.at_level(logging.INFO), pytest.raises(ValueError):
+        with processing.output_pool(2):
+            for output, df_final in processing.iter_outputs(
+                    input_df, output_args, processes=2):
+                created.append(output["name"])
+
+    assert created == ["Output 1"]
+    assert any(record.process != MAIN_PID
+               and "Output 1" in record.getMessage()
+               for record in caplog.records)
+
+
+def count_in_worker(df):
+    """Example output content function used by test_iter_outputs_parallel_kept,
+    which fails where it is run in the main process"""
+    if os.getpid() == MAIN_PID:
+        raise ValueError("Run in the main process")
+    return count_total(df)
+
+
+def test_iter_outputs_parallel_kept():
+    """
+    Tests that the data created in a worker process that has planned uses
+    after the output (e.g. by the cross checks) is shared in the main
+    process rather than created again, and is released after its last use.
+    """
+    input_df = pd.DataFrame({"Region": ["A", "B"], "Value": [10, 20]})
+
+    output_args = [{"name": "Output 1", "contents": [count_in_worker]},
+                   {"name": "Output 2", "contents": [count_by_region]}]
+
+    with processing.shared_filters([count_in_worker, count_by_region,
+                                    count_in_worker]):
+        with processing.output_pool(2):
+            outputs = processing.create_outputs(input_df, output_args,
+                                                processes=2)
+
+        # Only the data with a use remaining is shared
+        assert len(processing.SHARED_FILTERS) == 1
+
+        actual = processing.create_content(count_in_worker, input_df)
+
+        assert len(processing.SHARED_FILTERS) == 0
+
+    pd.testing.assert_frame_equal(actual, outputs[0])
+
@@ -0,0 +1,99 @@
+import pickle
+import dataclasses
+import pandas as pd
+import pytest
+import bs_code.parameters as param
+from bs_code.utilities import specs, processing
+
+
+def create_spec(name, part):
+    """Example content spec used by the spec tests"""
+    return specs.CrosstabSpec(
+        name=name,
+        rows=["Region"],
+        columns="Col_Def",
+        part=part,
+        table_code=None,
+        sort_on=None,
+        row_order=None,
+        column_order=None,
+        column_rename={"Region": "Org"},
+        filter_condition=None,
+        visible_condition=None,
+        row_subgroup={"Region": {"AB": ["A", "B"]}},
+        column_subgroup=None,
+        include_row_labels=True,
+        measure_as_rows=False,
+        ts_years=1)
+
+
+def test_content_spec():
+    """
+    Tests that content specs are frozen and hashable, compare equal when they
+    describe the same computation (regardless of name), and restore the
+    arguments as lists and dictionaries.
+    """
+    spec = create_spec("first", ["1"])
+    same = create_spec("second", ["1"])
+    other = create_spec("first", ["2"])
+
+    assert spec == same
+    assert hash(spec) == hash(same)
+    assert spec != other
+    assert len({spec, same, other}) == 2
+    assert pickle.loads(pickle.dumps(spec)) == spec
+    assert not hasattr(spec, "__dict__")
+
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        spec.part = ["2"]
+
+    arguments = spec.arguments()
+    assert arguments["part"] == ["1"]
+    assert arguments["row_subgroup"] == {"Region": {"AB": ["A", "B"]}}
+    assert "name" not in arguments
+
+
+def test_output_spec():
+    """
+    Tests that output specs can be read by key in the same way as the output
+    dictionaries.
+    """
+    content = create_spec("first", ["1"])
+    output = specs.OutputSpec(name="Table 1",
+                              write_type="excel_static",
+                              write_cell="B9",
+                              empty_cols=["D", "G"],
+                              contents=[content])
+
+    assert output["name"] == "Table 1"
+    assert output["empty_cols"] == ["D", "G"]
+    assert output["contents"] == [content]
+    assert output["write_cell"] == "B9"
+
+    with pytest.raises(KeyError):
+        output["columns"]
+
+
+def test_create_content_shared():
+    """
+    Tests that within the shared_filters context, equal content specs share
+    the dataframe they create.
+    """
+    input_df = pd.DataFrame(
+        {
+            "CollectionYearRange": [param.YEAR, param.YEAR],
+            "Part": ["1", "1"],
+            "Table_Code": ["A", "A"],
+            "Region": ["A", "C"],
+            "Col_Def": ["Screened", "Screened"],
+            "Value": [10, 20],
+            }
+        )
+
+    with processing.shared_filters():
+        first = processing.create_content(create_spec("first", ["1"]),
+                                          input_df)
+        second = processing.create_content(create_spec("second", ["1"]),
+                                           input_df)
+
+    assert first is second